@@ -0,0 +1,96 @@
+"""
+Agent Result - Fusion v14
+Structured agent result with on-demand markdown rendering
+"""
+
+import copy
+from functools import partial
+from typing import Dict, Any, Callable, Optional, Union
+
+
+class AgentResult(dict):
+    """
+    Structured agent result - Fusion v14
+    Agents return their structured fields; the markdown report is only rendered
+    when a consumer reads ``output`` (or the legacy ``enhanced_output`` alias) or
+    calls render(). Iterating or JSON-encoding the result never renders it.
+    """
+
+    RENDERED_KEYS = ("output", "enhanced_output")
+    RENDER_KEY = "_render"
+
+    def __init__(self, *args, renderer: Optional[Callable[[], str]] = None, **fields):
+        super().__init__(*args, **fields)
+        self._renderer = renderer
+        self._rendered: Optional[str] = None
+
+    def __deepcopy__(self, memo) -> "AgentResult":
+        """Copy the fields; the renderer (an agent method) is shared, not copied"""
+        copied = type(self)(copy.deepcopy(dict(self), memo), renderer=self._renderer)
+        copied._rendered = self._rendered
+        return copied
+
+    def render(self) -> str:
+        """Render (once) and return the markdown report"""
+        if self._rendered is None:
+            self._rendered = self._renderer() if self._renderer else ""
+        return self._rendered
+
+    def __missing__(self, key):
+        if key in self.RENDERED_KEYS and self._renderer:
+            return self.render()
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return super().__contains__(key) or (key in self.RENDERED_KEYS and self._renderer is not None)
+
+    def get(self, key, default=None):
+        if super().__contains__(key):
+            return super().__getitem__(key)
+        if key in self.RENDERED_KEYS and self._renderer:
+            return self.render()
+        return default
+
+    def to_dict(self, render: bool = False) -> Dict[str, Any]:
+        """Plain dict of the structured fields, optionally with the rendered markdown"""
+        data = dict(self)
+        if render and self._renderer:
+            data["output"] = self.render()
+        return data
+
+    def to_record(self) -> Dict[str, Any]:
+        """
+        JSON-ready form that keeps the report unrendered: the structured fields
+        plus the agent method and arguments that render it. Reports that are
+        already rendered, or whose renderer is not an agent method, are stored
+        as "output".
+        """
+        data = dict(self)
+        renderer = self._renderer
+        if self._rendered is None and isinstance(renderer, partial) and hasattr(renderer.func, "__self__"):
+            data[self.RENDER_KEY] = {
+                "method": renderer.func.__name__,
+                "args": list(renderer.args),
+                "kwargs": dict(renderer.keywords)
+            }
+        elif renderer:
+            data["output"] = self.render()
+        return data
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any], agent: Any = None) -> Dict[str, Any]:
+        """Rebuild a result stored by to_record, rebinding its renderer to agent"""
+        if cls.RENDER_KEY not in record:
+            return record
+        data = dict(record)
+        spec = data.pop(cls.RENDER_KEY)
+        method = getattr(agent, spec["method"], None)
+        renderer = partial(method, *spec["args"], **spec["kwargs"]) if callable(method) else None
+        return cls(data, renderer=renderer)
+
+    @classmethod
+    def render_record(cls, record: Union[str, Dict[str, Any]], agent: Any = None) -> str:
+        """The report of a stored response: plain text as is, a to_record() dict rendered now"""
+        if isinstance(record, str):
+            return record
+        return cls.from_record(record, agent).get("output") or ""
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class AIInteractionDesignerAgent:
     """
@@ -28,7 +31,34 @@ class AIInteractionDesignerAgent:
         
         try:
             # AI Interaction Designer Agent Implementation
-            enhanced_output = f"""# AI Interaction Designer Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.92
+            
+            self.logger.info("AI Interaction Designer Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "interaction_type": "conversational_design",
+                    "focus": "ai_human_interaction",
+                    "principles": ["transparency", "control", "trust"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("AI Interaction Designer Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# AI Interaction Designer Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class AIInteractionDesignerAgent:
 **Score:** 0.92/1.00
 
 *Generated by Fusion v14 AI Interaction Designer Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.92
-            
-            self.logger.info(f"AI Interaction Designer Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "interaction_type": "conversational_design",
-                    "focus": "ai_human_interaction",
-                    "principles": ["transparency", "control", "trust"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"AI Interaction Designer Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class ComponentLibrarianAgent:
     """
@@ -28,7 +31,34 @@ class ComponentLibrarianAgent:
         
         try:
             # Component Librarian Agent Implementation
-            enhanced_output = f"""# Component Librarian Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.90
+            
+            self.logger.info("Component Librarian Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "component_type": "design_system_management",
+                    "focus": "component_library_maintenance",
+                    "platforms": ["tailwind", "react", "figma"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Component Librarian Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Component Librarian Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class ComponentLibrarianAgent:
 **Score:** 0.90/1.00
 
 *Generated by Fusion v14 Component Librarian Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.90
-            
-            self.logger.info(f"Component Librarian Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "component_type": "design_system_management",
-                    "focus": "component_library_maintenance",
-                    "platforms": ["tailwind", "react", "figma"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Component Librarian Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
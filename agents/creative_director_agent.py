@@ -8,6 +8,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class CreativeDirectorAgent:
     """
@@ -62,17 +65,15 @@ class CreativeDirectorAgent:
             # Apply cinematic storytelling principles
             cinematic_elements = await self._apply_cinematic_principles(prompt, creative_strategy)
             
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, creative_strategy, cinematic_elements)
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._create_enhanced_output, prompt, creative_strategy, cinematic_elements)
             
             execution_time = time.time() - start_time
             confidence = self._calculate_confidence(creative_analysis, audience_insights, cinematic_elements)
             
-            self.logger.info(f"Creative Director Agent completed in {execution_time:.2f}s")
+            self.logger.info("Creative Director Agent completed in %.2fs", execution_time)
             
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
+            return AgentResult({
                 "confidence": confidence,
                 "creative_analysis": creative_analysis,
                 "audience_insights": audience_insights,
@@ -86,11 +87,11 @@ class CreativeDirectorAgent:
                     "cinematic_style": cinematic_elements.get("style"),
                     "analysis_timestamp": datetime.now().timestamp()
                 }
-            }
+            }, renderer=renderer)
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"Creative Director Agent failed: {e}")
+            self.logger.error("Creative Director Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
@@ -184,7 +185,7 @@ class CreativeDirectorAgent:
             "cinematic_opportunities": cinematic_opportunities
         }
     
-    async def _create_enhanced_output(self, prompt: str, creative_strategy: Dict, cinematic_elements: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, creative_strategy: Dict, cinematic_elements: Dict) -> str:
         """Create enhanced creative output"""
         
         # Build creative framework
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class DeckNarratorAgent:
     """
@@ -28,7 +31,34 @@ class DeckNarratorAgent:
         
         try:
             # Deck Narrator Agent Implementation
-            enhanced_output = f"""# Deck Narrator Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.91
+            
+            self.logger.info("Deck Narrator Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "narrative_type": "presentation_narrative",
+                    "focus": "stakeholder_communication",
+                    "principles": ["clarity", "impact", "engagement"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Deck Narrator Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Deck Narrator Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class DeckNarratorAgent:
 **Score:** 0.91/1.00
 
 *Generated by Fusion v14 Deck Narrator Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.91
-            
-            self.logger.info(f"Deck Narrator Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "narrative_type": "presentation_narrative",
-                    "focus": "stakeholder_communication",
-                    "principles": ["clarity", "impact", "engagement"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Deck Narrator Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
@@ -10,6 +10,9 @@ import logging
 import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class DesignTechnologistAgent:
     """
@@ -95,17 +98,15 @@ class DesignTechnologistAgent:
             # Apply accessibility patterns
             accessibility_implementation = await self._apply_accessibility_patterns(prompt, react_structure)
             
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, design_analysis, token_extraction, tailwind_mapping, react_structure, accessibility_implementation)
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._create_enhanced_output, prompt, design_analysis, token_extraction, tailwind_mapping, react_structure, accessibility_implementation)
             
             execution_time = time.time() - start_time
             confidence = self._calculate_confidence(design_analysis, token_extraction, tailwind_mapping)
             
-            self.logger.info(f"Design Technologist Agent completed in {execution_time:.2f}s")
+            self.logger.info("Design Technologist Agent completed in %.2fs", execution_time)
             
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
+            return AgentResult({
                 "confidence": confidence,
                 "design_analysis": design_analysis,
                 "token_extraction": token_extraction,
@@ -121,11 +122,11 @@ class DesignTechnologistAgent:
                     "accessibility_score": accessibility_implementation.get("score"),
                     "analysis_timestamp": datetime.now().timestamp()
                 }
-            }
+            }, renderer=renderer)
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"Design Technologist Agent failed: {e}")
+            self.logger.error("Design Technologist Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
@@ -256,7 +257,7 @@ class DesignTechnologistAgent:
             "score": self._calculate_accessibility_score(accessibility_requirements, semantic_html, aria_attributes)
         }
     
-    async def _create_enhanced_output(self, prompt: str, design_analysis: Dict, token_extraction: Dict, tailwind_mapping: Dict, react_structure: Dict, accessibility_implementation: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, design_analysis: Dict, token_extraction: Dict, tailwind_mapping: Dict, react_structure: Dict, accessibility_implementation: Dict) -> str:
         """Create enhanced output with technical specifications"""
         
         return f"""# Design Technologist Analysis & Implementation
@@ -11,6 +11,10 @@ import json
 import os
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
+from fusion_core.memory.state_snapshot import load_json
 
 class DispatcherAgent:
     """
@@ -21,6 +25,8 @@ class DispatcherAgent:
     def __init__(self):
         self.logger = logging.getLogger("DispatcherAgent")
         self.scorecard_file = "memory/agent_scorecard.json"
+        # Routing depends on the scorecard, so it keys pipeline memoization
+        self.state_files = (self.scorecard_file,)
         
         # Initialize scorecard if it doesn't exist
         self._ensure_scorecard_file()
@@ -103,10 +109,9 @@ class DispatcherAgent:
     async def _read_scorecard(self) -> Dict[str, Any]:
         """Read agent scorecard from JSON file"""
         try:
-            with open(self.scorecard_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.scorecard_file)
         except Exception as e:
-            self.logger.error(f"Error reading scorecard: {e}")
+            self.logger.error("Error reading scorecard: %s", e)
             return {"agents": {}, "metadata": {}}
     
     async def _analyze_prompt_type(self, prompt: str) -> Tuple[str, float, List[str]]:
@@ -199,8 +204,42 @@ class DispatcherAgent:
             all_agents = primary_agents + fallback_agents
             agent_scores = await self._get_agent_scores(all_agents)
             
-            # Create enhanced output
-            enhanced_output = f"""# Dispatcher Agent Response
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._render_output, prompt, prompt_type, confidence, suggested_agents,
+                               primary_agents, fallback_agents, fallback_needed, agent_scores)
+            
+            execution_time = time.time() - start_time
+            
+            self.logger.info("Dispatcher Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "prompt_type": prompt_type,
+                    "primary_agents": primary_agents,
+                    "fallback_agents": fallback_agents,
+                    "fallback_needed": fallback_needed,
+                    "agent_scores": agent_scores,
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=renderer)
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Dispatcher Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str, prompt_type: str, confidence: float,
+                       suggested_agents: List[str], primary_agents: List[str],
+                       fallback_agents: List[str], fallback_needed: bool,
+                       agent_scores: Dict[str, float]) -> str:
+        """Render the markdown routing report"""
+        return f"""# Dispatcher Agent Response
 
 ## Original Request
 {prompt}
@@ -231,31 +270,3 @@ class DispatcherAgent:
 **Score:** {confidence:.2f}/1.00
 
 *Generated by Fusion v14 Dispatcher Agent*"""
-            
-            execution_time = time.time() - start_time
-            
-            self.logger.info(f"Dispatcher Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "prompt_type": prompt_type,
-                    "primary_agents": primary_agents,
-                    "fallback_agents": fallback_agents,
-                    "fallback_needed": fallback_needed,
-                    "agent_scores": agent_scores,
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Dispatcher Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
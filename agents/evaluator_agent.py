@@ -8,6 +8,9 @@ import time
 from typing import Dict, Any, List, Optional
 import logging
 import json
+from functools import partial
+
+from agents.agent_result import AgentResult
 from memory.agent_memory import agent_memory
 
 class EvaluatorAgent:
@@ -49,18 +52,28 @@ class EvaluatorAgent:
             # Step 3: Calculate overall score
             overall_score = self._calculate_overall_score(evaluation_results)
             
-            # Step 4: Generate evaluation report
-            evaluation_report = await self._generate_evaluation_report(
-                input_prompt, evaluation_results, overall_score
-            )
+            # Step 4: Defer the evaluation report until the output is read
+            renderer = partial(self._generate_evaluation_report,
+                               input_prompt, evaluation_results, overall_score)
             
             execution_time = time.time() - start_time
             
-            # Store in memory
+            result = AgentResult({
+                "confidence": overall_score,
+                "evaluation_results": evaluation_results,
+                "overall_score": overall_score,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "evaluation_timestamp": time.time(),
+                    "evaluation_criteria": self.evaluation_criteria
+                }
+            }, renderer=renderer)
+            
+            # Store in memory unrendered (see AgentResult.render_record)
             await agent_memory.store_agent_run(
                 agent_name="evaluator",
                 prompt=input_prompt,
-                response=evaluation_report,
+                response=result.to_record(),
                 confidence=overall_score,
                 fallback_flag=False,
                 additional_data={
@@ -69,25 +82,12 @@ class EvaluatorAgent:
                 }
             )
             
-            result = {
-                "output": evaluation_report,
-                "enhanced_output": evaluation_report,
-                "confidence": overall_score,
-                "evaluation_results": evaluation_results,
-                "overall_score": overall_score,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "evaluation_timestamp": time.time(),
-                    "evaluation_criteria": self.evaluation_criteria
-                }
-            }
-            
-            self.logger.info(f"Evaluator Agent completed in {execution_time:.2f}s with score {overall_score:.2f}")
+            self.logger.info("Evaluator Agent completed in %.2fs with score %.2f", execution_time, overall_score)
             return result
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"Evaluator Agent failed: {e}")
+            self.logger.error("Evaluator Agent failed: %s", e)
             
             return {
                 "error": str(e),
@@ -274,51 +274,49 @@ class EvaluatorAgent:
         else:
             return 0.0
             
-    async def _generate_evaluation_report(self, input_prompt: str, 
-                                       evaluation_results: Dict[str, Any],
-                                       overall_score: float) -> str:
+    def _generate_evaluation_report(self, input_prompt: str, 
+                                    evaluation_results: Dict[str, Any],
+                                    overall_score: float) -> str:
         """Generate comprehensive evaluation report"""
         
-        report = f"# Fusion v14 Evaluation Report\n\n"
-        report += f"## Input Analysis\n"
-        report += f"**Input:** {input_prompt[:100]}{'...' if len(input_prompt) > 100 else ''}\n\n"
-        
-        report += f"## Overall Score: {overall_score:.2f}/1.00\n\n"
-        
-        report += f"## Detailed Evaluation\n\n"
+        parts = ["# Fusion v14 Evaluation Report\n\n",
+                 "## Input Analysis\n",
+                 f"**Input:** {input_prompt[:100]}{'...' if len(input_prompt) > 100 else ''}\n\n",
+                 f"## Overall Score: {overall_score:.2f}/1.00\n\n",
+                 "## Detailed Evaluation\n\n"]
         
         for criterion, result in evaluation_results.items():
-            report += f"### {criterion.title()}\n"
-            report += f"**Score:** {result['score']:.2f}/1.00\n"
-            report += f"**Weight:** {result['weight']:.2f}\n"
-            report += f"**Description:** {result['description']}\n"
-            report += f"**Reasoning:** {result['reasoning']}\n\n"
+            parts.append(f"### {criterion.title()}\n"
+                         f"**Score:** {result['score']:.2f}/1.00\n"
+                         f"**Weight:** {result['weight']:.2f}\n"
+                         f"**Description:** {result['description']}\n"
+                         f"**Reasoning:** {result['reasoning']}\n\n")
             
-        report += f"## Recommendations\n\n"
+        parts.append("## Recommendations\n\n")
         
         # Generate recommendations based on low scores
         low_scores = [(criterion, result) for criterion, result in evaluation_results.items() 
                      if result['score'] < 0.7]
         
         if low_scores:
-            report += f"**Areas for Improvement:**\n"
+            parts.append("**Areas for Improvement:**\n")
             for criterion, result in low_scores:
-                report += f"- **{criterion.title()}:** {self._get_improvement_suggestion(criterion)}\n"
+                parts.append(f"- **{criterion.title()}:** {self._get_improvement_suggestion(criterion)}\n")
         else:
-            report += f"✅ All criteria meet quality standards\n"
+            parts.append("✅ All criteria meet quality standards\n")
             
-        report += f"\n## Quality Assessment\n\n"
+        parts.append("\n## Quality Assessment\n\n")
         
         if overall_score >= 0.9:
-            report += f"🟢 **Excellent Quality** - Ready for production use\n"
+            parts.append("🟢 **Excellent Quality** - Ready for production use\n")
         elif overall_score >= 0.8:
-            report += f"🟡 **Good Quality** - Minor improvements recommended\n"
+            parts.append("🟡 **Good Quality** - Minor improvements recommended\n")
         elif overall_score >= 0.7:
-            report += f"🟠 **Acceptable Quality** - Some improvements needed\n"
+            parts.append("🟠 **Acceptable Quality** - Some improvements needed\n")
         else:
-            report += f"🔴 **Needs Improvement** - Significant enhancements required\n"
+            parts.append("🔴 **Needs Improvement** - Significant enhancements required\n")
             
-        return report
+        return "".join(parts)
         
     def _generate_reasoning(self, criterion: str, score: float, context: Dict[str, Any]) -> str:
         """Generate reasoning for a criterion score"""
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class MarketAnalystAgent:
     """
@@ -28,7 +31,34 @@ class MarketAnalystAgent:
         
         try:
             # Market Analyst Agent Implementation
-            enhanced_output = f"""# Market Analyst Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.89
+            
+            self.logger.info("Market Analyst Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "analysis_type": "market_research",
+                    "focus": "competitive_landscape",
+                    "principles": ["data_driven", "comprehensive", "actionable"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Market Analyst Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Market Analyst Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class MarketAnalystAgent:
 **Score:** 0.89/1.00
 
 *Generated by Fusion v14 Market Analyst Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.89
-            
-            self.logger.info(f"Market Analyst Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "analysis_type": "market_research",
-                    "focus": "competitive_landscape",
-                    "principles": ["data_driven", "comprehensive", "actionable"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Market Analyst Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from collections import defaultdict
 
+from fusion_core.telemetry.agent_telemetry import session_base, read_session_events
+
 class PatternRefinerAgent:
     def __init__(self, telemetry_log_path: str = "fusion_telemetry", 
                  config_path: str = "fallback_trigger_config.json"):
@@ -34,7 +36,8 @@ class PatternRefinerAgent:
         }
         
         # Load telemetry files
-        telemetry_files = glob.glob(f"{self.telemetry_path}/*.json")
+        telemetry_files = [path for path in glob.glob(f"{self.telemetry_path}/*")
+                           if session_base(os.path.basename(path))]
         
         if not telemetry_files:
             print("⚠️ No telemetry files found for analysis")
@@ -54,11 +57,8 @@ class PatternRefinerAgent:
         
         for file_path in telemetry_files:
             try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                # Filter events within analysis window
-                for event in data.get("events", []):
+                # Filter events within analysis window (sessions are streamed)
+                for event in read_session_events(file_path):
                     event_time = datetime.fromisoformat(event.get("timestamp", ""))
                     if event_time >= cutoff_date:
                         all_events.append(event)
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class PortfolioEditorAgent:
     """
@@ -28,7 +31,34 @@ class PortfolioEditorAgent:
         
         try:
             # Portfolio Editor Agent Implementation
-            enhanced_output = f"""# Portfolio Editor Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.88
+            
+            self.logger.info("Portfolio Editor Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "curation_type": "portfolio_curation",
+                    "focus": "design_work_presentation",
+                    "principles": ["quality", "coherence", "impact"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Portfolio Editor Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Portfolio Editor Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class PortfolioEditorAgent:
 **Score:** 0.88/1.00
 
 *Generated by Fusion v14 Portfolio Editor Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.88
-            
-            self.logger.info(f"Portfolio Editor Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "curation_type": "portfolio_curation",
-                    "focus": "design_work_presentation",
-                    "principles": ["quality", "coherence", "impact"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Portfolio Editor Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
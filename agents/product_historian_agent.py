@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class ProductHistorianAgent:
     """
@@ -28,7 +31,34 @@ class ProductHistorianAgent:
         
         try:
             # Product Historian Agent Implementation
-            enhanced_output = f"""# Product Historian Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.84
+            
+            self.logger.info("Product Historian Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "historical_type": "product_evolution_tracking",
+                    "focus": "historical_context",
+                    "principles": ["learning", "context", "evolution"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Product Historian Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Product Historian Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class ProductHistorianAgent:
 **Score:** 0.84/1.00
 
 *Generated by Fusion v14 Product Historian Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.84
-            
-            self.logger.info(f"Product Historian Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "historical_type": "product_evolution_tracking",
-                    "focus": "historical_context",
-                    "principles": ["learning", "context", "evolution"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Product Historian Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class ProductNavigatorAgent:
     """
@@ -96,17 +99,15 @@ class ProductNavigatorAgent:
             # Generate decision recommendations
             decision_recommendations = await self._generate_decision_recommendations(prompt, feature_analysis, viability_assessment, complexity_scoring)
             
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, feature_analysis, viability_assessment, edge_case_analysis, complexity_scoring, decision_recommendations)
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._create_enhanced_output, prompt, feature_analysis, viability_assessment, edge_case_analysis, complexity_scoring, decision_recommendations)
             
             execution_time = time.time() - start_time
             confidence = self._calculate_confidence(feature_analysis, viability_assessment, complexity_scoring)
             
-            self.logger.info(f"Product Navigator Agent completed in {execution_time:.2f}s")
+            self.logger.info("Product Navigator Agent completed in %.2fs", execution_time)
             
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
+            return AgentResult({
                 "confidence": confidence,
                 "feature_analysis": feature_analysis,
                 "viability_assessment": viability_assessment,
@@ -122,11 +123,11 @@ class ProductNavigatorAgent:
                     "recommendation": decision_recommendations.get("primary_recommendation"),
                     "analysis_timestamp": datetime.now().timestamp()
                 }
-            }
+            }, renderer=renderer)
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"Product Navigator Agent failed: {e}")
+            self.logger.error("Product Navigator Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
@@ -255,7 +256,7 @@ class ProductNavigatorAgent:
             "success_metrics": self._define_success_metrics(feature_analysis, primary_recommendation)
         }
     
-    async def _create_enhanced_output(self, prompt: str, feature_analysis: Dict, viability_assessment: Dict, edge_case_analysis: Dict, complexity_scoring: Dict, decision_recommendations: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, feature_analysis: Dict, viability_assessment: Dict, edge_case_analysis: Dict, complexity_scoring: Dict, decision_recommendations: Dict) -> str:
         """Create enhanced output with comprehensive analysis"""
         
         return f"""# Product Navigator Analysis & Recommendations
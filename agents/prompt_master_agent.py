@@ -11,6 +11,10 @@ import json
 import os
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
+from fusion_core.memory.state_snapshot import load_json
 
 class PromptMasterAgent:
     """
@@ -22,6 +26,8 @@ class PromptMasterAgent:
         self.logger = logging.getLogger("PromptMasterAgent")
         self.memory_file = "memory/agent_memory.json"
         self.pattern_file = "memory/pattern_registry.json"
+        # Insights and patterns shape the output, so they key pipeline memoization
+        self.state_files = (self.memory_file, self.pattern_file)
         
         # Initialize memory and pattern files if they don't exist
         self._ensure_memory_files()
@@ -64,10 +70,9 @@ class PromptMasterAgent:
     async def _read_memory(self) -> Dict[str, Any]:
         """Read agent memory from JSON file"""
         try:
-            with open(self.memory_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.memory_file)
         except Exception as e:
-            self.logger.error(f"Error reading memory: {e}")
+            self.logger.error("Error reading memory: %s", e)
             return {"prompt_master": []}
     
     async def _write_memory(self, memory_data: Dict[str, Any]):
@@ -76,15 +81,14 @@ class PromptMasterAgent:
             with open(self.memory_file, 'w') as f:
                 json.dump(memory_data, f, indent=2)
         except Exception as e:
-            self.logger.error(f"Error writing memory: {e}")
+            self.logger.error("Error writing memory: %s", e)
     
     async def _read_patterns(self) -> Dict[str, Any]:
         """Read pattern registry from JSON file"""
         try:
-            with open(self.pattern_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.pattern_file)
         except Exception as e:
-            self.logger.error(f"Error reading patterns: {e}")
+            self.logger.error("Error reading patterns: %s", e)
             return {"patterns": {}}
     
     async def _analyze_prompt_pattern(self, prompt: str) -> Tuple[str, float, List[str]]:
@@ -192,8 +196,62 @@ class PromptMasterAgent:
             fallback_needed = confidence < 0.7
             fallback_agents = suggested_agents if fallback_needed else []
             
-            # Create enhanced output
-            enhanced_output = f"""# Prompt Master Agent Response
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._render_output, prompt, pattern, confidence, suggested_agents,
+                               insights, rewritten_prompt, fallback_needed, fallback_agents)
+            
+            execution_time = time.time() - start_time
+            
+            result = AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "pattern_type": pattern,
+                    "suggested_agents": suggested_agents,
+                    "fallback_needed": fallback_needed,
+                    "rewritten_prompt": rewritten_prompt,
+                    "memory_insights": insights,
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=renderer)
+            
+            # Store in memory unrendered (see AgentResult.render_record)
+            memory_data = await self._read_memory()
+            memory_entry = {
+                "agent_name": "prompt_master",
+                "prompt": prompt,
+                "response": result.to_record(),
+                "confidence": confidence,
+                "fallback_flag": fallback_needed,
+                "pattern": pattern,
+                "suggested_agents": suggested_agents,
+                "timestamp": datetime.now().isoformat()
+            }
+            
+            memory_data["prompt_master"] = memory_data.get("prompt_master", []) + [memory_entry]
+            # Keep only last 20 entries
+            memory_data["prompt_master"] = memory_data["prompt_master"][-20:]
+            await self._write_memory(memory_data)
+            
+            self.logger.info("Prompt Master Agent completed in %.2fs", execution_time)
+            
+            return result
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Prompt Master Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str, pattern: str, confidence: float,
+                       suggested_agents: List[str], insights: Dict[str, Any],
+                       rewritten_prompt: str, fallback_needed: bool,
+                       fallback_agents: List[str]) -> str:
+        """Render the markdown pattern report"""
+        return f"""# Prompt Master Agent Response
 
 ## Original Request
 {prompt}
@@ -224,49 +282,3 @@ class PromptMasterAgent:
 **Score:** {confidence:.2f}/1.00
 
 *Generated by Fusion v14 Prompt Master Agent*"""
-            
-            execution_time = time.time() - start_time
-            
-            # Store in memory
-            memory_data = await self._read_memory()
-            memory_entry = {
-                "agent_name": "prompt_master",
-                "prompt": prompt,
-                "response": enhanced_output,
-                "confidence": confidence,
-                "fallback_flag": fallback_needed,
-                "pattern": pattern,
-                "suggested_agents": suggested_agents,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            memory_data["prompt_master"] = memory_data.get("prompt_master", []) + [memory_entry]
-            # Keep only last 20 entries
-            memory_data["prompt_master"] = memory_data["prompt_master"][-20:]
-            await self._write_memory(memory_data)
-            
-            self.logger.info(f"Prompt Master Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "pattern_type": pattern,
-                    "suggested_agents": suggested_agents,
-                    "fallback_needed": fallback_needed,
-                    "rewritten_prompt": rewritten_prompt,
-                    "memory_insights": insights,
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Prompt Master Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            }
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class ResearchSummarizerAgent:
     """
@@ -28,7 +31,34 @@ class ResearchSummarizerAgent:
         
         try:
             # Research Summarizer Agent Implementation
-            enhanced_output = f"""# Research Summarizer Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.89
+            
+            self.logger.info("Research Summarizer Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "summary_type": "research_synthesis",
+                    "focus": "actionable_insights",
+                    "principles": ["clarity", "accuracy", "actionability"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Research Summarizer Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Research Summarizer Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class ResearchSummarizerAgent:
 **Score:** 0.89/1.00
 
 *Generated by Fusion v14 Research Summarizer Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.89
-            
-            self.logger.info(f"Research Summarizer Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "summary_type": "research_synthesis",
-                    "focus": "actionable_insights",
-                    "principles": ["clarity", "accuracy", "actionability"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Research Summarizer Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class StrategyArchivistAgent:
     """
@@ -28,7 +31,34 @@ class StrategyArchivistAgent:
         
         try:
             # Strategy Archivist Agent Implementation
-            enhanced_output = f"""# Strategy Archivist Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.87
+            
+            self.logger.info("Strategy Archivist Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "archival_type": "knowledge_management",
+                    "focus": "strategic_documentation",
+                    "principles": ["organization", "accessibility", "preservation"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Strategy Archivist Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Strategy Archivist Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class StrategyArchivistAgent:
 **Score:** 0.87/1.00
 
 *Generated by Fusion v14 Strategy Archivist Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.87
-            
-            self.logger.info(f"Strategy Archivist Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "archival_type": "knowledge_management",
-                    "focus": "strategic_documentation",
-                    "principles": ["organization", "accessibility", "preservation"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Strategy Archivist Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
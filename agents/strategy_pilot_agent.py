@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class StrategyPilotAgent:
     """
@@ -87,17 +90,15 @@ class StrategyPilotAgent:
             # Simulate competitive strategy
             competitive_strategy = await self._simulate_competitive_strategy(prompt, strategic_context, opportunity_analysis)
             
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, strategic_context, opportunity_analysis, strategic_roadmap, competitive_strategy)
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._create_enhanced_output, prompt, strategic_context, opportunity_analysis, strategic_roadmap, competitive_strategy)
             
             execution_time = time.time() - start_time
             confidence = self._calculate_confidence(strategic_context, opportunity_analysis, strategic_roadmap)
             
-            self.logger.info(f"Strategy Pilot Agent completed in {execution_time:.2f}s")
+            self.logger.info("Strategy Pilot Agent completed in %.2fs", execution_time)
             
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
+            return AgentResult({
                 "confidence": confidence,
                 "strategic_context": strategic_context,
                 "opportunity_analysis": opportunity_analysis,
@@ -112,11 +113,11 @@ class StrategyPilotAgent:
                     "competitive_position": competitive_strategy.get("positioning"),
                     "analysis_timestamp": datetime.now().timestamp()
                 }
-            }
+            }, renderer=renderer)
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"Strategy Pilot Agent failed: {e}")
+            self.logger.error("Strategy Pilot Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
@@ -222,7 +223,7 @@ class StrategyPilotAgent:
             "differentiation_factors": self._identify_differentiation_factors(strategic_context, opportunity_analysis)
         }
     
-    async def _create_enhanced_output(self, prompt: str, strategic_context: Dict, opportunity_analysis: Dict, strategic_roadmap: Dict, competitive_strategy: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, strategic_context: Dict, opportunity_analysis: Dict, strategic_roadmap: Dict, competitive_strategy: Dict) -> str:
         """Create enhanced output with comprehensive strategic analysis"""
         
         return f"""# Strategy Pilot Analysis & Strategic Roadmap
@@ -7,6 +7,9 @@ import asyncio
 import time
 from typing import Dict, Any, List, Optional
 import logging
+from functools import partial
+
+from agents.agent_result import AgentResult
 from memory.agent_memory import agent_memory
 
 class VPDesignAgent:
@@ -51,18 +54,30 @@ class VPDesignAgent:
             # Step 3: Generate design recommendations
             recommendations = await self._generate_design_recommendations(enhanced_analysis)
             
-            # Step 4: Create enhanced output
-            enhanced_output = await self._create_enhanced_output(input_prompt, recommendations)
+            # Step 4: Defer markdown rendering until the output is read
+            renderer = partial(self._create_enhanced_output, input_prompt, recommendations)
             
             execution_time = time.time() - start_time
             
             confidence = self._calculate_confidence(enhanced_analysis, recommendations)
             
-            # Store in memory
+            result = AgentResult({
+                "confidence": confidence,
+                "design_analysis": enhanced_analysis,
+                "recommendations": recommendations,
+                "tools_used": tools_used,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "design_principles_applied": self.design_principles,
+                    "analysis_timestamp": time.time()
+                }
+            }, renderer=renderer)
+            
+            # Store in memory unrendered (see AgentResult.render_record)
             await agent_memory.store_agent_run(
                 agent_name="vp_design",
                 prompt=input_prompt,
-                response=enhanced_output,
+                response=result.to_record(),
                 confidence=confidence,
                 fallback_flag=False,
                 additional_data={
@@ -72,26 +87,12 @@ class VPDesignAgent:
                 }
             )
             
-            result = {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "design_analysis": enhanced_analysis,
-                "recommendations": recommendations,
-                "tools_used": tools_used,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "design_principles_applied": self.design_principles,
-                    "analysis_timestamp": time.time()
-                }
-            }
-            
-            self.logger.info(f"VP Design Agent completed in {execution_time:.2f}s")
+            self.logger.info("VP Design Agent completed in %.2fs", execution_time)
             return result
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"VP Design Agent failed: {e}")
+            self.logger.error("VP Design Agent failed: %s", e)
             
             return {
                 "error": str(e),
@@ -130,7 +131,7 @@ class VPDesignAgent:
                 tools_used.append("ux_audit")
                 self.logger.info("Applied UX audit tool")
             except Exception as e:
-                self.logger.warning(f"UX audit tool failed: {e}")
+                self.logger.warning("UX audit tool failed: %s", e)
                 
         # Apply trust explainer tool if available
         if "trust_explainer" in tools:
@@ -140,7 +141,7 @@ class VPDesignAgent:
                 tools_used.append("trust_explainer")
                 self.logger.info("Applied trust explainer tool")
             except Exception as e:
-                self.logger.warning(f"Trust explainer tool failed: {e}")
+                self.logger.warning("Trust explainer tool failed: %s", e)
                 
         return enhanced_analysis
         
@@ -176,29 +177,28 @@ class VPDesignAgent:
             
         return recommendations
         
-    async def _create_enhanced_output(self, input_prompt: str, 
-                                    recommendations: List[Dict[str, Any]]) -> str:
+    def _create_enhanced_output(self, input_prompt: str, 
+                                recommendations: List[Dict[str, Any]]) -> str:
         """Create enhanced output with design recommendations"""
         
-        output = f"# Design Analysis & Recommendations\n\n"
-        output += f"## Original Request\n{input_prompt}\n\n"
-        
-        output += "## Key Recommendations\n\n"
+        parts = ["# Design Analysis & Recommendations\n\n",
+                 f"## Original Request\n{input_prompt}\n\n",
+                 "## Key Recommendations\n\n"]
         
         for i, rec in enumerate(recommendations, 1):
-            output += f"### {i}. {rec['title']}\n"
-            output += f"**Type:** {rec['type']}\n"
-            output += f"**Priority:** {rec['priority']}\n"
-            output += f"**Description:** {rec['description']}\n"
-            output += f"**Confidence:** {rec['confidence']:.2f}\n\n"
+            parts.append(f"### {i}. {rec['title']}\n"
+                         f"**Type:** {rec['type']}\n"
+                         f"**Priority:** {rec['priority']}\n"
+                         f"**Description:** {rec['description']}\n"
+                         f"**Confidence:** {rec['confidence']:.2f}\n\n")
             
-        output += "## Implementation Notes\n\n"
-        output += "- Apply design principles systematically\n"
-        output += "- Test with target audience\n"
-        output += "- Iterate based on feedback\n"
-        output += "- Monitor performance metrics\n"
+        parts.append("## Implementation Notes\n\n"
+                     "- Apply design principles systematically\n"
+                     "- Test with target audience\n"
+                     "- Iterate based on feedback\n"
+                     "- Monitor performance metrics\n")
         
-        return output
+        return "".join(parts)
         
     def _identify_request_type(self, input_prompt: str) -> str:
         """Identify the type of design request"""
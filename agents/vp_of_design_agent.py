@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class VPOfDesignAgent:
     """
@@ -94,17 +97,15 @@ class VPOfDesignAgent:
             # Analyze cross-functional impact
             cross_functional_impact = await self._analyze_cross_functional_impact(prompt, design_review)
             
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, design_review, vision_alignment, system_health_critique, cross_functional_impact)
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._create_enhanced_output, prompt, design_review, vision_alignment, system_health_critique, cross_functional_impact)
             
             execution_time = time.time() - start_time
             confidence = self._calculate_confidence(design_review, vision_alignment, system_health_critique)
             
-            self.logger.info(f"VP of Design Agent completed in {execution_time:.2f}s")
+            self.logger.info("VP of Design Agent completed in %.2fs", execution_time)
             
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
+            return AgentResult({
                 "confidence": confidence,
                 "design_review": design_review,
                 "vision_alignment": vision_alignment,
@@ -118,11 +119,11 @@ class VPOfDesignAgent:
                     "impact_areas": len(cross_functional_impact.get("impact_areas", [])),
                     "analysis_timestamp": datetime.now().timestamp()
                 }
-            }
+            }, renderer=renderer)
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"VP of Design Agent failed: {e}")
+            self.logger.error("VP of Design Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
@@ -228,7 +229,7 @@ class VPOfDesignAgent:
             "collaboration_recommendations": self._generate_collaboration_recommendations(engineering_impact, product_impact, marketing_impact, customer_support_impact)
         }
     
-    async def _create_enhanced_output(self, prompt: str, design_review: Dict, vision_alignment: Dict, system_health_critique: Dict, cross_functional_impact: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, design_review: Dict, vision_alignment: Dict, system_health_critique: Dict, cross_functional_impact: Dict) -> str:
         """Create enhanced output with executive design perspective"""
         
         return f"""# VP of Design Executive Review
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class VPOfProductAgent:
     """
@@ -80,17 +83,15 @@ class VPOfProductAgent:
             # Assess impact and success metrics
             impact_assessment = await self._assess_impact_and_success(prompt, business_goals_analysis, design_tech_alignment, roadmap_feasibility)
             
-            # Create enhanced output
-            enhanced_output = await self._create_enhanced_output(prompt, business_goals_analysis, design_tech_alignment, roadmap_feasibility, impact_assessment)
+            # Defer markdown rendering until the output is read
+            renderer = partial(self._create_enhanced_output, prompt, business_goals_analysis, design_tech_alignment, roadmap_feasibility, impact_assessment)
             
             execution_time = time.time() - start_time
             confidence = self._calculate_confidence(business_goals_analysis, design_tech_alignment, roadmap_feasibility)
             
-            self.logger.info(f"VP of Product Agent completed in {execution_time:.2f}s")
+            self.logger.info("VP of Product Agent completed in %.2fs", execution_time)
             
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
+            return AgentResult({
                 "confidence": confidence,
                 "business_goals_analysis": business_goals_analysis,
                 "design_tech_alignment": design_tech_alignment,
@@ -104,11 +105,11 @@ class VPOfProductAgent:
                     "impact_score": impact_assessment.get("overall_impact_score"),
                     "analysis_timestamp": datetime.now().timestamp()
                 }
-            }
+            }, renderer=renderer)
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"VP of Product Agent failed: {e}")
+            self.logger.error("VP of Product Agent failed: %s", e)
             return {
                 "error": str(e),
                 "confidence": 0.0,
@@ -211,7 +212,7 @@ class VPOfProductAgent:
             "impact_recommendations": self._generate_impact_recommendations(success_metrics, expected_impact, measurement_approach)
         }
     
-    async def _create_enhanced_output(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict, roadmap_feasibility: Dict, impact_assessment: Dict) -> str:
+    def _create_enhanced_output(self, prompt: str, business_goals_analysis: Dict, design_tech_alignment: Dict, roadmap_feasibility: Dict, impact_assessment: Dict) -> str:
         """Create enhanced output with executive product perspective"""
         
         return f"""# VP of Product Executive Analysis
@@ -9,6 +9,9 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+from functools import partial
+
+from agents.agent_result import AgentResult
 
 class WorkflowOptimizerAgent:
     """
@@ -28,7 +31,34 @@ class WorkflowOptimizerAgent:
         
         try:
             # Workflow Optimizer Agent Implementation
-            enhanced_output = f"""# Workflow Optimizer Agent Response
+            execution_time = time.time() - start_time
+            confidence = 0.86
+            
+            self.logger.info("Workflow Optimizer Agent completed in %.2fs", execution_time)
+            
+            return AgentResult({
+                "confidence": confidence,
+                "execution_time": execution_time,
+                "shared_state": {
+                    "optimization_type": "process_optimization",
+                    "focus": "operational_efficiency",
+                    "principles": ["efficiency", "collaboration", "continuous_improvement"],
+                    "analysis_timestamp": datetime.now().timestamp()
+                }
+            }, renderer=partial(self._render_output, prompt))
+            
+        except Exception as e:
+            execution_time = time.time() - start_time
+            self.logger.error("Workflow Optimizer Agent failed: %s", e)
+            return {
+                "error": str(e),
+                "confidence": 0.0,
+                "execution_time": execution_time
+            }
+    
+    def _render_output(self, prompt: str) -> str:
+        """Render the markdown report for a request"""
+        return f"""# Workflow Optimizer Agent Response
 
 ## Original Request
 {prompt}
@@ -56,30 +86,3 @@ class WorkflowOptimizerAgent:
 **Score:** 0.86/1.00
 
 *Generated by Fusion v14 Workflow Optimizer Agent*"""
-            
-            execution_time = time.time() - start_time
-            confidence = 0.86
-            
-            self.logger.info(f"Workflow Optimizer Agent completed in {execution_time:.2f}s")
-            
-            return {
-                "output": enhanced_output,
-                "enhanced_output": enhanced_output,
-                "confidence": confidence,
-                "execution_time": execution_time,
-                "shared_state": {
-                    "optimization_type": "process_optimization",
-                    "focus": "operational_efficiency",
-                    "principles": ["efficiency", "collaboration", "continuous_improvement"],
-                    "analysis_timestamp": datetime.now().timestamp()
-                }
-            }
-            
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"Workflow Optimizer Agent failed: {e}")
-            return {
-                "error": str(e),
-                "confidence": 0.0,
-                "execution_time": execution_time
-            } 
\ No newline at end of file
@@ -22,6 +22,8 @@ from typing import Dict, List, Any, Optional
 import json
 from datetime import datetime
 
+from fusion_core.memory.ring_buffer import RingBuffer
+
 # Placeholder imports - will be replaced with actual agent implementations
 class StrategyPilot:
     def develop_strategy(self, input_prompt):
@@ -64,7 +66,7 @@ class EvaluatorAgent:
 
 class ExecutionChainOrchestrator:
     def __init__(self):
-        self.memory = []
+        self.memory = RingBuffer(100)
         self.confidence_threshold = 0.95
         self.fallback_routes = {
             "strategy_failure": "ProductNavigator",
@@ -207,11 +209,8 @@ class ExecutionChainOrchestrator:
             "timestamp": datetime.now().isoformat(),
             "success": result.get("status") == "✅ SUCCESS"
         }
+        # Bounded to the last 100 entries; the oldest is evicted in place
         self.memory.append(memory_entry)
-        
-        # Keep only last 100 entries
-        if len(self.memory) > 100:
-            self.memory = self.memory[-100:]
     
     def _handle_failure(self, input_prompt: str, error: Exception) -> Dict[str, Any]:
         """Handle orchestration failures gracefully"""
@@ -239,7 +238,7 @@ class ExecutionChainOrchestrator:
             "total_executions": total,
             "successful_executions": successful,
             "success_rate": successful / total if total > 0 else 0,
-            "recent_executions": self.memory[-10:] if len(self.memory) >= 10 else self.memory
+            "recent_executions": self.memory.recent(10)
         }
 
 # Example usage
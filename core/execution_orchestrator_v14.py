@@ -5,11 +5,17 @@ Async orchestrator for the programmable agent OS
 
 import asyncio
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional
 from datetime import datetime
 import logging
 
 from .fusion_context import FusionContext
+from .pipeline_checkpoint import PipelineCheckpointStore, PipelineMemoStore
+from .pipeline_planner import PipelinePlanner
+from .pipeline_gates import QualityGates
+from .pipeline_handoff import PipelineHandoff
+from fusion_core.orchestration.circuit_breaker import CircuitOpenError
+from fusion_core.telemetry.structured_logging import log_kv
 
 class ExecutionOrchestrator:
     """
@@ -17,27 +23,36 @@ class ExecutionOrchestrator:
     Manages agent execution, tool coordination, and pattern fallback
     """
     
-    def __init__(self, context: FusionContext):
+    def __init__(self, context: FusionContext, telemetry=None, circuit_breakers=None,
+                 checkpoint_store: Optional[PipelineCheckpointStore] = None,
+                 memo_store: Optional[PipelineMemoStore] = None):
         self.context = context
+        self.checkpoints = checkpoint_store
+        self.memo = memo_store
+        self.telemetry = telemetry
+        self.circuit_breakers = circuit_breakers
+        if circuit_breakers and telemetry:
+            circuit_breakers.attach(telemetry)
         self.agents = {}
         self.tools = {}
         self.patterns = {}
+        self.max_speculative_branches = context.config.get("max_speculative_branches", 2)
         self.logger = logging.getLogger("ExecutionOrchestrator")
         
     def register_agent(self, name: str, agent_instance) -> None:
         """Register an agent with the orchestrator"""
         self.agents[name] = agent_instance
-        self.logger.info(f"Registered agent: {name}")
+        self.logger.info("Registered agent: %s", name)
         
     def register_tool(self, name: str, tool_instance) -> None:
         """Register a tool with the orchestrator"""
         self.tools[name] = tool_instance
-        self.logger.info(f"Registered tool: {name}")
+        self.logger.info("Registered tool: %s", name)
         
     def register_pattern(self, name: str, pattern_data: Dict[str, Any]) -> None:
         """Register a pattern with the orchestrator"""
         self.patterns[name] = pattern_data
-        self.logger.info(f"Registered pattern: {name}")
+        self.logger.info("Registered pattern: %s", name)
         
     async def execute_agent(self, agent_name: str, input_prompt: str, 
                           tools: List[str] = None) -> Dict[str, Any]:
@@ -46,11 +61,19 @@ class ExecutionOrchestrator:
         if agent_name not in self.agents:
             raise ValueError(f"Agent {agent_name} not registered")
             
+        if self.circuit_breakers and not self.circuit_breakers.allow(agent_name):
+            return await self._short_circuit(agent_name, input_prompt, tools)
+            
+        return await self._run_agent(agent_name, input_prompt, tools)
+        
+    async def _run_agent(self, agent_name: str, input_prompt: str,
+                         tools: List[str] = None) -> Dict[str, Any]:
+        """Run an agent the breakers have admitted, recording its outcome"""
         agent = self.agents[agent_name]
         start_time = time.time()
         
         try:
-            self.logger.info(f"Executing agent: {agent_name}")
+            log_kv(self.logger, logging.INFO, "Executing agent", agent=agent_name)
             
             # Prepare tools for the agent
             available_tools = {}
@@ -59,7 +82,7 @@ class ExecutionOrchestrator:
                     if tool_name in self.tools:
                         available_tools[tool_name] = self.tools[tool_name]
                     else:
-                        self.logger.warning(f"Tool {tool_name} not found")
+                        self.logger.warning("Tool %s not found", tool_name)
                         
             # Execute agent
             if hasattr(agent, 'run_async'):
@@ -79,12 +102,16 @@ class ExecutionOrchestrator:
                 execution_time=execution_time
             )
             
-            self.logger.info(f"Agent {agent_name} completed in {execution_time:.2f}s")
+            self._record_outcome(agent_name, input_prompt, result, execution_time,
+                                 failed="error" in result)
+            
+            log_kv(self.logger, logging.INFO, "Agent completed", agent=agent_name,
+                   execution_time=round(execution_time, 3))
             return result
             
         except Exception as e:
             execution_time = time.time() - start_time
-            self.logger.error(f"Agent {agent_name} failed: {e}")
+            log_kv(self.logger, logging.ERROR, "Agent failed", agent=agent_name, error=str(e))
             
             # Store failed interaction
             await self.context.store_interaction(
@@ -95,13 +122,76 @@ class ExecutionOrchestrator:
                 tools_used=list(available_tools.keys()) if 'available_tools' in locals() else [],
                 execution_time=execution_time
             )
+            self._record_outcome(agent_name, input_prompt, {"error": str(e)}, execution_time,
+                                 failed=True)
             
             raise
             
+    def _record_outcome(self, agent_name: str, input_prompt: str, result: Dict[str, Any],
+                        execution_time: float, failed: bool) -> None:
+        """Report an agent call to telemetry, which feeds the circuit breakers"""
+        if self.telemetry:
+            self.telemetry.log_event(
+                agent=agent_name,
+                input_text=input_prompt,
+                output_text=str(result.get('output', result.get('error', ''))),
+                confidence=result.get('confidence', 0.0),
+                execution_time=execution_time,
+                fallback="error_handling" if failed else None
+            )
+        elif self.circuit_breakers:
+            self.circuit_breakers.record(agent_name, not failed, execution_time)
+            
+    async def _short_circuit(self, agent_name: str, input_prompt: str,
+                             tools: List[str] = None) -> Dict[str, Any]:
+        """Route around an agent whose circuit is open using the configured fallback"""
+        fallback = self.circuit_breakers.fallback_for(agent_name)
+        pattern_name = fallback["pattern"]
+        fallback_agent = fallback["agent"]
+        log_kv(self.logger, logging.WARNING, "Circuit open, routing to fallback", agent=agent_name)
+        
+        if self.telemetry:
+            self.telemetry.log_event(
+                agent=agent_name,
+                input_text=input_prompt,
+                output_text="Circuit open",
+                fallback="circuit_open"
+            )
+        
+        # Fallbacks run directly rather than through execute_agent, so a chain of
+        # open circuits (A -> B -> A) ends here instead of recursing
+        if pattern_name in self.patterns:
+            pattern_agent = self.patterns[pattern_name].get('agent', 'vp_design')
+            if (pattern_agent != agent_name and pattern_agent in self.agents
+                    and self.circuit_breakers.allow(pattern_agent)):
+                return await self._apply_pattern(pattern_name, input_prompt, run_agent=self._run_agent)
+        if (fallback_agent in self.agents and fallback_agent != agent_name
+                and self.circuit_breakers.allow(fallback_agent)):
+            return await self._run_agent(fallback_agent, input_prompt, tools)
+            
+        raise CircuitOpenError(agent_name)
+            
     async def execute_pipeline(self, input_prompt: str, 
                              agent_sequence: List[str] = None,
-                             tools_per_agent: Dict[str, List[str]] = None) -> Dict[str, Any]:
-        """Execute a sequence of agents in pipeline"""
+                             tools_per_agent: Dict[str, List[str]] = None,
+                             run_id: str = None, resume: bool = True,
+                             deadline: float = None,
+                             required_agents: List[str] = None,
+                             planner: PipelinePlanner = None,
+                             gates: QualityGates = None,
+                             handoff: str = None) -> Dict[str, Any]:
+        """
+        Execute a sequence of agents in pipeline, resuming from checkpoints
+        
+        handoff="chain" (the default, or the pipeline_handoff config) passes the
+        previous agent's full output; handoff="digest" passes each step the original
+        prompt plus a bounded digest of upstream results
+        """
+        
+        if handoff is None:
+            handoff = self.context.config.get("pipeline_handoff", "chain")
+        if handoff not in ("digest", "chain"):
+            raise ValueError(f"Unknown handoff mode: {handoff}")
         
         if agent_sequence is None:
             agent_sequence = list(self.agents.keys())
@@ -109,63 +199,197 @@ class ExecutionOrchestrator:
         if tools_per_agent is None:
             tools_per_agent = {}
             
-        self.logger.info(f"Starting pipeline execution with {len(agent_sequence)} agents")
+        if self.checkpoints and run_id is None:
+            run_id = self.checkpoints.make_run_id(input_prompt, agent_sequence)
+            
+        # Under a deadline, run only the agents the planner expects to fit
+        plan = None
+        # Steps are identified by their position in agent_sequence, so an agent
+        # that appears twice gets its own checkpoint and memo slot per step
+        stages = [[step_index] for step_index in range(len(agent_sequence))]
+        if deadline is not None:
+            if planner is None:
+                planner = (PipelinePlanner.from_telemetry(self.telemetry)
+                           if self.telemetry else PipelinePlanner())
+            plan = planner.plan(agent_sequence, deadline, required_agents or [])
+            stages = plan["stage_positions"]
+            log_kv(self.logger, logging.INFO, "Planned pipeline for deadline", deadline=round(deadline, 2),
+                   selected=len(plan["selected"]), skipped=len(plan["skipped"]))
+            
+        log_kv(self.logger, logging.INFO, "Starting pipeline", agents=len(agent_sequence))
         
         pipeline_result = {
             "pipeline_start": datetime.now().isoformat(),
+            "run_id": run_id,
             "agent_sequence": agent_sequence,
+            "plan": plan,
             "results": {},
+            "resumed_steps": [],
+            "reused_steps": [],
+            "triggered_gates": [],
             "final_output": None,
             "total_execution_time": 0.0
         }
         
+        digest = (PipelineHandoff(input_prompt, **self.context.config.get("handoff_budget", {}))
+                  if handoff == "digest" else None)
         current_input = input_prompt
+        last_result = None
         total_start_time = time.time()
         
         try:
-            for i, agent_name in enumerate(agent_sequence):
-                self.logger.info(f"Pipeline step {i+1}/{len(agent_sequence)}: {agent_name}")
-                
-                # Get tools for this agent
-                tools = tools_per_agent.get(agent_name, [])
-                
-                # Execute agent
-                result = await self.execute_agent(agent_name, current_input, tools)
+            for stage_index, positions in enumerate(stages):
+                stage = [agent_sequence[step_index] for step_index in positions]
+                if plan and time.time() - total_start_time >= deadline and \
+                        not any(name in plan["required"] for name in stage):
+                    log_kv(self.logger, logging.INFO, "Deadline reached, skipping stage", agents=stage)
+                    plan["skipped"].extend(stage)
+                    continue
+                    
+                # Every agent in a stage reads the same shared-state snapshot
+                snapshot = self.context.shared_state.snapshot()
                 
-                # Store result
-                pipeline_result["results"][agent_name] = result
+                if gates:
+                    positions = [step_index for step_index in positions
+                                 if not self._gate_triggered(
+                                     gates.check_skip(agent_sequence[step_index],
+                                                      pipeline_result["results"], snapshot),
+                                     agent_sequence[step_index], pipeline_result)]
+                    stage = [agent_sequence[step_index] for step_index in positions]
+                    
+                # Agents in one stage share the same input and run concurrently
+                stage_results = await asyncio.gather(*(
+                    self._run_pipeline_step(step_index, agent_sequence[step_index],
+                                            current_input, tools_per_agent.get(agent_sequence[step_index], []),
+                                            run_id, resume, pipeline_result, snapshot)
+                    for step_index in positions
+                ))
                 
-                # Update input for next agent
-                if result.get("output"):
-                    current_input = result["output"]
-                elif result.get("enhanced_output"):
-                    current_input = result["enhanced_output"]
+                for agent_name, result in zip(stage, stage_results):
+                    # Store result
+                    pipeline_result["results"][agent_name] = result
                     
-                # Update shared state if agent provides it
-                if result.get("shared_state"):
-                    for key, value in result["shared_state"].items():
-                        self.context.set_shared_state(key, value)
+                    # Update input for next agent; full outputs stay in results. Lazy
+                    # reports are only rendered when the handoff reads them
+                    if "output" in result or "enhanced_output" in result:
+                        last_result = result
+                    if digest:
+                        digest.add(agent_name, result)
+                    else:
+                        output = result.get("output") or result.get("enhanced_output")
+                        if output:
+                            current_input = output
+                        
+                    # Commit shared-state writes against the snapshot the stage read, in
+                    # sequence order, so concurrent writers merge deterministically
+                    if result.get("shared_state"):
+                        self.context.shared_state.commit(result["shared_state"],
+                                                         base_version=snapshot.version,
+                                                         writer=agent_name)
+                            
+                if digest:
+                    current_input = digest.next_input()
+                    
+                # Stop early once a gate says the remaining steps are not needed. Stop
+                # gates read the stage's snapshot, like its skip gates; writes committed
+                # by this stage are visible to the next stage's gates
+                if gates:
+                    remaining = [agent_sequence[step_index] for later in stages[stage_index + 1:]
+                                 for step_index in later]
+                    stop_gate = None
+                    for agent_name in stage:
+                        stop_gate = stop_gate or gates.check_stop(agent_name, remaining,
+                                                                  pipeline_result["results"], snapshot)
+                    if self._gate_triggered(stop_gate, stage[-1] if stage else None, pipeline_result):
+                        pipeline_result["stopped_early"] = True
+                        break
                         
             total_execution_time = time.time() - total_start_time
             pipeline_result["total_execution_time"] = total_execution_time
-            pipeline_result["final_output"] = current_input
+            pipeline_result["final_output"] = ((last_result.get("output") or last_result.get("enhanced_output"))
+                                               if last_result else None) or input_prompt
             pipeline_result["pipeline_end"] = datetime.now().isoformat()
             
-            self.logger.info(f"Pipeline completed in {total_execution_time:.2f}s")
+            # A completed run has nothing left to resume
+            if self.checkpoints:
+                self.checkpoints.clear(run_id)
+            
+            log_kv(self.logger, logging.INFO, "Pipeline completed",
+                   execution_time=round(total_execution_time, 3))
             return pipeline_result
             
         except Exception as e:
             total_execution_time = time.time() - total_start_time
-            self.logger.error(f"Pipeline failed: {e}")
+            log_kv(self.logger, logging.ERROR, "Pipeline failed", error=str(e))
             pipeline_result["error"] = str(e)
             pipeline_result["total_execution_time"] = total_execution_time
             return pipeline_result
             
+    def _gate_triggered(self, gate: Optional[Dict[str, Any]], agent_name: Optional[str],
+                        pipeline_result: Dict[str, Any]) -> bool:
+        """Record a triggered quality gate; returns whether one fired"""
+        if not gate:
+            return False
+        action = "skip" if ("skip_phase" in gate or "skip_agent" in gate) else "stop"
+        log_kv(self.logger, logging.INFO, "Gate triggered", gate=gate.get("name", action),
+               agent=agent_name, action=action)
+        pipeline_result["triggered_gates"].append({
+            "gate": gate.get("name"),
+            "action": action,
+            "agent": agent_name
+        })
+        return True
+            
+    async def _run_pipeline_step(self, step_index: int, agent_name: str, current_input: str,
+                                 tools: List[str], run_id: str, resume: bool,
+                                 pipeline_result: Dict[str, Any],
+                                 shared_state: Mapping[str, Any]) -> Dict[str, Any]:
+        """Run one pipeline step, reusing checkpointed or memoized results"""
+        log_kv(self.logger, logging.INFO, "Pipeline step", step=step_index + 1,
+               total=len(pipeline_result['agent_sequence']), agent=agent_name)
+        
+        # Reuse the checkpointed result if this step already ran on this input
+        result = None
+        reused_from = None
+        if self.checkpoints:
+            input_hash = self.checkpoints.hash_input(current_input)
+            if resume:
+                result = self.checkpoints.get_step(run_id, step_index, agent_name, input_hash,
+                                                   agent=self.agents.get(agent_name))
+                reused_from = "resumed_steps" if result is not None else None
+                
+        # Otherwise reuse a memoized result if the step's effective input is unchanged
+        fingerprint = None
+        if result is None and self.memo and agent_name in self.agents:
+            fingerprint = self.memo.fingerprint(agent_name, self.agents[agent_name],
+                                                current_input, tools, shared_state)
+            result = self.memo.get(fingerprint, agent=self.agents[agent_name])
+            reused_from = "reused_steps" if result is not None else None
+            
+        if result is None:
+            result = await self.execute_agent(agent_name, current_input, tools)
+            if fingerprint is not None and "error" not in result:
+                self.memo.put(fingerprint, result)
+        else:
+            log_kv(self.logger, logging.INFO, "Reused stored result", agent=agent_name, source=reused_from)
+            pipeline_result[reused_from].append(agent_name)
+            
+        if self.checkpoints and reused_from != "resumed_steps":
+            self.checkpoints.save_step(run_id, step_index, agent_name, input_hash, result)
+            
+        return result
+            
     async def execute_with_pattern_fallback(self, input_prompt: str, 
                                          primary_agent: str,
-                                         fallback_patterns: List[str] = None) -> Dict[str, Any]:
+                                         fallback_patterns: List[str] = None,
+                                         speculative: bool = None) -> Dict[str, Any]:
         """Execute agent with pattern fallback"""
         
+        if speculative is None:
+            speculative = self.context.config.get("speculative_fallback", False)
+        if speculative and fallback_patterns and self.max_speculative_branches > 0:
+            return await self._execute_speculative(input_prompt, primary_agent, fallback_patterns)
+        
         try:
             # Try primary agent first
             result = await self.execute_agent(primary_agent, input_prompt)
@@ -177,19 +401,22 @@ class ExecutionOrchestrator:
                 
             # If confidence is low, try pattern fallback
             if fallback_patterns:
-                self.logger.info(f"Low confidence ({confidence}), trying pattern fallback")
+                log_kv(self.logger, logging.INFO, "Low confidence, trying pattern fallback",
+                       agent=primary_agent, confidence=confidence)
                 
                 for pattern_name in fallback_patterns:
                     if pattern_name in self.patterns:
                         pattern_result = await self._apply_pattern(pattern_name, input_prompt)
                         if pattern_result.get('confidence', 0) > confidence:
-                            self.logger.info(f"Pattern {pattern_name} improved confidence to {pattern_result.get('confidence')}")
+                            log_kv(self.logger, logging.INFO, "Pattern improved confidence",
+                                   pattern=pattern_name, confidence=pattern_result.get("confidence"))
                             return pattern_result
                             
             return result
             
         except Exception as e:
-            self.logger.error(f"Primary agent failed, trying pattern fallback: {e}")
+            log_kv(self.logger, logging.ERROR, "Primary agent failed, trying pattern fallback",
+                   agent=primary_agent, error=str(e))
             
             # Try pattern fallback on error
             if fallback_patterns:
@@ -199,26 +426,61 @@ class ExecutionOrchestrator:
                             pattern_result = await self._apply_pattern(pattern_name, input_prompt)
                             return pattern_result
                         except Exception as pattern_error:
-                            self.logger.warning(f"Pattern {pattern_name} also failed: {pattern_error}")
+                            log_kv(self.logger, logging.WARNING, "Fallback pattern failed",
+                                   pattern=pattern_name, error=str(pattern_error))
                             
             raise
             
-    async def _apply_pattern(self, pattern_name: str, input_prompt: str) -> Dict[str, Any]:
+    async def _execute_speculative(self, input_prompt: str, primary_agent: str,
+                                   fallback_patterns: List[str]) -> Dict[str, Any]:
+        """Run the primary agent and the top fallback patterns concurrently"""
+        
+        branches = [name for name in fallback_patterns if name in self.patterns]
+        branches = branches[:self.max_speculative_branches]
+        log_kv(self.logger, logging.INFO, "Speculative fallback", agent=primary_agent,
+               pattern_branches=len(branches))
+        
+        outcomes = await asyncio.gather(
+            self.execute_agent(primary_agent, input_prompt),
+            *(self._apply_pattern(name, input_prompt) for name in branches),
+            return_exceptions=True
+        )
+        
+        # Primary is checked first so it wins ties, as in sequential fallback
+        best_result = None
+        best_confidence = -1.0
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                branch = primary_agent if i == 0 else f"pattern {branches[i - 1]}"
+                log_kv(self.logger, logging.WARNING, "Speculative branch failed", branch=branch,
+                       error=str(outcome))
+                continue
+            confidence = outcome.get('confidence', 0.8 if i == 0 else 0)
+            if confidence > best_confidence:
+                best_result, best_confidence = outcome, confidence
+                
+        if best_result is None:
+            raise outcomes[0]
+        return best_result
+            
+    async def _apply_pattern(self, pattern_name: str, input_prompt: str,
+                             run_agent=None) -> Dict[str, Any]:
         """Apply a specific pattern to the input"""
         
         pattern = self.patterns[pattern_name]
+        run_agent = run_agent or self.execute_agent
         start_time = time.time()
         
         try:
             # Apply pattern transformation
             if pattern.get('type') == 'prompt_enhancement':
                 enhanced_prompt = self._enhance_prompt_with_pattern(input_prompt, pattern)
-                result = await self.execute_agent(pattern.get('agent', 'vp_design'), enhanced_prompt)
+                result = await run_agent(pattern.get('agent', 'vp_design'), enhanced_prompt)
             elif pattern.get('type') == 'output_transformation':
-                result = await self.execute_agent(pattern.get('agent', 'vp_design'), input_prompt)
+                result = await run_agent(pattern.get('agent', 'vp_design'), input_prompt)
                 result = self._transform_output_with_pattern(result, pattern)
             else:
-                result = await self.execute_agent(pattern.get('agent', 'vp_design'), input_prompt)
+                result = await run_agent(pattern.get('agent', 'vp_design'), input_prompt)
                 
             execution_time = time.time() - start_time
             
@@ -236,7 +498,7 @@ class ExecutionOrchestrator:
             return result
             
         except Exception as e:
-            self.logger.error(f"Pattern {pattern_name} failed: {e}")
+            log_kv(self.logger, logging.ERROR, "Pattern failed", pattern=pattern_name, error=str(e))
             raise
             
     def _enhance_prompt_with_pattern(self, input_prompt: str, pattern: Dict[str, Any]) -> str:
@@ -275,5 +537,6 @@ class ExecutionOrchestrator:
             "registered_agents": list(self.agents.keys()),
             "registered_tools": list(self.tools.keys()),
             "registered_patterns": list(self.patterns.keys()),
+            "circuit_breakers": self.circuit_breakers.get_status() if self.circuit_breakers else {},
             "context_stats": self.context.get_execution_stats()
         } 
\ No newline at end of file
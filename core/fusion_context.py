@@ -4,22 +4,53 @@ Shared state and memory management for the agent OS
 """
 
 import json
+import os
 import asyncio
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from datetime import datetime
-from dataclasses import dataclass, asdict
 import logging
 
-@dataclass
+from fusion_core.memory.ring_buffer import RingBuffer, jsonl_spill
+from fusion_core.memory.jsonl_stream import (write_jsonl, iter_jsonl, read_jsonl_chunks, is_jsonl,
+                                             ProgressCallback)
+from fusion_core.telemetry.structured_logging import configure_logging, log_kv
+from agents.agent_result import AgentResult
+
+from .shared_state import VersionedSharedState
+
 class MemoryEntry:
-    timestamp: str
-    agent_name: str
-    input_prompt: str
-    output: Dict[str, Any]
-    confidence: float
-    tools_used: List[str]
-    execution_time: float
-    pattern_applied: Optional[str] = None
+    """Compact (slotted) record of a single agent interaction"""
+    
+    __slots__ = ("timestamp", "agent_name", "input_prompt", "output", "confidence",
+                 "tools_used", "execution_time", "pattern_applied")
+    
+    def __init__(self, timestamp: str, agent_name: str, input_prompt: str,
+                 output: Dict[str, Any], confidence: float, tools_used: List[str],
+                 execution_time: float, pattern_applied: Optional[str] = None):
+        self.timestamp = timestamp
+        self.agent_name = agent_name
+        self.input_prompt = input_prompt
+        self.output = output
+        self.confidence = confidence
+        self.tools_used = tools_used
+        self.execution_time = execution_time
+        self.pattern_applied = pattern_applied
+        
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+        
+    def to_record(self) -> Dict[str, Any]:
+        """JSON-ready form; a structured output keeps its report (see AgentResult.to_record)"""
+        data = self.to_dict()
+        if isinstance(self.output, AgentResult):
+            data["output"] = self.output.to_record()
+        return data
+        
+    def __eq__(self, other) -> bool:
+        return isinstance(other, MemoryEntry) and self.to_dict() == other.to_dict()
+        
+    def __repr__(self) -> str:
+        return f"MemoryEntry(agent_name={self.agent_name!r}, confidence={self.confidence!r}, timestamp={self.timestamp!r})"
 
 class FusionContext:
     """
@@ -29,17 +60,34 @@ class FusionContext:
     
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.shared_state: Dict[str, Any] = {}
-        self.memory: List[MemoryEntry] = []
+        self.shared_state = VersionedSharedState(
+            merge_rules=config.get("shared_state_merge_rules", {}),
+            default_rule=config.get("shared_state_default_rule", "last_writer_wins")
+        )
         self.pattern_memory: Dict[str, Any] = {}
-        self.execution_history: List[Dict[str, Any]] = []
+        
         self.current_session_id = datetime.now().isoformat()
         
-        # Setup logging
-        logging.basicConfig(
-            level=getattr(logging, config.get("log_level", "INFO")),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        # Bounded in-process histories. Entries evicted from a full memory buffer
+        # are appended to memory_spill_path (JSONL, by default a per-session file
+        # under memory_spill_dir, created on the first eviction only) and included
+        # in export_memory. Setting memory_spill_path to None drops entries beyond
+        # memory_retention.
+        if "memory_spill_path" in config:
+            spill_path = config["memory_spill_path"]
+        else:
+            session_file = self.current_session_id.replace(":", "-")
+            spill_path = os.path.join(config.get("memory_spill_dir", "fusion_memory"),
+                                      f"context_{session_file}.spill.jsonl")
+        self.memory_spill_path = spill_path
+        self.memory = RingBuffer(
+            config.get("memory_retention", 1000),
+            spill=jsonl_spill(spill_path, MemoryEntry.to_record) if spill_path else None
         )
+        self.execution_history = RingBuffer(config.get("history_retention", 1000))
+        
+        # Setup logging (queued, written off the event loop)
+        configure_logging(config.get("log_level", "INFO"))
         self.logger = logging.getLogger("FusionContext")
         
     async def store_interaction(self, agent_name: str, input_prompt: str, 
@@ -60,16 +108,16 @@ class FusionContext:
         )
         
         self.memory.append(entry)
-        self.logger.info(f"Stored interaction for {agent_name} with confidence {confidence}")
+        log_kv(self.logger, logging.INFO, "Stored interaction", agent=agent_name, confidence=confidence)
         
     def get_shared_state(self, key: str, default: Any = None) -> Any:
         """Get value from shared state"""
         return self.shared_state.get(key, default)
         
-    def set_shared_state(self, key: str, value: Any) -> None:
+    def set_shared_state(self, key: str, value: Any, writer: str = None) -> None:
         """Set value in shared state"""
-        self.shared_state[key] = value
-        self.logger.debug(f"Set shared state {key}: {value}")
+        self.shared_state.set(key, value, writer=writer)
+        log_kv(self.logger, logging.DEBUG, "Set shared state", key=key, value=value)
         
     def get_relevant_memory(self, query: str, limit: int = 5) -> List[MemoryEntry]:
         """Get relevant memory entries based on query similarity"""
@@ -109,56 +157,89 @@ class FusionContext:
             "avg_confidence": avg_confidence,
             "avg_execution_time": avg_execution_time,
             "session_id": self.current_session_id,
-            "memory_size": len(self.memory)
+            "memory_size": len(self.memory),
+            "memory_spilled": self.memory.spilled
         }
         
     def clear_memory(self) -> None:
         """Clear all memory (use with caution)"""
         self.memory.clear()
+        self.memory.spilled = 0
+        if self.memory_spill_path and os.path.exists(self.memory_spill_path):
+            os.remove(self.memory_spill_path)
         self.pattern_memory.clear()
         self.shared_state.clear()
         self.logger.info("Memory cleared")
         
-    def export_memory(self, filepath: str) -> None:
-        """Export memory to JSON file"""
-        memory_data = {
-            "session_id": self.current_session_id,
-            "memory": [asdict(entry) for entry in self.memory],
-            "pattern_memory": self.pattern_memory,
-            "shared_state": self.shared_state
-        }
+    def export_memory(self, filepath: str, compress: Optional[str] = None,
+                      include_spilled: bool = True, chunk_size: int = 1000,
+                      progress: Optional[ProgressCallback] = None) -> int:
+        """
+        Stream memory to a JSONL file (gzip/zstd by extension or compress)
         
-        with open(filepath, 'w') as f:
-            json.dump(memory_data, f, indent=2)
-            
-        self.logger.info(f"Memory exported to {filepath}")
+        One record per line, tagged by section: a header, then memory entries
+        (spilled ones first unless include_spilled is False), pattern memory and
+        shared state keys. Entries are written a chunk at a time, so exports run
+        in bounded memory; returns the records written.
+        """
+        count = write_jsonl(filepath, self._export_records(include_spilled), compress,
+                            chunk_size, progress)
+        self.logger.info("Memory exported to %s (%d records)", filepath, count)
+        return count
+    
+    def _export_records(self, include_spilled: bool) -> Iterator[Dict[str, Any]]:
+        yield {"section": "header", "session_id": self.current_session_id, "format_version": 1}
+        if include_spilled and self.memory_spill_path and os.path.exists(self.memory_spill_path):
+            for entry_data in iter_jsonl(self.memory_spill_path):
+                yield {"section": "memory", "data": entry_data}
+        for entry in self.memory:
+            yield {"section": "memory", "data": entry.to_record()}
+        for key, value in self.pattern_memory.items():
+            yield {"section": "pattern_memory", "key": key, "value": value}
+        for key, value in self.shared_state.snapshot().items():
+            yield {"section": "shared_state", "key": key, "value": value}
         
-    def import_memory(self, filepath: str) -> None:
-        """Import memory from JSON file"""
+    def import_memory(self, filepath: str, compress: Optional[str] = None, chunk_size: int = 1000,
+                      progress: Optional[ProgressCallback] = None) -> None:
+        """Import memory from a JSONL export (streamed in chunks) or a legacy JSON export"""
         try:
-            with open(filepath, 'r') as f:
-                memory_data = json.load(f)
+            if not is_jsonl(filepath, compress):
+                with open(filepath, 'r') as f:
+                    self._import_document(json.load(f))
+            else:
+                shared_state: Dict[str, Any] = {}
+                for chunk in read_jsonl_chunks(filepath, chunk_size, compress, progress):
+                    if "section" not in chunk[0]:
+                        # A legacy export written on a single line
+                        self._import_document(chunk[0])
+                        break
+                    for record in chunk:
+                        section = record["section"]
+                        if section == "memory":
+                            self.memory.append(MemoryEntry(**record["data"]))
+                        elif section == "pattern_memory":
+                            self.pattern_memory[record["key"]] = record["value"]
+                        elif section == "shared_state":
+                            shared_state[record["key"]] = record["value"]
+                if shared_state:
+                    self.shared_state.update(shared_state)
                 
-            # Import memory entries
-            for entry_data in memory_data.get("memory", []):
-                entry = MemoryEntry(**entry_data)
-                self.memory.append(entry)
-                
-            # Import pattern memory
-            self.pattern_memory.update(memory_data.get("pattern_memory", {}))
-            
-            # Import shared state
-            self.shared_state.update(memory_data.get("shared_state", {}))
-            
-            self.logger.info(f"Memory imported from {filepath}")
+            self.logger.info("Memory imported from %s", filepath)
             
         except Exception as e:
-            self.logger.error(f"Failed to import memory: {e}")
+            self.logger.error("Failed to import memory: %s", e)
+    
+    def _import_document(self, memory_data: Dict[str, Any]) -> None:
+        """Import the single-document JSON format written by earlier versions"""
+        for entry_data in memory_data.get("memory", []):
+            self.memory.append(MemoryEntry(**entry_data))
+        self.pattern_memory.update(memory_data.get("pattern_memory", {}))
+        self.shared_state.update(memory_data.get("shared_state", {}))
             
     def get_context_summary(self) -> str:
         """Get a summary of current context"""
         stats = self.get_execution_stats()
-        recent_memory = self.memory[-5:] if self.memory else []
+        recent_memory = self.memory.recent(5)
         
         summary = f"""
 Fusion v14 Context Summary:
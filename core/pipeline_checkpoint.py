@@ -0,0 +1,181 @@
+"""
+Pipeline Checkpoints - Fusion v14
+Persists completed pipeline steps so failed or interrupted runs can resume
+"""
+
+import copy
+import hashlib
+import json
+import os
+import shutil
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+
+from agents.agent_result import AgentResult
+
+
+def _materialize(result: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready dict of a result; lazy agent output is stored unrendered"""
+    to_record = getattr(result, "to_record", None)
+    return to_record() if callable(to_record) else result
+
+
+def _restore(stored: Dict[str, Any], agent: Any = None) -> Dict[str, Any]:
+    """Rebuild a stored result, re-attaching its lazy renderer to agent"""
+    return AgentResult.from_record(stored, agent)
+
+
+class PipelineCheckpointStore:
+    """
+    File-backed checkpoints of completed pipeline steps
+    One file per step under <checkpoint_dir>/<run_id>/, keyed by step input hash
+    """
+
+    def __init__(self, checkpoint_dir: str = "pipeline_checkpoints"):
+        self.checkpoint_dir = checkpoint_dir
+        os.makedirs(checkpoint_dir, exist_ok=True)
+
+    @staticmethod
+    def hash_input(text: str) -> str:
+        """Stable hash of a step's input"""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def make_run_id(input_prompt: str, agent_sequence: List[str]) -> str:
+        """Derive a run id so retrying the same pipeline resumes it"""
+        key = json.dumps([input_prompt, agent_sequence])
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def _run_dir(self, run_id: str) -> str:
+        return os.path.join(self.checkpoint_dir, run_id)
+
+    def _step_path(self, run_id: str, step_index: int) -> str:
+        return os.path.join(self._run_dir(run_id), f"step_{step_index:03d}.json")
+
+    def save_step(self, run_id: str, step_index: int, agent_name: str,
+                  input_hash: str, result: Dict[str, Any]) -> None:
+        """Checkpoint a completed step (written atomically)"""
+        os.makedirs(self._run_dir(run_id), exist_ok=True)
+        checkpoint = {
+            "agent": agent_name,
+            "input_hash": input_hash,
+            "completed_at": datetime.now().isoformat(),
+            "result": _materialize(result)
+        }
+
+        path = self._step_path(run_id, step_index)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f, default=str)
+        os.replace(tmp_path, path)
+
+    def get_step(self, run_id: str, step_index: int, agent_name: str,
+                 input_hash: str, agent: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a checkpointed result if the step ran on exactly this input
+        (agent, when given, renders the result's report on demand)
+        """
+        path = self._step_path(run_id, step_index)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r") as f:
+                checkpoint = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        if checkpoint.get("agent") != agent_name or checkpoint.get("input_hash") != input_hash:
+            return None
+        return _restore(checkpoint["result"], agent)
+
+    def list_steps(self, run_id: str) -> List[str]:
+        """List checkpointed step files for a run"""
+        run_dir = self._run_dir(run_id)
+        if not os.path.isdir(run_dir):
+            return []
+        return sorted(name for name in os.listdir(run_dir) if name.endswith(".json"))
+
+    def clear(self, run_id: str) -> None:
+        """Remove all checkpoints for a run"""
+        shutil.rmtree(self._run_dir(run_id), ignore_errors=True)
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """sha256 of a file's contents, or None if it cannot be read"""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+class PipelineMemoStore:
+    """
+    Content-addressed store of pipeline step results
+    Steps are keyed by a fingerprint of their effective input, so an edited
+    prompt only re-executes the steps whose inputs actually changed. Agents
+    whose output also depends on other state declare it: ``shared_state_reads``
+    (pipeline shared-state keys) and ``state_files`` (files they read).
+    """
+
+    def __init__(self, memo_dir: str = "pipeline_memo"):
+        self.memo_dir = memo_dir
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        os.makedirs(memo_dir, exist_ok=True)
+
+    @staticmethod
+    def fingerprint(agent_name: str, agent: Any, step_input: str, tools: List[str],
+                    shared_state: Dict[str, Any]) -> str:
+        """Fingerprint a step from its agent, input, tools and the state it reads"""
+        reads = sorted(getattr(agent, "shared_state_reads", ()))
+        state_files = sorted(getattr(agent, "state_files", ()))
+        key = json.dumps({
+            "agent": agent_name,
+            "implementation": f"{type(agent).__module__}.{type(agent).__qualname__}",
+            "input": step_input,
+            "tools": sorted(tools),
+            "shared_state": {name: shared_state.get(name) for name in reads},
+            "state_files": {path: _file_digest(path) for path in state_files}
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _path(self, fingerprint: str) -> str:
+        return os.path.join(self.memo_dir, fingerprint[:2], f"{fingerprint}.json")
+
+    def get(self, fingerprint: str, agent: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of the stored result for a step fingerprint
+        (agent, when given, renders the result's report on demand)
+        """
+        if fingerprint in self._cache:
+            return _restore(copy.deepcopy(self._cache[fingerprint]), agent)
+
+        path = self._path(fingerprint)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r") as f:
+                result = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+        self._cache[fingerprint] = result
+        return _restore(copy.deepcopy(result), agent)
+
+    def put(self, fingerprint: str, result: Dict[str, Any]) -> None:
+        """Store a step result under its fingerprint (written atomically)"""
+        path = self._path(fingerprint)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        result = _materialize(result)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(result, f, default=str)
+        os.replace(tmp_path, path)
+        self._cache[fingerprint] = copy.deepcopy(result)
+
+    def clear(self) -> None:
+        """Drop every memoized step"""
+        self._cache.clear()
+        shutil.rmtree(self.memo_dir, ignore_errors=True)
+        os.makedirs(self.memo_dir, exist_ok=True)
@@ -0,0 +1,96 @@
+"""
+Pipeline Gates - Fusion v14
+Declarative quality gates evaluated between pipeline steps
+
+Gates are plain dicts so they can live in JSON config:
+    {"name": "done_after_review", "after_phase": "Leadership & Evaluation",
+     "metric": "evaluator.overall_score", "op": ">=", "value": 0.9, "action": "stop"}
+    {"name": "content_ready", "skip_phase": "Content & Communication",
+     "when_shared_state": "content_ready"}
+"""
+
+import json
+import operator
+from typing import Dict, Any, List, Optional
+
+OPERATORS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+
+class QualityGates:
+    """
+    Evaluates stop and skip gates against pipeline results and shared state
+    """
+
+    def __init__(self, gates: List[Dict[str, Any]], phases: Dict[str, List[str]] = None):
+        self.gates = gates
+        self.phases = phases or {}
+
+    @classmethod
+    def from_file(cls, path: str, phases: Dict[str, List[str]] = None) -> "QualityGates":
+        """Load gates from a JSON file holding a list of gate dicts"""
+        with open(path, "r") as f:
+            return cls(json.load(f), phases)
+
+    def _phase_of(self, agent_name: str) -> Optional[str]:
+        for phase, agents in self.phases.items():
+            if agent_name in agents:
+                return phase
+        return None
+
+    def _resolve(self, path: str, results: Dict[str, Any], shared_state: Dict[str, Any]) -> Any:
+        """Resolve 'agent.field' against results or 'shared_state.key' against shared state"""
+        head, _, rest = path.partition(".")
+        value = shared_state if head == "shared_state" else results.get(head)
+        for part in rest.split(".") if rest else []:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
+    def _condition_met(self, gate: Dict[str, Any], results: Dict[str, Any],
+                       shared_state: Dict[str, Any]) -> bool:
+        if "when_shared_state" in gate and not shared_state.get(gate["when_shared_state"]):
+            return False
+        if "metric" in gate:
+            value = self._resolve(gate["metric"], results, shared_state)
+            if value is None:
+                return False
+            try:
+                return OPERATORS[gate.get("op", ">=")](value, gate["value"])
+            except TypeError:
+                return False
+        return "when_shared_state" in gate
+
+    def check_skip(self, agent_name: str, results: Dict[str, Any],
+                   shared_state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the gate that skips this agent before it runs, if any"""
+        phase = self._phase_of(agent_name)
+        for gate in self.gates:
+            applies = (gate.get("skip_agent") == agent_name or
+                       (phase is not None and gate.get("skip_phase") == phase))
+            if applies and self._condition_met(gate, results, shared_state):
+                return gate
+        return None
+
+    def check_stop(self, agent_name: str, remaining_agents: List[str], results: Dict[str, Any],
+                   shared_state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the gate that stops the pipeline after this agent, if any"""
+        phase = self._phase_of(agent_name)
+        phase_finished = phase is not None and not any(
+            self._phase_of(name) == phase for name in remaining_agents)
+
+        for gate in self.gates:
+            if gate.get("action", "stop") != "stop" or "skip_phase" in gate or "skip_agent" in gate:
+                continue
+            applies = (gate.get("after") == agent_name or
+                       (phase_finished and gate.get("after_phase") == phase))
+            if applies and self._condition_met(gate, results, shared_state):
+                return gate
+        return None
@@ -0,0 +1,80 @@
+"""
+Pipeline Handoff - Fusion v14
+Size-budgeted handoff between pipeline steps
+
+Each step receives the original prompt plus a compact digest of upstream
+results instead of the previous agent's full markdown output, so per-step
+input stays bounded however long the pipeline is. Full outputs remain in
+the pipeline result.
+"""
+
+import re
+from collections import deque
+from typing import Dict, Any
+
+_SECTION_RE = re.compile(r"^#{1,6}\s+(.*)$")
+
+
+class PipelineHandoff:
+    """
+    Builds the next step's input from the original prompt and an upstream digest
+    """
+
+    def __init__(self, original_prompt: str, max_digest_chars: int = 1500,
+                 per_agent_chars: int = 240):
+        self.original_prompt = original_prompt
+        self.max_digest_chars = max_digest_chars
+        self.per_agent_chars = per_agent_chars
+        self.entries = deque()
+        self.digest_chars = 0
+        self.omitted = 0
+
+    def summarize(self, agent_name: str, result: Dict[str, Any]) -> str:
+        """One-line digest entry for an agent result"""
+        text = result.get("output") or result.get("enhanced_output") or result.get("error") or ""
+        summary = self._extract_summary(str(text))
+        if len(summary) > self.per_agent_chars:
+            summary = summary[:self.per_agent_chars - 3].rstrip() + "..."
+
+        confidence = result.get("confidence")
+        label = f"{agent_name} (confidence {confidence:.2f})" if isinstance(confidence, (int, float)) else agent_name
+        return f"- {label}: {summary}"
+
+    def _extract_summary(self, text: str) -> str:
+        """Keep the substantive lines, dropping headings and the echoed request"""
+        lines = []
+        in_original_request = False
+        for line in text.splitlines():
+            stripped = line.strip()
+            heading = _SECTION_RE.match(stripped)
+            if heading:
+                in_original_request = heading.group(1).strip().lower() == "original request"
+                continue
+            if not stripped or in_original_request or stripped.startswith("*Generated"):
+                continue
+            lines.append(stripped)
+            if sum(len(part) + 1 for part in lines) >= self.per_agent_chars:
+                break
+        return " ".join(lines)
+
+    def add(self, agent_name: str, result: Dict[str, Any]) -> None:
+        """Add an upstream result, evicting the oldest entries beyond the budget"""
+        entry = self.summarize(agent_name, result)
+        self.entries.append(entry)
+        self.digest_chars += len(entry) + 1
+
+        while len(self.entries) > 1 and self.digest_chars > self.max_digest_chars:
+            self.digest_chars -= len(self.entries.popleft()) + 1
+            self.omitted += 1
+
+    def _digest(self) -> str:
+        digest = list(self.entries)
+        if self.omitted:
+            digest.insert(0, f"- ({self.omitted} earlier results omitted)")
+        return "\n".join(digest)
+
+    def next_input(self) -> str:
+        """Input for the next pipeline step"""
+        if not self.entries:
+            return self.original_prompt
+        return f"{self.original_prompt}\n\n## Upstream Agent Digest\n" + self._digest()
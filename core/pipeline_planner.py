@@ -0,0 +1,105 @@
+"""
+Pipeline Planner - Fusion v14
+Plans which pipeline agents to run under a latency budget
+"""
+
+import re
+from typing import Dict, Any, List, Iterable, Optional
+
+
+def parse_deadline(value: str) -> float:
+    """Parse a deadline such as '2s', '1500ms' or '2.5' into seconds"""
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*(ms|s|m)?\s*", value)
+    if not match:
+        raise ValueError(f"Invalid deadline: {value}")
+    amount, unit = float(match.group(1)), match.group(2) or "s"
+    return amount * {"ms": 0.001, "s": 1.0, "m": 60.0}[unit]
+
+
+class PipelinePlanner:
+    """
+    Deadline-aware pipeline planner
+    Uses historical per-agent latency and confidence to pick the agents that
+    fit a latency budget, keeping the original sequence order
+    """
+
+    def __init__(self, agent_stats: Dict[str, Dict[str, float]] = None,
+                 default_latency: float = 0.5, default_value: float = 0.5,
+                 max_parallelism: int = 1):
+        self.agent_stats = agent_stats or {}
+        self.default_latency = default_latency
+        self.default_value = default_value
+        self.max_parallelism = max(1, max_parallelism)
+
+    def estimate_latency(self, agent_name: str) -> float:
+        """Expected latency of an agent in seconds"""
+        return self.agent_stats.get(agent_name, {}).get("avg_latency", self.default_latency)
+
+    def estimate_value(self, agent_name: str) -> float:
+        """Expected confidence contribution of an agent"""
+        return self.agent_stats.get(agent_name, {}).get("avg_confidence", self.default_value)
+
+    def _stages(self, agents: List[Any]) -> List[List[Any]]:
+        return [agents[i:i + self.max_parallelism]
+                for i in range(0, len(agents), self.max_parallelism)]
+
+    def _cost(self, agents: List[str]) -> float:
+        return sum(max(self.estimate_latency(name) for name in stage)
+                   for stage in self._stages(agents))
+
+    def plan(self, agent_sequence: List[str], deadline: float,
+             required: Iterable[str] = ()) -> Dict[str, Any]:
+        """Select and stage agents so the estimated pipeline time fits the deadline"""
+        required = [name for name in agent_sequence if name in set(required)]
+        selected = set(required)
+
+        # Best value per second first; ties keep pipeline order
+        optional = [name for name in agent_sequence if name not in selected]
+        optional.sort(key=lambda name: self.estimate_value(name) / max(self.estimate_latency(name), 1e-6),
+                      reverse=True)
+
+        for agent_name in optional:
+            candidate = [name for name in agent_sequence if name in selected or name == agent_name]
+            if self._cost(candidate) <= deadline:
+                selected.add(agent_name)
+
+        # Positions in agent_sequence identify steps when an agent appears twice
+        positions = [i for i, name in enumerate(agent_sequence) if name in selected]
+        ordered = [agent_sequence[i] for i in positions]
+        return {
+            "deadline": deadline,
+            "stages": self._stages(ordered),
+            "stage_positions": self._stages(positions),
+            "selected": ordered,
+            "skipped": [name for name in agent_sequence if name not in selected],
+            "required": required,
+            "estimated_time": self._cost(ordered) if ordered else 0.0
+        }
+
+    @staticmethod
+    def stats_from_events(events: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+        """Aggregate per-agent latency and confidence from telemetry events"""
+        totals: Dict[str, Dict[str, float]] = {}
+        for event in events:
+            if "agent" not in event or event.get("type") or event.get("fallback"):
+                continue
+            agent_totals = totals.setdefault(event["agent"], {"runs": 0, "latency": 0.0, "confidence": 0.0})
+            agent_totals["runs"] += 1
+            agent_totals["latency"] += event.get("execution_time", 0.0)
+            agent_totals["confidence"] += event.get("confidence", 0.0)
+
+        return {
+            agent_name: {
+                "runs": agent_totals["runs"],
+                "avg_latency": agent_totals["latency"] / agent_totals["runs"],
+                "avg_confidence": agent_totals["confidence"] / agent_totals["runs"]
+            }
+            for agent_name, agent_totals in totals.items()
+        }
+
+    @classmethod
+    def from_telemetry(cls, telemetry, history_limit: Optional[int] = 50,
+                       **options) -> "PipelinePlanner":
+        """Build a planner from the current session plus saved telemetry sessions"""
+        events = list(telemetry.load_history(history_limit)) + list(telemetry.events)
+        return cls(cls.stats_from_events(events), **options)
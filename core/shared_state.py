@@ -0,0 +1,133 @@
+"""
+Shared State - Fusion v14
+Versioned, copy-on-write shared state for concurrently running agents
+
+Every commit publishes a new dict and bumps the version; published dicts are
+never mutated, so a snapshot stays consistent while other agents commit.
+Writes are applied against the version the writer read. When a key changed
+after that version, the key's merge rule decides the outcome:
+
+    last_writer_wins   - the later commit replaces the value (default)
+    first_writer_wins  - the existing value is kept
+    merge              - dicts are merged and lists concatenated
+    error              - SharedStateConflict is raised
+"""
+
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Optional
+
+MERGE_RULES = ("last_writer_wins", "first_writer_wins", "merge", "error")
+
+
+class SharedStateConflict(RuntimeError):
+    """Raised when concurrent writes to a key with the 'error' rule collide"""
+
+
+class StateSnapshot(Mapping):
+    """Read-only view of the shared state at one version"""
+
+    def __init__(self, data: Dict[str, Any], version: int):
+        self._data = MappingProxyType(data)
+        self.version = version
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"StateSnapshot(version={self.version}, keys={list(self._data)})"
+
+
+class VersionedSharedState(Mapping):
+    """
+    Copy-on-write shared state store
+    Reads see the latest published version; snapshot() pins one for a batch of agents
+    """
+
+    def __init__(self, initial: Optional[Dict[str, Any]] = None,
+                 merge_rules: Optional[Dict[str, str]] = None,
+                 default_rule: str = "last_writer_wins"):
+        for rule in list((merge_rules or {}).values()) + [default_rule]:
+            if rule not in MERGE_RULES:
+                raise ValueError(f"Unknown shared state merge rule: {rule}")
+        self.merge_rules = dict(merge_rules or {})
+        self.default_rule = default_rule
+        self.version = 0
+        self._data: Dict[str, Any] = dict(initial or {})
+        self._key_versions: Dict[str, int] = {key: 0 for key in self._data}
+        self._writers: Dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> StateSnapshot:
+        """Consistent view of the current version"""
+        return StateSnapshot(self._data, self.version)
+
+    def commit(self, writes: Dict[str, Any], base_version: Optional[int] = None,
+               writer: Optional[str] = None) -> int:
+        """Apply writes made against base_version; returns the new version"""
+        with self._lock:
+            base = self.version if base_version is None else base_version
+            data = dict(self._data)
+            next_version = self.version + 1
+
+            for key, value in writes.items():
+                if key in data and self._key_versions.get(key, 0) > base:
+                    rule = self.merge_rules.get(key, self.default_rule)
+                    if rule == "first_writer_wins":
+                        continue
+                    if rule == "error":
+                        raise SharedStateConflict(
+                            f"Shared state key '{key}' written by {self._writers.get(key)} "
+                            f"and {writer} since version {base}")
+                    if rule == "merge":
+                        value = self._merge(data[key], value)
+                data[key] = value
+                self._key_versions[key] = next_version
+                self._writers[key] = writer
+
+            self._data = data
+            self.version = next_version
+            return next_version
+
+    @staticmethod
+    def _merge(current: Any, incoming: Any) -> Any:
+        if isinstance(current, dict) and isinstance(incoming, dict):
+            return {**current, **incoming}
+        if isinstance(current, list) and isinstance(incoming, list):
+            return current + [item for item in incoming if item not in current]
+        return incoming
+
+    def set(self, key: str, value: Any, writer: Optional[str] = None) -> int:
+        return self.commit({key: value}, writer=writer)
+
+    def update(self, values: Dict[str, Any]) -> int:
+        return self.commit(values)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data = {}
+            self._key_versions.clear()
+            self._writers.clear()
+            self.version += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"VersionedSharedState(version={self.version}, keys={list(self._data)})"
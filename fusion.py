@@ -23,8 +23,61 @@ from core.execution_orchestrator_v14 import ExecutionOrchestrator
 # Import Sprint 5-9 components
 from synthetic_reasoner_agent import SyntheticReasonerAgent
 
+from core.pipeline_gates import QualityGates
+from fusion_core.memory.state_snapshot import load_json
+
 print("🧠 DEBUG: fusion.py top-level code executed")
 
+# Pipeline phases in execution order
+PIPELINE_PHASES = {
+    "Strategy & Planning": [
+        "strategy_pilot",      # Strategic planning
+        "product_navigator",   # Product strategy
+        "market_analyst",      # Market analysis
+        "product_historian",   # Product context
+    ],
+    "Design & Creative": [
+        "creative_director",   # Creative vision
+        "vp_design",          # Design analysis
+        "design_technologist", # Technical design
+        "principal_designer",  # Principal expertise
+        "component_librarian", # Component system
+    ],
+    "Content & Communication": [
+        "content_designer",    # Content creation
+        "ai_interaction_designer", # AI interactions
+        "deck_narrator",      # Presentations
+        "portfolio_editor",    # Portfolio management
+    ],
+    "Research & Analysis": [
+        "research_summarizer", # Research synthesis
+        "strategy_archivist",  # Strategy documentation
+        "feedback_amplifier",  # Feedback processing
+    ],
+    "Leadership & Evaluation": [
+        "vp_of_design",       # VP Design review
+        "vp_of_product",      # VP Product review
+        "evaluator",          # Final evaluation
+    ],
+    "Intelligence & Orchestration": [
+        "prompt_master",      # Pattern optimization
+        "dispatcher",         # Final coordination
+        "workflow_optimizer"  # Workflow optimization
+    ],
+}
+
+# Skip the orchestration phase when the evaluation is already excellent
+DEFAULT_PIPELINE_GATES = [
+    {
+        "name": "evaluation_complete",
+        "after_phase": "Leadership & Evaluation",
+        "metric": "evaluator.overall_score",
+        "op": ">=",
+        "value": 0.9,
+        "action": "stop"
+    }
+]
+
 def main():
     parser = argparse.ArgumentParser(description="Fusion v14 CLI")
     subparsers = parser.add_subparsers(dest="command")
@@ -36,6 +89,24 @@ def main():
 
     # 'pipeline' command: full pipeline execution
     pipeline_parser = subparsers.add_parser("pipeline", help="Run pipeline with prompt")
+    pipeline_parser.add_argument("--run-id", type=str, default=None,
+                                 help="Pipeline run id to resume (defaults to a hash of the input)")
+    pipeline_parser.add_argument("--no-resume", action="store_true",
+                                 help="Ignore checkpoints from earlier attempts")
+    pipeline_parser.add_argument("--incremental", action="store_true",
+                                 help="Reuse stored results for steps whose input is unchanged")
+    pipeline_parser.add_argument("--deadline", type=str, default=None,
+                                 help="Latency budget such as 2s or 1500ms; optional agents are skipped to meet it")
+    pipeline_parser.add_argument("--parallelism", type=int, default=1,
+                                 help="Maximum agents run concurrently when planning for a deadline")
+    pipeline_parser.add_argument("--require", type=str, default="",
+                                 help="Comma-separated agents that always run under a deadline")
+    pipeline_parser.add_argument("--gates", type=str, default=None,
+                                 help="JSON file with quality gates evaluated between steps")
+    pipeline_parser.add_argument("--no-gates", action="store_true",
+                                 help="Run every step even when a quality gate is met")
+    pipeline_parser.add_argument("--handoff", choices=("digest", "chain"), default="digest",
+                                 help="Pass each step a bounded upstream digest or the previous agent's full output")
     pipeline_parser.add_argument("input", nargs=argparse.REMAINDER, help="Pipeline input")
 
     # Parse args
@@ -92,7 +163,8 @@ def main():
             agent_class = agent_map[args.agent]
             agent = agent_class()
             output = asyncio.run(agent.run_async(input_text, {}))
-            print(f"🎨 Output from {args.agent}:\n{output}")
+            # The CLI shows the rendered markdown report; errors print as-is
+            print(f"🎨 Output from {args.agent}:\n{output.get('output') or output}")
         else:
             print(f"❌ Error: Unknown agent '{args.agent}'")
             print(f"Available agents: {', '.join(agent_map.keys())}")
@@ -107,8 +179,17 @@ def main():
         print(f"⚙️ Running pipeline on: {input_text}")
 
         from core.fusion_context import FusionContext
+        from core.pipeline_checkpoint import PipelineCheckpointStore, PipelineMemoStore
+        from core.pipeline_planner import PipelinePlanner, parse_deadline
+        from fusion_core.telemetry.agent_telemetry import AgentTelemetryLogger
         context = FusionContext({})
-        orchestrator = ExecutionOrchestrator(context)
+        telemetry = AgentTelemetryLogger()
+        orchestrator = ExecutionOrchestrator(
+            context,
+            telemetry=telemetry,
+            checkpoint_store=PipelineCheckpointStore(),
+            memo_store=PipelineMemoStore() if args.incremental else None
+        )
         
         # Register agents and tools
         from tools.ux_audit_tool import UXAuditTool
@@ -159,47 +240,39 @@ def main():
         
         # Define smart agent sequence for pipeline
         # This ensures all 22 agents are used in a logical order
-        agent_sequence = [
-            # 1. Strategy & Planning Phase
-            "strategy_pilot",      # Strategic planning
-            "product_navigator",   # Product strategy
-            "market_analyst",      # Market analysis
-            "product_historian",   # Product context
-            
-            # 2. Design & Creative Phase
-            "creative_director",   # Creative vision
-            "vp_design",          # Design analysis
-            "design_technologist", # Technical design
-            "principal_designer",  # Principal expertise
-            "component_librarian", # Component system
-            
-            # 3. Content & Communication Phase
-            "content_designer",    # Content creation
-            "ai_interaction_designer", # AI interactions
-            "deck_narrator",      # Presentations
-            "portfolio_editor",    # Portfolio management
-            
-            # 4. Research & Analysis Phase
-            "research_summarizer", # Research synthesis
-            "strategy_archivist",  # Strategy documentation
-            "feedback_amplifier",  # Feedback processing
-            
-            # 5. Leadership & Evaluation Phase
-            "vp_of_design",       # VP Design review
-            "vp_of_product",      # VP Product review
-            "evaluator",          # Final evaluation
-            
-            # 6. Intelligence & Orchestration Phase
-            "prompt_master",      # Pattern optimization
-            "dispatcher",         # Final coordination
-            "workflow_optimizer"  # Workflow optimization
-        ]
+        agent_sequence = [agent for agents in PIPELINE_PHASES.values() for agent in agents]
+        
+        # Quality gates let the pipeline stop once the result is already good enough
+        gates = None
+        if args.gates:
+            gates = QualityGates.from_file(args.gates, PIPELINE_PHASES)
+        elif not args.no_gates:
+            gates = QualityGates(DEFAULT_PIPELINE_GATES, PIPELINE_PHASES)
         
         print(f"\n🚀 Executing pipeline with {len(agent_sequence)} agents in sequence:")
         for i, agent in enumerate(agent_sequence, 1):
             print(f"  {i:2d}. {agent}")
         
-        output = asyncio.run(orchestrator.execute_pipeline(input_text, agent_sequence))
+        deadline = parse_deadline(args.deadline) if args.deadline else None
+        planner = (PipelinePlanner.from_telemetry(telemetry, max_parallelism=args.parallelism)
+                   if deadline is not None else None)
+        required_agents = [name.strip() for name in args.require.split(",") if name.strip()]
+        
+        output = asyncio.run(orchestrator.execute_pipeline(
+            input_text, agent_sequence, run_id=args.run_id, resume=not args.no_resume,
+            deadline=deadline, required_agents=required_agents, planner=planner, gates=gates,
+            handoff=args.handoff))
+        telemetry.save()
+        for gate in output.get("triggered_gates", []):
+            print(f"🚦 Gate {gate['gate']} triggered after {gate['agent']}: {gate['action']}")
+        if output.get("plan"):
+            plan = output["plan"]
+            print(f"⏱️ Planned {len(plan['selected'])} agents for a {plan['deadline']:.2f}s deadline "
+                  f"(estimated {plan['estimated_time']:.2f}s), skipped: {', '.join(plan['skipped']) or 'none'}")
+        if output.get("resumed_steps"):
+            print(f"♻️ Resumed {len(output['resumed_steps'])} steps from checkpoints")
+        if output.get("reused_steps"):
+            print(f"♻️ Reused {len(output['reused_steps'])} unchanged steps")
         print(f"🧩 Pipeline Output:\n{output}")
 
     else:
@@ -254,8 +327,7 @@ def get_agent_by_name(agent_name: str):
 def get_fallback_config():
     """Load fallback configuration"""
     try:
-        with open("fallback_trigger_config.json", "r") as f:
-            return json.load(f)
+        return load_json("fallback_trigger_config.json")
     except FileNotFoundError:
         return {
             "risk_threshold": 0.65,
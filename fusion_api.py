@@ -17,9 +17,13 @@ from agents.workflow_optimizer_agent import WorkflowOptimizerAgent
 from agents.creative_director_agent import CreativeDirectorAgent
 
 # Import Fusion core components
-from fusion_core.memory.agent_memory import AgentMemory
+from fusion_core.memory.handle_cache import MemoryHandleCache
+from fusion_core.memory.state_snapshot import load_json
 from fusion_core.telemetry.agent_telemetry import AgentTelemetryLogger
 from fusion_core.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
+from fusion_core.orchestration.circuit_breaker import CircuitBreakerRegistry
+from fusion_core.orchestration.result_cache import ResultCache
+from agents.agent_result import AgentResult
 
 app = FastAPI(title="Fusion v15 API", version="15.0.0")
 
@@ -38,11 +42,13 @@ class RunRequest(BaseModel):
     input: str
     use_memory: bool = True
     use_telemetry: bool = True
+    render_markdown: bool = False
 
 class ParallelRunRequest(BaseModel):
     agents: List[str]
     input: str
     use_evaluator: bool = True
+    render_markdown: bool = False
 
 class AgentStatus(BaseModel):
     agent: str
@@ -51,8 +57,16 @@ class AgentStatus(BaseModel):
     capabilities: List[str]
 
 # Initialize Fusion components
-telemetry_logger = AgentTelemetryLogger()
+telemetry_logger = AgentTelemetryLogger(max_events=int(os.getenv("FUSION_TELEMETRY_RETENTION", "10000")))
+circuit_breakers = CircuitBreakerRegistry()
+result_cache = ResultCache(
+    max_entries=int(os.getenv("FUSION_CACHE_SIZE", "1024")),
+    similarity_threshold=float(os.getenv("FUSION_CACHE_SIMILARITY", "1.0")),
+    ttl=float(os.getenv("FUSION_CACHE_TTL", "600"))
+)
 memory_manager = None  # Will be initialized per agent if needed
+# Open AgentMemory handles are reused across requests instead of re-parsed per call
+memory_handles = MemoryHandleCache(max_handles=int(os.getenv("FUSION_MEMORY_HANDLES", "64")))
 
 # Initialize agents
 agent_map = {
@@ -69,19 +83,20 @@ orchestrator = MultiAgentOrchestrator(
     agents=agent_map,
     evaluator_agent=agent_map.get("evaluator"),
     telemetry_logger=telemetry_logger,
-    memory_manager=memory_manager
+    memory_manager=memory_manager,
+    execution_backend=os.getenv("FUSION_EXECUTION_BACKEND", "async"),
+    circuit_breakers=circuit_breakers,
+    result_cache=result_cache
 )
 
-# Load agent manifest
+# Load agent manifest per request from the shared snapshot, so every worker
+# serves the currently published version instead of a copy from startup
 def load_agent_manifest():
     try:
-        with open("agent_manifest.json", "r") as f:
-            return json.load(f)
+        return load_json("agent_manifest.json")
     except FileNotFoundError:
         return {"agents": {}, "system_capabilities": {}}
 
-agent_manifest = load_agent_manifest()
-
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
@@ -109,7 +124,7 @@ async def run_agent(req: RunRequest):
     # Initialize memory if requested
     memory = None
     if req.use_memory:
-        memory = AgentMemory(req.agent)
+        memory = memory_handles.get(req.agent)
     
     try:
         # Run agent
@@ -130,7 +145,7 @@ async def run_agent(req: RunRequest):
                 output_text=output
             )
         
-        return {
+        response = {
             "agent": req.agent,
             "output": output,
             "success": True,
@@ -138,6 +153,12 @@ async def run_agent(req: RunRequest):
             "telemetry_enabled": req.use_telemetry
         }
         
+        # Structured fields only; the markdown report is rendered on request
+        if req.render_markdown and isinstance(output, AgentResult):
+            response["markdown"] = output.render()
+        
+        return response
+        
     except Exception as e:
         # Log error
         if req.use_telemetry:
@@ -150,6 +171,12 @@ async def run_agent(req: RunRequest):
         
         raise HTTPException(status_code=500, detail=f"Agent execution failed: {str(e)}")
 
+def _with_markdown(agent_result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """An orchestrator result plus a "markdown" copy of its structured output's report"""
+    if agent_result and isinstance(agent_result.get("output"), AgentResult):
+        return {**agent_result, "markdown": agent_result["output"].render()}
+    return agent_result
+
 @app.post("/run_parallel")
 async def run_parallel_agents(req: ParallelRunRequest):
     """Run multiple agents in parallel"""
@@ -165,11 +192,16 @@ async def run_parallel_agents(req: ParallelRunRequest):
         # Run parallel execution
         result = await orchestrator.run_parallel(req.input, req.agents)
         
+        top_result, all_results = result.get("top_result"), result.get("all_results")
+        if req.render_markdown:
+            top_result = _with_markdown(top_result)
+            all_results = [_with_markdown(agent_result) for agent_result in all_results or []]
+        
         return {
             "input": req.input,
             "agents": req.agents,
-            "top_result": result.get("top_result"),
-            "all_results": result.get("all_results"),
+            "top_result": top_result,
+            "all_results": all_results,
             "evaluations": result.get("evaluations"),
             "execution_time": result.get("execution_time"),
             "agent_count": result.get("agent_count")
@@ -181,6 +213,7 @@ async def run_parallel_agents(req: ParallelRunRequest):
 @app.get("/agents")
 async def list_agents():
     """List all available agents with their capabilities"""
+    agent_manifest = load_agent_manifest()
     agents_info = {}
     
     for agent_name, agent in agent_map.items():
@@ -210,6 +243,7 @@ async def system_status():
     
     # Get telemetry stats
     telemetry_stats = telemetry_logger.get_session_stats()
+    agent_manifest = load_agent_manifest()
     
     return {
         "system": {
@@ -221,6 +255,9 @@ async def system_status():
         },
         "agents": agent_status,
         "telemetry": telemetry_stats,
+        "circuit_breakers": circuit_breakers.get_status(),
+        "result_cache": result_cache.get_status(),
+        "memory_handles": memory_handles.get_status(),
         "manifest": {
             "version": agent_manifest.get("system_info", {}).get("version", "unknown"),
             "capabilities": agent_manifest.get("system_capabilities", {})
@@ -228,19 +265,24 @@ async def system_status():
     }
 
 @app.get("/memory/{agent_name}")
-async def get_agent_memory(agent_name: str, limit: int = 10):
-    """Get memory for a specific agent"""
+async def get_agent_memory(agent_name: str, limit: int = 10, cursor: Optional[str] = None):
+    """Get a page of memory for a specific agent (pass next_cursor to page back in time)"""
     if agent_name not in agent_map:
         raise HTTPException(status_code=404, detail=f"Agent '{agent_name}' not found")
+    if limit < 1:
+        raise HTTPException(status_code=400, detail="limit must be at least 1")
+    if cursor is not None and not cursor.isdigit():
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
     
     try:
-        memory = AgentMemory(agent_name)
-        recent_memory = memory.get_last(limit)
+        memory = memory_handles.get(agent_name)
+        recent_memory, next_cursor = memory.get_page(int(cursor) if cursor else None, limit)
         metadata = memory.get_metadata()
         
         return {
             "agent": agent_name,
             "recent_memory": recent_memory,
+            "next_cursor": str(next_cursor) if next_cursor is not None else None,
             "metadata": metadata,
             "memory_count": len(memory.data["history"])
         }
@@ -269,7 +311,7 @@ async def export_telemetry(format: str = "json"):
     try:
         if format == "json":
             data = telemetry_logger.save()
-            return data
+            return {**data, "events": list(telemetry_logger.events)}
         elif format == "csv":
             csv_path = f"telemetry_export_{telemetry_logger.session_id}.csv"
             telemetry_logger.export_to_csv(csv_path)
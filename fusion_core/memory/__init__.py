@@ -1,5 +1,6 @@
 # fusion_core/memory/__init__.py
 
 from .agent_memory import AgentMemory
+from .ring_buffer import RingBuffer, jsonl_spill
 
-__all__ = ["AgentMemory"] 
\ No newline at end of file
+__all__ = ["AgentMemory", "RingBuffer", "jsonl_spill"] 
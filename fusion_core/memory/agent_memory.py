@@ -2,32 +2,122 @@
 
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
+from .near_duplicates import MinHashLSH
+from .output_codec import OutputCodec
+from .segments import SegmentStore, TieredHistory
+from .trigram_index import TrigramIndex
+
 class AgentMemory:
-    def __init__(self, agent_name: str, memory_dir="fusion_memory"):
+    def __init__(self, agent_name: str, memory_dir="fusion_memory", duplicate_threshold: float = 0.9,
+                 hot_limit: int = 200, segment_size: int = 500, compress_outputs: bool = True):
         self.agent_name = agent_name
+        self.duplicate_threshold = duplicate_threshold
+        self._duplicates = None
+        self._search_index = None
+        # Metadata and running counters; the hot history is an append-only JSONL log
         self.memory_path = os.path.join(memory_dir, f"{agent_name}.json")
+        self.history_path = os.path.join(memory_dir, f"{agent_name}.history.jsonl")
+        # Only the hot tail lives in the log; older entries are compressed segments
+        self.segments_dir = os.path.join(memory_dir, f"{agent_name}.segments")
+        self.hot_limit = hot_limit
+        self.segment_size = segment_size
+        # Outputs are templated per agent, so each agent trains its own dictionary
+        self.codec = OutputCodec(os.path.join(memory_dir, f"{agent_name}.dicts")) if compress_outputs else None
         os.makedirs(memory_dir, exist_ok=True)
         self._load()
 
     def _load(self):
-        """Load existing memory or create new memory file"""
+        """Load existing memory (metadata and hot tail) or create new memory files"""
+        legacy_history = self._load_metadata()
+        hot = self._read_log() if legacy_history is None else legacy_history
+        if self.codec:
+            self.codec.decode_entries(hot)
+            for entry in hot:
+                self.codec.observe(entry["output"])
+        
+        self.data["history"] = TieredHistory(SegmentStore(self.segments_dir), hot,
+                                             self.hot_limit, self.segment_size,
+                                             summarize=self._summarize_segment)
+        
+        # Files written before the split hold history inside the metadata file,
+        # possibly untiered; move it to the log and segments once
+        if legacy_history is not None:
+            self.data["history"].compact()
+            self._migrate_counters()
+            self._rewrite_log()
+            self._save_metadata()
+        elif self.data["history"].compact():
+            self._rewrite_log()
+        self._signature = self.file_signature()
+
+    @staticmethod
+    def _summarize_segment(entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return {"successes": sum(1 for entry in entries
+                                 if entry.get("metadata", {}).get("success", True))}
+
+    def _load_metadata(self):
+        """Load the metadata file; returns the embedded history of a legacy file, else None"""
         if os.path.exists(self.memory_path):
             with open(self.memory_path, "r") as f:
                 self.data = json.load(f)
-        else:
-            self.data = {
-                "agent_name": self.agent_name,
-                "created_at": datetime.now().isoformat(),
-                "history": [],
-                "metadata": {
-                    "total_runs": 0,
-                    "last_run": None,
-                    "success_rate": 0.0
-                }
+            return self.data.pop("history", None)
+        
+        self.data = {
+            "agent_name": self.agent_name,
+            "created_at": datetime.now().isoformat(),
+            "metadata": {
+                "total_runs": 0,
+                "last_run": None,
+                "success_rate": 0.0,
+                "successes": 0
             }
+        }
+        return None
+
+    def _migrate_counters(self):
+        """Seed the running success counter from a legacy history (one full pass)"""
+        history = self.data["history"]
+        self.data["metadata"]["successes"] = (
+            sum(stats.get("successes", 0) for stats in history.store.stats()) +
+            self._summarize_segment(history.hot)["successes"])
+
+    def _read_log(self) -> List[Dict[str, Any]]:
+        """Replay the hot log: entry records, plus occurrence updates to earlier entries"""
+        hot: List[Dict[str, Any]] = []
+        if not os.path.exists(self.history_path):
+            return hot
+        cold_count = SegmentStore(self.segments_dir).count
+        with open(self.history_path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if "occurrence_of" in record:
+                    original = hot[record["occurrence_of"] - cold_count]
+                    original["occurrences"] = original.get("occurrences", 1) + 1
+                    original["last_seen"] = record["timestamp"]
+                else:
+                    hot.append(record)
+        return hot
+
+    def _encode_record(self, entry: Dict[str, Any]) -> str:
+        if self.codec and "output" in entry:
+            entry = {**entry, "output": self.codec.encode(entry["output"])}
+        return json.dumps(entry, default=str) + "\n"
+
+    def _append_log(self, record: Dict[str, Any]):
+        with open(self.history_path, "a") as f:
+            f.write(self._encode_record(record))
+
+    def _rewrite_log(self):
+        """Rewrite the log as the current hot tail (only after entries move to segments)"""
+        tmp_path = f"{self.history_path}.tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(self._encode_record(entry) for entry in self.data["history"].hot)
+        os.replace(tmp_path, self.history_path)
 
     def append(self, input_text: str, output_text: str, metadata: Dict[str, Any] = None):
         """Append a new interaction to memory"""
@@ -38,27 +128,102 @@ class AgentMemory:
             "metadata": metadata or {}
         }
         
-        self.data["history"].append(entry)
-        self.data["metadata"]["total_runs"] += 1
-        self.data["metadata"]["last_run"] = datetime.now().isoformat()
+        counters = self.data["metadata"]
+        counters["total_runs"] += 1
+        counters["last_run"] = datetime.now().isoformat()
+        
+        # A near-duplicate input with the same output is counted on the original
+        # entry; one with a different output is stored and linked to it
+        index = self._duplicate_index()
+        matches = index.query(input_text)
+        if matches:
+            original = self.data["history"][matches[0][0]]
+            if original["output"] == output_text:
+                original["occurrences"] = original.get("occurrences", 1) + 1
+                original["last_seen"] = entry["timestamp"]
+                self._append_log({"occurrence_of": matches[0][0], "timestamp": entry["timestamp"]})
+                self._save_metadata()
+                return
+            entry["duplicate_of"] = matches[0][0]
+        
+        if self.codec:
+            self.codec.observe(output_text)
         
-        # Calculate success rate (simple heuristic)
-        if len(self.data["history"]) > 0:
-            successful_runs = sum(1 for entry in self.data["history"] 
-                               if entry.get("metadata", {}).get("success", True))
-            self.data["metadata"]["success_rate"] = successful_runs / len(self.data["history"])
+        history = self.data["history"]
+        if history.append(entry):
+            # Entries moved to cold segments; the duplicate index only covers the hot tier
+            self._duplicates = None
+            self._rewrite_log()
+        else:
+            self._append_log(entry)
+            if "duplicate_of" not in entry:
+                index.add(len(history) - 1, input_text)
+        if self._search_index is not None:
+            self._search_index.add(len(history) - 1, (input_text, output_text))
+        
+        # Running counter keeps the success rate O(1) per run
+        counters["successes"] = counters.get("successes", 0) + self._summarize_segment([entry])["successes"]
+        counters["success_rate"] = counters["successes"] / len(history)
         
-        self._save()
+        self._save_metadata()
+
+    def _duplicate_index(self) -> MinHashLSH:
+        """LSH index over hot inputs, built on first use"""
+        if self._duplicates is None:
+            history = self.data["history"]
+            self._duplicates = MinHashLSH(self.duplicate_threshold)
+            for offset, entry in enumerate(history.hot):
+                if "duplicate_of" not in entry:
+                    self._duplicates.add(history.cold_count + offset, entry["input"])
+        return self._duplicates
 
-    def _save(self):
-        """Save memory to disk"""
-        with open(self.memory_path, "w") as f:
-            json.dump(self.data, f, indent=2)
+    def _trigram_index(self) -> TrigramIndex:
+        """Trigram index over inputs and outputs, built on first search and kept current"""
+        if self._search_index is None:
+            self._search_index = TrigramIndex()
+            for position, entry in enumerate(self.data["history"]):
+                self._search_index.add(position, (entry["input"], entry["output"]))
+        return self._search_index
+
+    def _save_metadata(self):
+        """Save metadata and counters (history is persisted by the log)"""
+        tmp_path = f"{self.memory_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({key: value for key, value in self.data.items() if key != "history"}, f, indent=2)
+        os.replace(tmp_path, self.memory_path)
+        self._signature = self.file_signature()
+
+    def file_signature(self) -> Tuple[Tuple[int, int], ...]:
+        """(mtime, size) of the backing files, to detect writes by other handles"""
+        signature = []
+        for path in (self.memory_path, self.history_path):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((0, 0))
+        return tuple(signature)
+
+    def is_stale(self) -> bool:
+        """True when the files changed since this handle last loaded or wrote them"""
+        return self.file_signature() != self._signature
 
     def get_last(self, n: int = 1) -> List[Dict[str, Any]]:
         """Get the last n interactions"""
         return self.data["history"][-n:] if self.data["history"] else []
 
+    def get_page(self, before: Optional[int] = None,
+                 limit: int = 10) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Up to limit entries older than absolute position before (newest page
+        when None), oldest first, plus the cursor for the next older page.
+        Only the cold segments overlapping the page are read.
+        """
+        history = self.data["history"]
+        end = len(history) if before is None else max(0, min(before, len(history)))
+        start = max(0, end - limit)
+        return history[start:end], (start if start > 0 else None)
+
     def get_context(self, max_entries: int = 5) -> str:
         """Get recent context for agent awareness"""
         recent = self.get_last(max_entries)
@@ -79,18 +244,27 @@ class AgentMemory:
 
     def clear(self):
         """Clear all memory (use with caution)"""
-        self.data["history"] = []
+        self.data["history"].clear()
+        self._duplicates = None
+        self._search_index = None
         self.data["metadata"]["total_runs"] = 0
         self.data["metadata"]["last_run"] = None
         self.data["metadata"]["success_rate"] = 0.0
-        self._save()
+        self.data["metadata"]["successes"] = 0
+        self._rewrite_log()
+        self._save_metadata()
 
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Search through memory for relevant entries"""
         results = []
         query_lower = query.lower()
         
-        for entry in self.data["history"]:
+        # The trigram index narrows candidates; each one is still verified below
+        history = self.data["history"]
+        positions = self._trigram_index().candidates(query)
+        entries = history if positions is None else (history[position] for position in positions)
+        
+        for entry in entries:
             if (query_lower in entry["input"].lower() or 
                 query_lower in entry["output"].lower()):
                 results.append(entry)
@@ -0,0 +1,53 @@
+# fusion_core/memory/handle_cache.py
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+from .agent_memory import AgentMemory
+
+
+class MemoryHandleCache:
+    """
+    Process-wide LRU of open AgentMemory handles.
+    A handle is reused while its backing files are unchanged; writes made
+    through the handle keep it current, and a write by anything else (another
+    process or handle) makes the next lookup reload it.
+    """
+
+    def __init__(self, memory_dir: str = "fusion_memory", max_handles: int = 64, **memory_options: Any):
+        self.memory_dir = memory_dir
+        self.max_handles = max_handles
+        self.memory_options = memory_options
+        self._handles: "OrderedDict[str, AgentMemory]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "loads": 0, "reloads": 0}
+
+    def get(self, agent_name: str) -> AgentMemory:
+        with self._lock:
+            handle = self._handles.get(agent_name)
+            if handle is not None and not handle.is_stale():
+                self._handles.move_to_end(agent_name)
+                self.stats["hits"] += 1
+                return handle
+
+            self.stats["reloads" if handle is not None else "loads"] += 1
+            handle = AgentMemory(agent_name, self.memory_dir, **self.memory_options)
+            self._handles[agent_name] = handle
+            self._handles.move_to_end(agent_name)
+            while len(self._handles) > self.max_handles:
+                self._handles.popitem(last=False)
+            return handle
+
+    def invalidate(self, agent_name: str = None) -> None:
+        """Drop one handle (or all of them) so the next lookup reloads from disk"""
+        with self._lock:
+            if agent_name is None:
+                self._handles.clear()
+            else:
+                self._handles.pop(agent_name, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {**self.stats, "open_handles": len(self._handles),
+                "memory_dir": os.path.abspath(self.memory_dir)}
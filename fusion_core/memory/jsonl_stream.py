@@ -0,0 +1,107 @@
+# fusion_core/memory/jsonl_stream.py
+
+import gzip
+import io
+import json
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional
+
+try:
+    import zstandard
+except ImportError:  # optional: only needed for .zst files
+    zstandard = None
+
+ProgressCallback = Callable[[int], None]
+
+
+def _compression(path: str, compress: Optional[str]) -> Optional[str]:
+    """Explicit compression ("gzip", "zstd" or None), else inferred from the extension"""
+    if compress is not None:
+        return compress or None
+    if path.endswith(".gz"):
+        return "gzip"
+    if path.endswith(".zst"):
+        return "zstd"
+    return None
+
+
+def open_jsonl(path: str, mode: str = "r", compress: Optional[str] = None) -> IO[str]:
+    """Open a JSONL file for text reading ("r") or writing ("w"/"a"), compressed or not"""
+    codec = _compression(path, compress)
+    if codec == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("zstd compression requires the zstandard package (pip install zstandard)")
+        raw = open(path, mode + "b")
+        stream = (zstandard.ZstdDecompressor().stream_reader(raw, closefd=True) if mode == "r"
+                  else zstandard.ZstdCompressor().stream_writer(raw, closefd=True))
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def write_jsonl(path: str, records: Iterable[Any], compress: Optional[str] = None,
+                chunk_size: int = 1000, progress: Optional[ProgressCallback] = None) -> int:
+    """
+    Stream records to path, one JSON document per line.
+    Records are consumed lazily and written a chunk at a time, so memory stays
+    bounded by chunk_size; progress is called with the running count per chunk.
+    Returns the number of records written.
+    """
+    count = 0
+    with open_jsonl(path, "w", compress) as f:
+        chunk: List[str] = []
+        for record in records:
+            chunk.append(json.dumps(record, default=str))
+            if len(chunk) >= chunk_size:
+                count += _flush(f, chunk, count, progress)
+        if chunk:
+            count += _flush(f, chunk, count, progress)
+    return count
+
+
+def _flush(f: IO[str], chunk: List[str], count: int, progress: Optional[ProgressCallback]) -> int:
+    f.write("\n".join(chunk) + "\n")
+    written = len(chunk)
+    chunk.clear()
+    if progress:
+        progress(count + written)
+    return written
+
+
+def iter_jsonl(path: str, compress: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yield records from a JSONL file one at a time (blank lines are skipped)"""
+    with open_jsonl(path, "r", compress) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_jsonl_chunks(path: str, chunk_size: int = 1000, compress: Optional[str] = None,
+                      progress: Optional[ProgressCallback] = None) -> Iterator[List[Dict[str, Any]]]:
+    """Yield lists of up to chunk_size records, reporting the running count per chunk"""
+    count = 0
+    chunk: List[Dict[str, Any]] = []
+    for record in iter_jsonl(path, compress):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            count += len(chunk)
+            yield chunk
+            chunk = []
+            if progress:
+                progress(count)
+    if chunk:
+        count += len(chunk)
+        yield chunk
+        if progress:
+            progress(count)
+
+
+def is_jsonl(path: str, compress: Optional[str] = None) -> bool:
+    """True when the first line is a complete JSON document (a pretty-printed file's is not)"""
+    with open_jsonl(path, "r", compress) as f:
+        first = f.readline()
+    try:
+        json.loads(first)
+        return True
+    except json.JSONDecodeError:
+        return False
@@ -0,0 +1,124 @@
+# fusion_core/memory/near_duplicates.py
+
+import random
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_PUNCTUATION = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(text: str) -> str:
+    """Canonical form for matching: lowercase, no punctuation, single spaces"""
+    return _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", text.lower())).strip()
+
+
+class MinHasher:
+    """
+    MinHash signatures over character shingles of the normalized text.
+    The fraction of equal signature slots estimates Jaccard similarity.
+    """
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 4, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                       for _ in range(num_perm)]
+
+    def shingles(self, text: str) -> Set[str]:
+        normalized = normalize_prompt(text)
+        size = self.shingle_size
+        if len(normalized) <= size:
+            return {normalized}
+        return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(shingle.encode("utf-8")) for shingle in self.shingles(text)]
+        return tuple(min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+                     for a, b in self._perms)
+
+    @staticmethod
+    def similarity(first: Sequence[int], second: Sequence[int]) -> float:
+        return sum(1 for x, y in zip(first, second) if x == y) / len(first)
+
+
+def _lsh_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) whose LSH S-curve midpoint, (1/bands)^(1/rows), is the
+    highest one at or below the threshold, so near-duplicates at the threshold
+    are rarely missed; candidates are then verified against the threshold.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1.0 / bands) ** (1.0 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class MinHashLSH:
+    """Banded LSH index of MinHash signatures for near-duplicate lookup"""
+
+    def __init__(self, threshold: float = 0.9, num_perm: int = 64,
+                 hasher: Optional[MinHasher] = None):
+        self.threshold = threshold
+        self.hasher = hasher or MinHasher(num_perm)
+        self.bands, self.rows = _lsh_bands(threshold, self.hasher.num_perm)
+        self._buckets: List[Dict[Tuple[int, ...], Set[Hashable]]] = [
+            defaultdict(set) for _ in range(self.bands)]
+        self._signatures: Dict[Hashable, Tuple[int, ...]] = {}
+
+    def _band_keys(self, signature: Tuple[int, ...]):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    def add(self, key: Hashable, text: Optional[str] = None,
+            signature: Optional[Tuple[int, ...]] = None) -> Tuple[int, ...]:
+        signature = signature or self.hasher.signature(text)
+        self.remove(key)
+        self._signatures[key] = signature
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band][band_key].add(key)
+        return signature
+
+    def remove(self, key: Hashable) -> None:
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def query(self, text: Optional[str] = None, signature: Optional[Tuple[int, ...]] = None,
+              threshold: Optional[float] = None) -> List[Tuple[Hashable, float]]:
+        """Keys whose estimated similarity meets the threshold, most similar first"""
+        signature = signature or self.hasher.signature(text)
+        threshold = self.threshold if threshold is None else threshold
+
+        candidates: Set[Hashable] = set()
+        for band, band_key in self._band_keys(signature):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        matches = []
+        for key in candidates:
+            similarity = MinHasher.similarity(signature, self._signatures[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._signatures
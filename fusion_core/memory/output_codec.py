@@ -0,0 +1,143 @@
+# fusion_core/memory/output_codec.py
+
+import base64
+import hashlib
+import os
+import zlib
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+# zlib only looks back 32 KiB, so a larger preset dictionary is wasted
+MAX_DICT_SIZE = 32 * 1024
+
+
+def train_dictionary(samples: Iterable[str], max_size: int = MAX_DICT_SIZE) -> bytes:
+    """
+    Build a zlib preset dictionary from sample outputs.
+    Lines shared by several samples (template boilerplate) are kept, most
+    common last, since zlib encodes matches closest to the data cheapest.
+    """
+    counts: Counter = Counter()
+    for sample in samples:
+        counts.update(set(sample.splitlines(keepends=True)))
+
+    shared = [line for line, count in counts.items() if count > 1 and line.strip()]
+    shared.sort(key=lambda line: (counts[line], len(line)))
+
+    chunks: List[bytes] = []
+    size = 0
+    for line in reversed(shared):
+        data = line.encode("utf-8")
+        if size + len(data) > max_size:
+            break
+        chunks.append(data)
+        size += len(data)
+    return b"".join(reversed(chunks))
+
+
+class OutputCodec:
+    """
+    Transparent compression of stored agent outputs with a trained dictionary.
+    Outputs are plain strings in memory; on disk they become
+    {"zdict": <dictionary id>, "z": <base85 raw deflate>} when that is smaller.
+    Dictionaries are content-addressed files that are never deleted, so
+    retraining never breaks decoding of older entries.
+    """
+
+    def __init__(self, directory: str, train_after: int = 32, min_size: int = 128,
+                 level: int = 9, cache_size: int = 1024):
+        self.directory = directory
+        self.train_after = train_after
+        self.min_size = min_size
+        self.level = level
+        self.cache_size = cache_size
+        self._dictionaries: Dict[str, bytes] = {}
+        self._encoded: "OrderedDict[str, Any]" = OrderedDict()
+        self._samples: List[str] = []
+        self.dictionary_id: Optional[str] = self._read_current()
+
+    # -- dictionaries -----------------------------------------------------
+
+    def _path(self, dictionary_id: str) -> str:
+        return os.path.join(self.directory, f"{dictionary_id}.zdict")
+
+    def _read_current(self) -> Optional[str]:
+        current = os.path.join(self.directory, "CURRENT")
+        if os.path.exists(current):
+            with open(current, "r") as f:
+                return f.read().strip() or None
+        return None
+
+    def _dictionary(self, dictionary_id: str) -> bytes:
+        if dictionary_id not in self._dictionaries:
+            with open(self._path(dictionary_id), "rb") as f:
+                self._dictionaries[dictionary_id] = f.read()
+        return self._dictionaries[dictionary_id]
+
+    def train(self, samples: Iterable[str]) -> Optional[str]:
+        """Train and activate a dictionary; returns its id (None if nothing is shared)"""
+        dictionary = train_dictionary(samples)
+        if not dictionary:
+            return None
+
+        dictionary_id = hashlib.sha1(dictionary).hexdigest()[:12]
+        os.makedirs(self.directory, exist_ok=True)
+        if not os.path.exists(self._path(dictionary_id)):
+            with open(self._path(dictionary_id), "wb") as f:
+                f.write(dictionary)
+        with open(os.path.join(self.directory, "CURRENT"), "w") as f:
+            f.write(dictionary_id)
+
+        self._dictionaries[dictionary_id] = dictionary
+        self.dictionary_id = dictionary_id
+        self._encoded.clear()
+        return dictionary_id
+
+    def observe(self, text: str) -> None:
+        """Collect a sample; the first dictionary is trained after train_after samples"""
+        if self.dictionary_id is not None or not isinstance(text, str):
+            return
+        self._samples.append(text)
+        if len(self._samples) >= self.train_after:
+            samples, self._samples = self._samples, []
+            self.train(samples)
+
+    # -- encoding ---------------------------------------------------------
+
+    def encode(self, text: Any) -> Any:
+        """Compressed form of text, or text itself when compression does not pay"""
+        if (self.dictionary_id is None or not isinstance(text, str)
+                or len(text) < self.min_size):
+            return text
+        if text in self._encoded:
+            self._encoded.move_to_end(text)
+            return self._encoded[text]
+
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -15,
+                                      zdict=self._dictionary(self.dictionary_id))
+        data = compressor.compress(text.encode("utf-8")) + compressor.flush()
+        payload = base64.b85encode(data).decode("ascii")
+        encoded = {"zdict": self.dictionary_id, "z": payload} if len(payload) < len(text) else text
+
+        self._encoded[text] = encoded
+        while len(self._encoded) > self.cache_size:
+            self._encoded.popitem(last=False)
+        return encoded
+
+    def decode(self, value: Any) -> Any:
+        """Inverse of encode; plain values pass through unchanged"""
+        if not (isinstance(value, dict) and "zdict" in value and "z" in value):
+            return value
+        decompressor = zlib.decompressobj(-15, zdict=self._dictionary(value["zdict"]))
+        data = decompressor.decompress(base64.b85decode(value["z"])) + decompressor.flush()
+        return data.decode("utf-8")
+
+    def encode_entries(self, entries: List[Dict[str, Any]], field: str = "output") -> List[Dict[str, Any]]:
+        return [{**entry, field: self.encode(entry[field])} if field in entry else entry
+                for entry in entries]
+
+    def decode_entries(self, entries: List[Dict[str, Any]], field: str = "output") -> List[Dict[str, Any]]:
+        for entry in entries:
+            if field in entry:
+                entry[field] = self.decode(entry[field])
+        return entries
@@ -0,0 +1,73 @@
+# fusion_core/memory/ring_buffer.py
+
+import json
+import os
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional
+
+
+class RingBuffer:
+    """
+    Fixed-capacity history buffer.
+    Appending to a full buffer evicts the oldest item in O(1), handing it to
+    the optional spill callback first so it can be persisted.
+    """
+
+    __slots__ = ("capacity", "spill", "spilled", "_items")
+
+    def __init__(self, capacity: Optional[int] = 1000,
+                 spill: Optional[Callable[[Any], None]] = None):
+        self.capacity = capacity
+        self.spill = spill
+        self.spilled = 0
+        self._items = deque(maxlen=capacity)
+
+    def append(self, item: Any) -> None:
+        if self.capacity is not None and len(self._items) == self.capacity:
+            if self.spill:
+                self.spill(self._items[0])
+            self.spilled += 1
+        self._items.append(item)
+
+    def extend(self, items) -> None:
+        for item in items:
+            self.append(item)
+
+    def recent(self, n: int) -> List[Any]:
+        """The newest n items, oldest first"""
+        start = max(len(self._items) - n, 0)
+        return list(islice(self._items, start, None))
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._items)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._items)[index]
+        return self._items[index]
+
+    def __repr__(self) -> str:
+        return f"RingBuffer(capacity={self.capacity}, size={len(self._items)}, spilled={self.spilled})"
+
+
+def jsonl_spill(path: str, encode: Optional[Callable[[Any], Any]] = None) -> Callable[[Any], None]:
+    """Spill callback that appends each evicted item to a JSONL file (created on first spill)"""
+    directory = os.path.dirname(path)
+
+    def spill(item: Any) -> None:
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "a") as f:
+            f.write(json.dumps(encode(item) if encode else item, default=str) + "\n")
+
+    return spill
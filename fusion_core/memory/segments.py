@@ -0,0 +1,180 @@
+# fusion_core/memory/segments.py
+
+import gzip
+import json
+import os
+import shutil
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class SegmentStore:
+    """
+    Immutable, gzip-compressed JSONL segments of cold history entries.
+    A small manifest records each segment's entry count (and optional
+    summary stats) so lengths and aggregates never require opening one.
+    """
+
+    def __init__(self, directory: str, cache_segments: int = 2):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self.cache_segments = cache_segments
+        self._cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self.segments: List[Dict[str, Any]] = self._load_manifest()
+
+    def _load_manifest(self) -> List[Dict[str, Any]]:
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "r") as f:
+                return json.load(f)["segments"]
+        return []
+
+    def _write_atomic(self, path: str, write: Callable[[str], None]) -> None:
+        tmp_path = f"{path}.tmp"
+        write(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _save_manifest(self) -> None:
+        def write(path):
+            with open(path, "w") as f:
+                json.dump({"segments": self.segments}, f)
+        self._write_atomic(self.manifest_path, write)
+
+    @property
+    def count(self) -> int:
+        return sum(segment["count"] for segment in self.segments)
+
+    def append_segment(self, entries: List[Dict[str, Any]],
+                       stats: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Write entries as a new immutable segment"""
+        os.makedirs(self.directory, exist_ok=True)
+        name = f"segment-{len(self.segments):06d}.jsonl.gz"
+
+        def write(path):
+            with gzip.open(path, "wt", encoding="utf-8") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, default=str) + "\n")
+        self._write_atomic(os.path.join(self.directory, name), write)
+
+        segment = {"name": name, "count": len(entries), "stats": stats or {}}
+        self.segments.append(segment)
+        self._save_manifest()
+        return segment
+
+    def load(self, name: str) -> List[Dict[str, Any]]:
+        """Decode one segment (a few recently used segments stay cached)"""
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            return self._cache[name]
+
+        with gzip.open(os.path.join(self.directory, name), "rt", encoding="utf-8") as f:
+            entries = [json.loads(line) for line in f]
+        self._cache[name] = entries
+        while len(self._cache) > self.cache_segments:
+            self._cache.popitem(last=False)
+        return entries
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for segment in self.segments:
+            with gzip.open(os.path.join(self.directory, segment["name"]), "rt", encoding="utf-8") as f:
+                for line in f:
+                    yield json.loads(line)
+
+    def entry(self, index: int) -> Dict[str, Any]:
+        for segment in self.segments:
+            if index < segment["count"]:
+                return self.load(segment["name"])[index]
+            index -= segment["count"]
+        raise IndexError("segment index out of range")
+
+    def slice(self, start: int, stop: int) -> List[Dict[str, Any]]:
+        """Entries [start, stop), decoding only the segments that overlap the range"""
+        entries: List[Dict[str, Any]] = []
+        offset = 0
+        for segment in self.segments:
+            end = offset + segment["count"]
+            if end > start and offset < stop:
+                entries.extend(self.load(segment["name"])[max(start - offset, 0):stop - offset])
+            if end >= stop:
+                break
+            offset = end
+        return entries
+
+    def stats(self) -> List[Dict[str, Any]]:
+        return [segment["stats"] for segment in self.segments]
+
+    def clear(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.segments = []
+        self._cache.clear()
+
+
+class TieredHistory:
+    """
+    History list with a hot in-memory tail and cold compressed segments.
+    Indexing is absolute across both tiers; iteration and old indices load
+    cold segments lazily, while recent entries never touch disk.
+    """
+
+    def __init__(self, store: SegmentStore, hot: Optional[List[Dict[str, Any]]] = None,
+                 hot_limit: int = 200, segment_size: int = 500,
+                 summarize: Optional[Callable[[List[Dict[str, Any]]], Dict[str, Any]]] = None):
+        self.store = store
+        self.hot: List[Dict[str, Any]] = list(hot or [])
+        self.hot_limit = hot_limit
+        self.segment_size = segment_size
+        self.summarize = summarize
+        self.cold_count = store.count
+
+    def append(self, entry: Dict[str, Any]) -> bool:
+        """Add an entry; returns True when older entries moved to a cold segment"""
+        self.hot.append(entry)
+        return self.compact()
+
+    def compact(self) -> bool:
+        """Move the oldest hot entries into segments once the hot tier overflows"""
+        spilled = False
+        while len(self.hot) >= self.hot_limit + self.segment_size:
+            batch = self.hot[:self.segment_size]
+            self.store.append_segment(batch, self.summarize(batch) if self.summarize else None)
+            del self.hot[:self.segment_size]
+            self.cold_count += len(batch)
+            spilled = True
+        return spilled
+
+    def recent(self, n: int) -> List[Dict[str, Any]]:
+        """The newest n entries, oldest first"""
+        if n <= len(self.hot):
+            return self.hot[len(self.hot) - n:] if n > 0 else []
+        return list(self)[-n:]
+
+    def __len__(self) -> int:
+        return self.cold_count + len(self.hot)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        yield from self.store
+        yield from self.hot
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            if stop <= start:
+                return []
+            cold = self.store.slice(start, min(stop, self.cold_count)) if start < self.cold_count else []
+            return cold + self.hot[max(start - self.cold_count, 0):max(stop - self.cold_count, 0)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        if index >= self.cold_count:
+            return self.hot[index - self.cold_count]
+        return self.store.entry(index)
+
+    def clear(self) -> None:
+        self.store.clear()
+        self.hot = []
+        self.cold_count = 0
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Semantic Index - Fusion v15.4
+Dependency-light semantic recall across all of a user's threads.
+
+Interactions are embedded as signed, hashed word and character n-gram vectors
+and stored in a per-user on-disk IVF (inverted file) index:
+
+    <index_dir>/vectors.f32      float32 rows, appended per interaction
+    <index_dir>/entries.jsonl    one metadata record per row
+    <index_dir>/centroids.npy    IVF coarse centroids (trained once large enough)
+    <index_dir>/assignments.i32  centroid id per row
+    <index_dir>/tombstones.jsonl cleared threads and the row count at clearing
+
+Small indexes are scanned exactly; larger ones probe only the nearest lists.
+Writers from every thread and worker serialise on <index_dir>/.lock, so
+row i of vectors.f32 always matches line i of entries.jsonl.
+Requires NumPy (the ``gui`` extra).
+"""
+
+import json
+import os
+import threading
+import zlib
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: writers are only serialised within a process
+    fcntl = None
+
+NUMPY_AVAILABLE = np is not None
+
+# In-process write locks per index directory (flock covers other processes)
+_WRITE_LOCKS: Dict[str, threading.Lock] = {}
+_WRITE_LOCKS_GUARD = threading.Lock()
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Semantic recall requires numpy (pip install 'fusion[gui]')")
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(mtime, size) of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class HashedNgramEmbedder:
+    """Feature-hashed bag of words and character n-grams, L2-normalised."""
+
+    def __init__(self, dim: int = 256, char_ngram: int = 3):
+        _require_numpy()
+        self.dim = dim
+        self.char_ngram = char_ngram
+
+    def _features(self, text: str) -> List[str]:
+        words = "".join(ch if ch.isalnum() else " " for ch in text.lower()).split()
+        features = list(words)
+        for word in words:
+            padded = f" {word} "
+            features.extend(padded[i:i + self.char_ngram]
+                            for i in range(len(padded) - self.char_ngram + 1))
+        return features
+
+    def embed(self, text: str) -> "np.ndarray":
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for feature in self._features(text):
+            # crc32 is stable across processes, unlike hash()
+            digest = zlib.crc32(feature.encode("utf-8"))
+            sign = 1.0 if digest & 0x80000000 else -1.0
+            vector[digest % self.dim] += sign
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+
+class SemanticIndex:
+    """
+    Per-user IVF index over interaction embeddings.
+    Every thread (and worker) of a user opens its own instance over the same
+    files, so cached centroids and inverted lists are reloaded whenever the
+    files change on disk. Training runs on a background thread once the index
+    is large enough (or outgrows its lists), off the add() path.
+    """
+
+    def __init__(self, index_dir: str, dim: int = 256, train_threshold: int = 2048,
+                 n_probe: int = 8):
+        _require_numpy()
+        self.index_dir = index_dir
+        self.dim = dim
+        self.train_threshold = train_threshold
+        self.n_probe = n_probe
+        self.embedder = HashedNgramEmbedder(dim)
+        os.makedirs(index_dir, exist_ok=True)
+
+        self.vectors_file = os.path.join(index_dir, "vectors.f32")
+        self.entries_file = os.path.join(index_dir, "entries.jsonl")
+        self.centroids_file = os.path.join(index_dir, "centroids.npy")
+        self.assignments_file = os.path.join(index_dir, "assignments.i32")
+        self.tombstones_file = os.path.join(index_dir, "tombstones.jsonl")
+        self.lock_file = os.path.join(index_dir, ".lock")
+
+        self._entries: List[Dict[str, Any]] = []
+        self._entries_offset = 0
+        self._centroids: Optional["np.ndarray"] = None
+        self._centroids_signature: Optional[Tuple[int, int]] = None
+        self._lists: Optional[List["np.ndarray"]] = None
+        self._lists_key: Optional[Tuple[Any, ...]] = None
+        self._tombstones: Dict[str, int] = {}
+        self._tombstones_signature: Optional[Tuple[int, int]] = None
+        self._trainer: Optional[threading.Thread] = None
+
+    # -- writes -----------------------------------------------------------
+
+    @contextmanager
+    def _write_lock(self):
+        """Exclusive access to the index files across threads and processes"""
+        with _WRITE_LOCKS_GUARD:
+            local = _WRITE_LOCKS.setdefault(os.path.abspath(self.index_dir), threading.Lock())
+        with local:
+            if fcntl is None:
+                yield
+                return
+            with open(self.lock_file, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def add(self, thread_id: str, position: int, text: str,
+            record: Optional[Dict[str, Any]] = None) -> None:
+        """Index one interaction (position is its index in the thread history)"""
+        vector = self.embedder.embed(text)
+        entry = {"thread_id": thread_id, "position": position, **(record or {})}
+
+        with self._write_lock():
+            with open(self.vectors_file, "ab") as f:
+                f.write(vector.astype(np.float32).tobytes())
+            with open(self.entries_file, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+            centroids = self._load_centroids()
+            if centroids is not None:
+                with open(self.assignments_file, "ab") as f:
+                    f.write(np.int32(np.argmax(centroids @ vector)).tobytes())
+            size = self.size
+
+        # Retrain as the index outgrows its lists (~sqrt(n) lists of ~sqrt(n) rows)
+        if size >= (self.train_threshold if centroids is None else 4 * len(centroids) ** 2):
+            self._schedule_training()
+
+    def remove_thread(self, thread_id: str) -> None:
+        """Hide every interaction indexed so far for a thread (e.g. when it is cleared)"""
+        with self._write_lock():
+            with open(self.tombstones_file, "a") as f:
+                f.write(json.dumps({"thread_id": thread_id, "before": self.size}) + "\n")
+
+    def _schedule_training(self) -> None:
+        if self._trainer is not None and self._trainer.is_alive():
+            return
+        self._trainer = threading.Thread(target=self.train, name="semantic-index-train", daemon=True)
+        self._trainer.start()
+
+    def wait_for_training(self, timeout: Optional[float] = None) -> None:
+        """Block until background training started by this instance has finished"""
+        if self._trainer is not None:
+            self._trainer.join(timeout)
+
+    def train(self, iterations: int = 10, seed: int = 0) -> None:
+        """
+        (Re)build the IVF coarse quantiser with spherical k-means. Centroids are
+        fitted on the rows present at the start, without holding the write lock;
+        every row (including ones added meanwhile) is then assigned under it.
+        """
+        vectors = np.array(self._vectors())
+        if len(vectors) == 0:
+            return
+        n_lists = max(1, int(np.sqrt(len(vectors))))
+        rng = np.random.default_rng(seed)
+        centroids = vectors[rng.choice(len(vectors), n_lists, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmax(vectors @ centroids.T, axis=1)
+            for list_id in range(n_lists):
+                members = vectors[assignments == list_id]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[list_id] = centroid / norm if norm else centroid
+        centroids = centroids.astype(np.float32)
+
+        with self._write_lock():
+            assignments = np.argmax(self._vectors() @ centroids.T, axis=1).astype(np.int32)
+            for path, write in ((self.centroids_file, lambda f: np.save(f, centroids)),
+                                (self.assignments_file, lambda f: f.write(assignments.tobytes()))):
+                tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    write(f)
+                os.replace(tmp_path, path)
+            # Force the next read to pick up the new files
+            self._centroids_signature = None
+
+    # -- reads ------------------------------------------------------------
+
+    @property
+    def size(self) -> int:
+        if not os.path.exists(self.vectors_file):
+            return 0
+        return os.path.getsize(self.vectors_file) // (4 * self.dim)
+
+    def _vectors(self) -> "np.ndarray":
+        size = self.size
+        if size == 0:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.memmap(self.vectors_file, dtype=np.float32, mode="r", shape=(size, self.dim))
+
+    def _load_centroids(self) -> Optional["np.ndarray"]:
+        """Coarse centroids, reloaded when another instance (re)trained them"""
+        signature = _file_signature(self.centroids_file)
+        if signature != self._centroids_signature:
+            self._centroids = np.load(self.centroids_file) if signature else None
+            self._centroids_signature = signature
+            self._lists = None
+        return self._centroids
+
+    def _load_lists(self, size: int) -> List["np.ndarray"]:
+        """Inverted lists (row ids per centroid), rebuilt only when the assignments changed"""
+        key = (size, _file_signature(self.assignments_file), self._centroids_signature)
+        if self._lists is None or self._lists_key != key:
+            assignments = np.fromfile(self.assignments_file, dtype=np.int32)[:size]
+            order = np.argsort(assignments, kind="stable")
+            bounds = np.searchsorted(assignments[order], np.arange(len(self._centroids) + 1))
+            self._lists = [order[bounds[i]:bounds[i + 1]] for i in range(len(self._centroids))]
+            self._lists_key = key
+        return self._lists
+
+    def _load_tombstones(self) -> Dict[str, int]:
+        """Per cleared thread, the row count below which its rows are hidden"""
+        signature = _file_signature(self.tombstones_file)
+        if signature != self._tombstones_signature:
+            tombstones: Dict[str, int] = {}
+            if signature:
+                with open(self.tombstones_file, "r") as f:
+                    for line in f:
+                        if line.endswith("\n"):
+                            record = json.loads(line)
+                            tombstones[record["thread_id"]] = max(
+                                tombstones.get(record["thread_id"], 0), record["before"])
+            self._tombstones, self._tombstones_signature = tombstones, signature
+        return self._tombstones
+
+    def _load_entries(self) -> List[Dict[str, Any]]:
+        """Entry metadata, reading only lines appended since the last call"""
+        if os.path.exists(self.entries_file):
+            with open(self.entries_file, "rb") as f:
+                f.seek(self._entries_offset)
+                data = f.read()
+            # Leave a partially written trailing line for the next call
+            complete = data[:data.rfind(b"\n") + 1]
+            self._entries_offset += len(complete)
+            self._entries.extend(json.loads(line) for line in complete.splitlines())
+        return self._entries
+
+    def search(self, query: str, k: int = 5,
+               exclude_thread: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Top-k most similar interactions across every indexed thread"""
+        entries = self._load_entries()
+        vectors = self._vectors()[:len(entries)]
+        if len(vectors) == 0:
+            return []
+        query_vector = self.embedder.embed(query)
+
+        centroids = self._load_centroids()
+        if centroids is None:
+            candidates = np.arange(len(vectors))
+        else:
+            lists = self._load_lists(len(vectors))
+            probe = np.argsort(centroids @ query_vector)[::-1][:self.n_probe]
+            candidates = np.concatenate([lists[i] for i in probe])
+
+        scores = (vectors if centroids is None else vectors[candidates]) @ query_vector
+        ranked = np.argsort(scores)[::-1]
+        tombstones = self._load_tombstones()
+
+        results = []
+        for idx in ranked:
+            if scores[idx] <= 0:
+                break
+            row = int(candidates[idx])
+            entry = entries[row]
+            if exclude_thread and entry["thread_id"] == exclude_thread:
+                continue
+            if row < tombstones.get(entry["thread_id"], 0):
+                continue
+            results.append({**entry, "score": float(scores[idx])})
+            if len(results) >= k:
+                break
+        return results
@@ -0,0 +1,238 @@
+# fusion_core/memory/shared_snapshot.py
+
+import os
+import struct
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .state_snapshot import StartupSnapshot, build_snapshot, _signature
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - platforms without POSIX/Windows shared memory
+    shared_memory = None
+
+try:
+    from multiprocessing import resource_tracker
+except ImportError:  # pragma: no cover - Windows has no resource tracker
+    resource_tracker = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: publishes are not serialised across processes
+    fcntl = None
+
+SHARED_MEMORY_AVAILABLE = shared_memory is not None
+_HAS_TRACK = sys.version_info >= (3, 13)
+
+# magic, sequence (odd while a publish is writing), version, payload size, data segment name
+_CONTROL = struct.Struct("<8sQQQ64s")
+_CONTROL_MAGIC = b"FUSCTL\x00\x01"
+
+
+def _shared_memory(name: str, create: bool = False, size: int = 0) -> "shared_memory.SharedMemory":
+    """
+    Open a segment that outlives this process. Segments are shared by every
+    worker, so the resource tracker must not unlink them when one worker exits.
+    """
+    if _HAS_TRACK:
+        return shared_memory.SharedMemory(name, create=create, size=size, track=False)
+    segment = shared_memory.SharedMemory(name, create=create, size=size)
+    if resource_tracker is not None:
+        resource_tracker.unregister(segment._name, "shared_memory")
+    return segment
+
+
+def _unlink(name: str) -> None:
+    try:
+        segment = _shared_memory(name)
+    except FileNotFoundError:
+        return
+    if not _HAS_TRACK and resource_tracker is not None:
+        # SharedMemory.unlink() unregisters the name again before Python 3.13
+        resource_tracker.register(segment._name, "shared_memory")
+    segment.close()
+    segment.unlink()
+
+
+class SharedSnapshotSegment:
+    """
+    Versioned snapshot bytes in shared memory.
+    A small control segment names the current data segment. A publish writes
+    a complete new data segment, then swaps the control fields under a
+    sequence lock, so readers see either the old or the new version, never a
+    mix; the old segment is unlinked, and readers still attached to it keep
+    their mapping until they move on.
+    """
+
+    def __init__(self, name: str = "fusion_state"):
+        self.name = name
+        self.lock_path = os.path.join(tempfile.gettempdir(), f"{name}.lock")
+        self._control_segment = None
+
+    @property
+    def _control(self):
+        if self._control_segment is None:
+            try:
+                self._control_segment = _shared_memory(f"{self.name}_ctl", create=True, size=_CONTROL.size)
+            except FileExistsError:
+                self._control_segment = _shared_memory(f"{self.name}_ctl")
+        return self._control_segment
+
+    def read_control(self) -> Tuple[int, int, str]:
+        """(version, payload size, data segment name); version 0 means nothing is published"""
+        buffer = self._control.buf
+        while True:
+            magic, sequence, version, size, data_name = _CONTROL.unpack_from(buffer)
+            if magic != _CONTROL_MAGIC:
+                return 0, 0, ""
+            if sequence % 2 == 0 and _CONTROL.unpack_from(buffer)[1] == sequence:
+                return version, size, data_name.rstrip(b"\0").decode("ascii")
+            time.sleep(0)
+
+    def _write_control(self, version: int, size: int, data_name: str) -> None:
+        buffer = self._control.buf
+        magic, sequence = _CONTROL.unpack_from(buffer)[:2]
+        sequence = sequence if magic == _CONTROL_MAGIC else 0
+        _CONTROL.pack_into(buffer, 0, _CONTROL_MAGIC, sequence + 1, version, size,
+                           data_name.encode("ascii"))
+        _CONTROL.pack_into(buffer, 0, _CONTROL_MAGIC, sequence + 2, version, size,
+                           data_name.encode("ascii"))
+
+    @contextmanager
+    def _publish_lock(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def publish(self, build: Callable[[], bytes], seen_version: Optional[int] = None) -> int:
+        """
+        Publish build() as the next version and return it. When seen_version
+        is given and another process published since, nothing is built and the
+        current version is returned instead.
+        """
+        with self._publish_lock():
+            version, _, old_name = self.read_control()
+            if seen_version is not None and version != seen_version:
+                return version
+
+            payload = build()
+            version += 1
+            data_name = f"{self.name}_{os.getpid()}_{version}"
+            segment = _shared_memory(data_name, create=True, size=max(len(payload), 1))
+            segment.buf[:len(payload)] = payload
+            segment.close()
+            self._write_control(version, len(payload), data_name)
+
+            if old_name:
+                _unlink(old_name)
+            return version
+
+    def attach(self) -> Optional[Tuple[int, "shared_memory.SharedMemory", memoryview]]:
+        """(version, segment, payload view) of the current version, or None if none is published"""
+        for _ in range(3):
+            version, size, data_name = self.read_control()
+            if not version:
+                return None
+            try:
+                segment = _shared_memory(data_name)
+            except FileNotFoundError:
+                continue  # replaced between reading the control and attaching; retry
+            return version, segment, segment.buf[:size]
+        return None
+
+    def unlink(self) -> None:
+        """Remove the published segments (e.g. at deployment teardown or in tests)"""
+        _, _, data_name = self.read_control()
+        for name in (data_name, f"{self.name}_ctl"):
+            if name:
+                _unlink(name)
+        self.close()
+
+    def close(self) -> None:
+        if self._control_segment is not None:
+            self._control_segment.close()
+            self._control_segment = None
+
+
+class SharedSnapshot(StartupSnapshot):
+    """
+    StartupSnapshot served from a shared memory segment instead of a file.
+    Every worker maps the same snapshot bytes, so the encoded state is held
+    once per host and all workers read the same version. Decoded objects are
+    not shared: get() returns a private copy, and the routing scorecard (read
+    from its JSON file), circuit breakers and result cache stay per process.
+    Each access checks the control version and re-attaches after a publish;
+    a changed source triggers a republish by whichever worker notices first,
+    at most once per republish_interval seconds. Until then the changed
+    source is read from its JSON file, so a frequently rewritten source
+    cannot make every access rebuild the snapshot.
+    """
+
+    def __init__(self, segment_name: str = "fusion_state", sources: Optional[Dict[str, str]] = None,
+                 republish_interval: float = 1.0):
+        super().__init__(path=None, sources=sources)
+        self.segment = SharedSnapshotSegment(segment_name)
+        self.version = 0
+        self.republish_interval = republish_interval
+        self._republished_at: Optional[float] = None
+        self._segment = None
+
+    def load(self, regenerate: bool = True) -> bool:
+        """Attach the published snapshot, publishing a new one if it is missing or stale"""
+        with self._lock:
+            for _ in range(3):
+                if self._open() and not self._stale_sources():
+                    return True
+                if not regenerate:
+                    return False
+                self.segment.publish(lambda: build_snapshot(self.sources), seen_version=self.version)
+            return self._open()
+
+    def _open(self) -> bool:
+        self.close()
+        attached = self.segment.attach()
+        if attached is None:
+            return False
+        version, segment, payload = attached
+        if not self._attach(payload):
+            payload.release()
+            segment.close()
+            return False
+        self.version, self._segment = version, segment
+        return True
+
+    def _ensure_fresh(self, name: str) -> bool:
+        if self.segment.read_control()[0] != self.version:
+            with self._lock:
+                self._open()
+        recorded = self._table["sources"].get(name)
+        if (recorded["signature"] if recorded else None) != _signature(self.sources[name]):
+            now = time.monotonic()
+            if self._republished_at is not None and now - self._republished_at < self.republish_interval:
+                return False
+            self._republished_at = now
+            self.load()
+        return self.is_fresh(name)
+
+    def get_status(self) -> Dict[str, Any]:
+        return {"segment": self.segment.name, "version": self.version,
+                "size": len(self._buffer) if self._buffer is not None else 0,
+                "sections": sorted(self._table["sections"])}
+
+    def close(self) -> None:
+        if self._buffer is not None:
+            self._buffer.release()
+            self._buffer = None
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
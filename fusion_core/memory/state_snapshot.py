@@ -0,0 +1,260 @@
+# fusion_core/memory/state_snapshot.py
+
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from typing import Any, Dict, Optional, Tuple
+
+# Read-mostly JSON state every process parses on startup. Files rewritten on
+# every run (memory/agent_memory.json, memory/agent_scorecard.json) are left
+# out: they would keep the snapshot stale, and load_json reads them directly
+DEFAULT_SOURCES = {
+    "pattern_registry": "memory/pattern_registry.json",
+    "agent_manifest": "agent_manifest.json",
+    "fallback_config": "fallback_trigger_config.json",
+}
+
+MAGIC = b"FUSNAP\x00\x01"
+FORMAT_VERSION = 1
+# magic, format version, marshal version, python (major << 8 | minor), table length, table crc32
+_HEADER = struct.Struct("<8sHHHII")
+_ALIGN = 8
+
+Signature = Tuple[int, int]
+
+
+def _signature(path: str) -> Optional[Signature]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _python_tag() -> int:
+    return sys.version_info[0] << 8 | sys.version_info[1]
+
+
+def build_snapshot(sources: Dict[str, str]) -> bytes:
+    """
+    Parse every source JSON file into one binary snapshot:
+
+        header | table | section | section | ...
+
+    The header carries the format, marshal and Python versions plus the
+    table checksum; the table (marshal) lists each source's path and
+    (mtime, size) at parse time and each section's offset, length and crc32.
+    Sections are marshalled objects at 8-byte aligned offsets, so a reader
+    can mmap the snapshot and decode only the sections it needs. Sources
+    that are missing or invalid JSON are left out.
+    """
+    sections: Dict[str, bytes] = {}
+    source_table: Dict[str, Dict[str, Any]] = {}
+    for name, source in sources.items():
+        signature = _signature(source)
+        try:
+            with open(source, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        # Only record the signature if the file did not change while it was read
+        if _signature(source) == signature:
+            sections[name] = marshal.dumps(data)
+            source_table[name] = {"path": os.path.abspath(source), "signature": signature}
+
+    # Offsets depend on the table length, so lay out sections relative to it
+    layout, relative = {}, 0
+    for name, payload in sections.items():
+        layout[name] = (relative, len(payload), zlib.crc32(payload))
+        relative += len(payload) + (-len(payload) % _ALIGN)
+
+    def table_bytes(base: int) -> bytes:
+        return marshal.dumps({
+            "sources": source_table,
+            "sections": {name: (base + offset, length, crc)
+                         for name, (offset, length, crc) in layout.items()}
+        })
+
+    # The table's size can change with its offsets; iterate until it is stable
+    base = _HEADER.size
+    while True:
+        table = table_bytes(base)
+        new_base = _HEADER.size + len(table) + (-(_HEADER.size + len(table)) % _ALIGN)
+        if new_base == base:
+            break
+        base = new_base
+
+    parts = [_HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version, _python_tag(),
+                          len(table), zlib.crc32(table)),
+             table, b"\0" * (base - _HEADER.size - len(table))]
+    for payload in sections.values():
+        parts.append(payload)
+        parts.append(b"\0" * (-len(payload) % _ALIGN))
+    return b"".join(parts)
+
+
+def read_table(buffer) -> Optional[Dict[str, Any]]:
+    """The table of a snapshot buffer, or None if it is not a valid snapshot for this Python"""
+    if len(buffer) < _HEADER.size:
+        return None
+    magic, version, marshal_version, python, table_length, table_crc = _HEADER.unpack_from(buffer)
+    table = bytes(buffer[_HEADER.size:_HEADER.size + table_length])
+    if (magic != MAGIC or version != FORMAT_VERSION or marshal_version != marshal.version
+            or python != _python_tag() or zlib.crc32(table) != table_crc):
+        return None
+    return marshal.loads(table)
+
+
+def write_snapshot(path: str, sources: Dict[str, str]) -> Dict[str, Any]:
+    """Build a snapshot of sources and write it atomically to path; returns its table"""
+    snapshot = build_snapshot(sources)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(snapshot)
+    os.replace(tmp_path, path)
+    return read_table(snapshot)
+
+
+class StartupSnapshot:
+    """
+    Memory-mapped view of a state snapshot.
+    get() decodes a section only while its source file is unchanged; otherwise
+    (or when the snapshot is missing, corrupt or from another Python) it falls
+    back to parsing the JSON source. load() regenerates a stale snapshot.
+    """
+
+    def __init__(self, path: str = ".fusion_snapshot.bin",
+                 sources: Optional[Dict[str, str]] = None):
+        self.path = path
+        self.sources = dict(DEFAULT_SOURCES if sources is None else sources)
+        self._by_path = {os.path.abspath(source): name for name, source in self.sources.items()}
+        self._buffer = None
+        self._table: Dict[str, Any] = {"sources": {}, "sections": {}}
+        self._verified: set = set()
+        self._lock = threading.Lock()
+
+    def load(self, regenerate: bool = True) -> bool:
+        """Map the snapshot, rebuilding it first if it is unusable or any source changed"""
+        with self._lock:
+            if self._open() and not self._stale_sources():
+                return True
+            if not regenerate:
+                return False
+            write_snapshot(self.path, self.sources)
+            return self._open()
+
+    def _open(self) -> bool:
+        self.close()
+        try:
+            with open(self.path, "rb") as f:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+        if not self._attach(mapped):
+            mapped.close()
+            return False
+        return True
+
+    def _attach(self, buffer) -> bool:
+        """Serve sections from buffer (an mmap or shared memory view) if it is a valid snapshot"""
+        table = read_table(buffer)
+        if table is None:
+            return False
+        self._buffer = buffer
+        self._table = table
+        self._verified = set()
+        return True
+
+    def _stale_sources(self) -> bool:
+        for name, source in self.sources.items():
+            recorded = self._table["sources"].get(name)
+            current = _signature(source)
+            if (recorded["signature"] if recorded else None) != current:
+                return True
+        return False
+
+    def is_fresh(self, name: str) -> bool:
+        recorded = self._table["sources"].get(name)
+        return (self._buffer is not None and recorded is not None
+                and recorded["signature"] == _signature(self.sources[name]))
+
+    def _ensure_fresh(self, name: str) -> bool:
+        """Whether name can be served from the snapshot (subclasses may refresh it first)"""
+        return self.is_fresh(name)
+
+    def _section(self, name: str) -> Optional[bytes]:
+        """A fresh, verified section copied out of the buffer (caller holds the lock)"""
+        if not self.is_fresh(name):
+            return None
+        offset, length, crc = self._table["sections"][name]
+        payload = bytes(self._buffer[offset:offset + length])
+        if name in self._verified or zlib.crc32(payload) == crc:
+            self._verified.add(name)
+            return payload
+        return None
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """A fresh copy of a source's parsed JSON (decoded privately by each caller)"""
+        if self._ensure_fresh(name):
+            # Another thread may re-open (and close) the buffer; copy the bytes out under the lock
+            with self._lock:
+                payload = self._section(name)
+            if payload is not None:
+                return marshal.loads(payload)
+        try:
+            with open(self.sources[name], "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return default
+
+    def load_json(self, path: str) -> Any:
+        """json.load(open(path)) that is served from the snapshot when path is a fresh source"""
+        name = self._by_path.get(os.path.abspath(path))
+        if name is not None and self._ensure_fresh(name):
+            return self.get(name)
+        with open(path, "r") as f:
+            return json.load(f)
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+
+
+_snapshot: Optional[StartupSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_startup_snapshot() -> StartupSnapshot:
+    """
+    Process-wide snapshot, loaded and refreshed on first use. With
+    FUSION_SHARED_STATE set (a segment name) it is published in shared memory
+    for all worker processes; otherwise it is the FUSION_SNAPSHOT_PATH file.
+    """
+    global _snapshot
+    with _snapshot_lock:
+        if _snapshot is None:
+            snapshot = None
+            segment = os.getenv("FUSION_SHARED_STATE")
+            if segment:
+                from .shared_snapshot import SharedSnapshot, SHARED_MEMORY_AVAILABLE
+                if SHARED_MEMORY_AVAILABLE:
+                    snapshot = SharedSnapshot(segment)
+            if snapshot is None:
+                snapshot = StartupSnapshot(os.getenv("FUSION_SNAPSHOT_PATH", ".fusion_snapshot.bin"))
+            try:
+                snapshot.load()
+            except OSError:
+                pass  # read-only checkout: every lookup falls back to the JSON sources
+            _snapshot = snapshot
+        return _snapshot
+
+
+def load_json(path: str) -> Any:
+    """Parsed JSON for path, from the process-wide snapshot when it is current"""
+    return get_startup_snapshot().load_json(path)
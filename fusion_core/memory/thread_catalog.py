@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Thread Catalog - Fusion v15.4
+Per-user index of conversation threads for pickers and "recent" views.
+
+One SQLite database per user (``<user_dir>/catalog.sqlite3``) holds a row per
+thread, updated on every append. B-tree indexes on last interaction and topic,
+plus an agent -> thread table, answer listing and filtering queries in
+O(log n) without walking thread directories or parsing their JSON files.
+Catalogs are shared process-wide, one connection per user directory.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+CATALOG_FILE = "catalog.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS threads (
+    thread_id TEXT PRIMARY KEY,
+    created_at TEXT,
+    last_interaction TEXT,
+    current_topic TEXT,
+    interactions INTEGER NOT NULL DEFAULT 0,
+    preferred_agents TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS threads_by_last_interaction ON threads (last_interaction, thread_id);
+CREATE INDEX IF NOT EXISTS threads_by_topic ON threads (current_topic, last_interaction);
+CREATE TABLE IF NOT EXISTS thread_agents (
+    agent TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    PRIMARY KEY (agent, thread_id)
+) WITHOUT ROWID;
+"""
+
+
+class ThreadCatalog:
+    """Catalog of one user's threads."""
+
+    _shared: Dict[str, "ThreadCatalog"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, user_dir: Path):
+        self.path = Path(user_dir) / CATALOG_FILE
+        self.is_new = not self.path.exists()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.RLock()
+        self._refs = 0
+
+    @classmethod
+    def acquire(cls, user_dir: Path) -> "ThreadCatalog":
+        """The shared catalog of a user directory; pair with release()"""
+        key = str(Path(user_dir).resolve())
+        with cls._shared_lock:
+            catalog = cls._shared.get(key)
+            if catalog is None:
+                catalog = cls._shared[key] = cls(user_dir)
+            catalog._refs += 1
+            return catalog
+
+    def release(self) -> None:
+        """Drop a reference from acquire(); the last one closes the connection"""
+        with self._shared_lock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            key = str(self.path.parent.resolve())
+            if self._shared.get(key) is self:
+                del self._shared[key]
+        self.close()
+
+    def claim_backfill(self) -> bool:
+        """True exactly once for a newly created catalog, for whoever backfills it"""
+        with self._lock:
+            claimed, self.is_new = self.is_new, False
+            return claimed
+
+    def upsert(self, summary: Dict[str, Any]) -> None:
+        """Record a thread's summary (as returned by ThreadMemory.get_summary)"""
+        thread_id = summary["thread_id"]
+        agents = list(summary.get("preferred_agents") or [])
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO threads (thread_id, created_at, last_interaction, current_topic, "
+                "interactions, preferred_agents) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(thread_id) DO UPDATE SET created_at = excluded.created_at, "
+                "last_interaction = excluded.last_interaction, current_topic = excluded.current_topic, "
+                "interactions = excluded.interactions, preferred_agents = excluded.preferred_agents",
+                (thread_id, summary.get("created_at"), summary.get("last_interaction"),
+                 summary.get("current_topic"), summary.get("total_interactions", 0),
+                 json.dumps(agents)))
+            self._conn.execute("DELETE FROM thread_agents WHERE thread_id = ?", (thread_id,))
+            self._conn.executemany("INSERT INTO thread_agents (agent, thread_id) VALUES (?, ?)",
+                                   [(agent, thread_id) for agent in agents])
+
+    def remove(self, thread_id: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM threads WHERE thread_id = ?", (thread_id,))
+            self._conn.execute("DELETE FROM thread_agents WHERE thread_id = ?", (thread_id,))
+
+    def get(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM threads WHERE thread_id = ?", (thread_id,)).fetchone()
+        return self._row(row) if row else None
+
+    def list_threads(self, limit: int = 20, before: Optional[str] = None,
+                     topic: Optional[str] = None, agent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Threads by most recent interaction first.
+
+        Args:
+            limit: Maximum threads to return
+            before: Only threads whose last interaction is older (page cursor)
+            topic: Only threads whose current topic matches
+            agent: Only threads that used this agent
+        """
+        query = "SELECT t.* FROM threads t"
+        clauses, params = [], []
+        if agent is not None:
+            query += " JOIN thread_agents a ON a.thread_id = t.thread_id AND a.agent = ?"
+            params.append(agent)
+        if topic is not None:
+            clauses.append("t.current_topic = ?")
+            params.append(topic)
+        if before is not None:
+            clauses.append("t.last_interaction < ?")
+            params.append(before)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY t.last_interaction DESC, t.thread_id DESC LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            return [self._row(row) for row in self._conn.execute(query, params)]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM threads").fetchone()[0]
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict[str, Any]:
+        record = dict(row)
+        record["preferred_agents"] = json.loads(record["preferred_agents"])
+        return record
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -4,6 +4,7 @@ Thread Memory - Fusion v15.4
 Agents persist memory across user sessions and reuse context intelligently.
 """
 
+import hashlib
 import json
 import os
 import time
@@ -11,10 +12,22 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from fusion_core.memory.semantic_index import SemanticIndex, NUMPY_AVAILABLE
+from fusion_core.memory.segments import SegmentStore, TieredHistory
+from fusion_core.memory.output_codec import OutputCodec
+from fusion_core.memory.trigram_index import TrigramIndex
+from fusion_core.memory.thread_catalog import ThreadCatalog
+
+SEMANTIC_INDEX_DIR = ".semantic_index"
+DICTIONARY_DIR = ".dictionaries"
+TOPICS = ["design", "development", "analysis", "strategy", "content", "evaluation"]
+
 class ThreadMemory:
     """Persistent conversation memory across user sessions."""
     
-    def __init__(self, user_id: str, thread_id: str, memory_dir: str = "thread_memory"):
+    def __init__(self, user_id: str, thread_id: str, memory_dir: str = "thread_memory",
+                 semantic_recall: bool = True, hot_limit: int = 200, segment_size: int = 500,
+                 compress_outputs: bool = True):
         self.user_id = user_id
         self.thread_id = thread_id
         self.memory_dir = Path(memory_dir)
@@ -24,35 +37,172 @@ class ThreadMemory:
         self.user_dir = self.memory_dir / user_id
         self.user_dir.mkdir(exist_ok=True)
         
-        self.thread_dir = self.user_dir / thread_id
-        self.thread_dir.mkdir(exist_ok=True)
+        # Threads fan out into hashed buckets so users with many threads
+        # never have one huge directory; flat legacy layouts are moved over
+        self.thread_dir = self.thread_path(self.user_dir, thread_id)
+        legacy_dir = self.user_dir / thread_id
+        if legacy_dir.is_dir() and not self.thread_dir.exists():
+            self.thread_dir.parent.mkdir(exist_ok=True)
+            legacy_dir.rename(self.thread_dir)
+        self.thread_dir.mkdir(parents=True, exist_ok=True)
         
         # Memory file paths
         self.history_file = self.thread_dir / "history.json"
         self.summary_file = self.thread_dir / "summary.json"
         self.context_file = self.thread_dir / "context.json"
+        self.segments_dir = self.thread_dir / "segments"
+        self.hot_limit = hot_limit
+        self.segment_size = segment_size
+        
+        # Output compression dictionary shared by all of the user's threads
+        self.codec = OutputCodec(str(self.user_dir / DICTIONARY_DIR)) if compress_outputs else None
+        
+        # Per-user semantic index shared by all of the user's threads (needs numpy)
+        self.semantic_index = None
+        if semantic_recall and NUMPY_AVAILABLE:
+            self.semantic_index = SemanticIndex(str(self.user_dir / SEMANTIC_INDEX_DIR))
+        
+        # Substring search index, built on first search
+        self._search_index = None
         
         # Load existing memory
         self.history = self._load_history()
         self.summary = self._load_summary()
         self.context = self._load_context()
+        
+        # Per-user catalog of threads, shared by every open thread of the user
+        # until close(); a new catalog is backfilled from disk once
+        self._catalog: Optional[ThreadCatalog] = None
+        self._open_catalog()
+    
+    def _open_catalog(self) -> ThreadCatalog:
+        if self._catalog is None:
+            self._catalog = ThreadCatalog.acquire(self.user_dir)
+            self._backfill_catalog(self.user_dir, self._catalog)
+        return self._catalog
     
-    def _load_history(self) -> List[Dict[str, Any]]:
-        """Load conversation history."""
+    @property
+    def catalog(self) -> ThreadCatalog:
+        """The user's shared catalog, reacquired if this thread was closed."""
+        return self._open_catalog()
+    
+    def close(self) -> None:
+        """Release this thread's reference to the user's shared catalog."""
+        if self._catalog is not None:
+            self._catalog.release()
+            self._catalog = None
+    
+    def __enter__(self) -> "ThreadMemory":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    @staticmethod
+    def thread_path(user_dir: Path, thread_id: str) -> Path:
+        """Directory of a thread: <user_dir>/<2-hex-digit bucket>/<thread_id>"""
+        bucket = hashlib.sha1(thread_id.encode("utf-8")).hexdigest()[:2]
+        return Path(user_dir) / bucket / thread_id
+    
+    @staticmethod
+    def _thread_dirs(user_dir: Path) -> List[Path]:
+        """Every thread directory of a user, in both bucketed and flat legacy layouts"""
+        return sorted({path.parent for layout in ("*/*/", "*/") for name in ("summary.json", "history.json")
+                       for path in user_dir.glob(layout + name)})
+    
+    @classmethod
+    def _backfill_catalog(cls, user_dir: Path, catalog: ThreadCatalog) -> None:
+        """Catalog threads written before the catalog existed (one directory walk)"""
+        if not catalog.claim_backfill():
+            return
+        for thread_dir in cls._thread_dirs(user_dir):
+            try:
+                summary = {}
+                if (thread_dir / "summary.json").exists():
+                    with open(thread_dir / "summary.json", 'r') as f:
+                        summary = json.load(f)
+                context = {}
+                if (thread_dir / "context.json").exists():
+                    with open(thread_dir / "context.json", 'r') as f:
+                        context = json.load(f)
+                hot = []
+                if (thread_dir / "history.json").exists():
+                    with open(thread_dir / "history.json", 'r') as f:
+                        hot = json.load(f)
+            except Exception as e:
+                print(f"⚠️ Error cataloging thread {thread_dir.name}: {e}")
+                continue
+            catalog.upsert({
+                "thread_id": thread_dir.name,
+                "created_at": summary.get("created_at"),
+                "total_interactions": summary.get("total_interactions", 0),
+                "current_topic": context.get("current_topic"),
+                "preferred_agents": context.get("preferred_agents", []),
+                "last_interaction": hot[-1]["timestamp"] if hot else None
+            })
+    
+    @classmethod
+    def list_threads(cls, user_id: str, memory_dir: str = "thread_memory", limit: int = 20,
+                     before: Optional[str] = None, topic: Optional[str] = None,
+                     agent: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        A user's threads, most recently active first, from the catalog.
+        
+        Args:
+            user_id: User whose threads to list
+            memory_dir: Thread memory root
+            limit: Maximum threads to return
+            before: Last interaction timestamp to page from
+            topic: Only threads currently on this topic
+            agent: Only threads that used this agent
+            
+        Returns:
+            Catalog records (thread_id, created_at, last_interaction, current_topic,
+            interactions, preferred_agents)
+        """
+        user_dir = Path(memory_dir) / user_id
+        if not user_dir.is_dir():
+            return []
+        catalog = ThreadCatalog.acquire(user_dir)
+        try:
+            cls._backfill_catalog(user_dir, catalog)
+            return catalog.list_threads(limit, before, topic, agent)
+        finally:
+            catalog.release()
+    
+    def _load_history(self) -> TieredHistory:
+        """Load conversation history (hot tail in memory, older entries in cold segments)."""
+        hot = []
         if self.history_file.exists():
             try:
                 with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                    hot = json.load(f)
+                if self.codec:
+                    self.codec.decode_entries(hot)
+                    for interaction in hot:
+                        self.codec.observe(interaction["output"])
             except Exception as e:
                 print(f"⚠️ Error loading history: {e}")
-        return []
+        history = TieredHistory(SegmentStore(str(self.segments_dir)), hot,
+                                self.hot_limit, self.segment_size)
+        # Histories written before tiering are moved to segments on first load
+        if history.compact():
+            self._write_history(history)
+        return history
     
     def _load_summary(self) -> Dict[str, Any]:
         """Load conversation summary."""
         if self.summary_file.exists():
             try:
                 with open(self.summary_file, 'r') as f:
-                    return json.load(f)
+                    summary = json.load(f)
+                # Summaries written before aggregates existed are rebuilt with one scan
+                if "aggregates" not in summary:
+                    summary["aggregates"] = self._empty_aggregates()
+                    for interaction in self.history:
+                        self._aggregate(summary["aggregates"], interaction,
+                                        interaction["input"].lower(), interaction["output"].lower())
+                return summary
             except Exception as e:
                 print(f"⚠️ Error loading summary: {e}")
         return {
@@ -60,7 +210,8 @@ class ThreadMemory:
             "total_interactions": 0,
             "topics": [],
             "key_insights": [],
-            "user_preferences": {}
+            "user_preferences": {},
+            "aggregates": self._empty_aggregates()
         }
     
     def _load_context(self) -> Dict[str, Any]:
@@ -95,8 +246,17 @@ class ThreadMemory:
             "metadata": metadata or {}
         }
         
+        if self.codec:
+            self.codec.observe(output_text)
         self.history.append(interaction)
         self.summary["total_interactions"] += 1
+        if self._search_index is not None:
+            self._search_index.add(len(self.history) - 1, (input_text, output_text))
+        
+        if self.semantic_index:
+            self.semantic_index.add(self.thread_id, len(self.history) - 1,
+                                    f"{input_text} {output_text}",
+                                    self._recall_record(interaction))
         
         # Update context based on interaction
         self._update_context(interaction)
@@ -105,6 +265,7 @@ class ThreadMemory:
         self._save_history()
         self._save_summary()
         self._save_context()
+        self.catalog.upsert(self.get_summary())
     
     def _update_context(self, interaction: Dict[str, Any]) -> None:
         """Update conversation context based on new interaction."""
@@ -131,11 +292,46 @@ class ThreadMemory:
                 self.context["preferred_agents"].append(agent_name)
         
         # Update current topic (simple keyword detection)
-        topics = ["design", "development", "analysis", "strategy", "content", "evaluation"]
-        for topic in topics:
+        for topic in TOPICS:
             if topic in input_text or topic in output_text:
                 self.context["current_topic"] = topic
                 break
+        
+        # Running aggregates behind get_insights, reusing the lowercased text
+        self._aggregate(self.summary["aggregates"], interaction, input_text, output_text)
+    
+    @staticmethod
+    def _empty_aggregates() -> Dict[str, Any]:
+        return {
+            "count": 0,
+            "first_timestamp": None,
+            "last_timestamp": None,
+            "total_input_length": 0,
+            "total_output_length": 0,
+            "topic_counts": {},
+            "agent_stats": {}
+        }
+    
+    @staticmethod
+    def _aggregate(aggregates: Dict[str, Any], interaction: Dict[str, Any],
+                   input_text: str, output_text: str) -> None:
+        """Fold one interaction into the running insight aggregates."""
+        aggregates["count"] += 1
+        aggregates["first_timestamp"] = aggregates["first_timestamp"] or interaction["timestamp"]
+        aggregates["last_timestamp"] = interaction["timestamp"]
+        aggregates["total_input_length"] += len(interaction["input"])
+        aggregates["total_output_length"] += len(interaction["output"])
+        
+        for topic in TOPICS:
+            if topic in input_text or topic in output_text:
+                aggregates["topic_counts"][topic] = aggregates["topic_counts"].get(topic, 0) + 1
+        
+        metadata = interaction.get("metadata") or {}
+        if "agent" in metadata:
+            stats = aggregates["agent_stats"].setdefault(
+                metadata["agent"], {"count": 0, "total_confidence": 0.0})
+            stats["count"] += 1
+            stats["total_confidence"] += metadata.get("confidence", 0.0)
     
     def get_context(self, max_interactions: int = 5) -> str:
         """
@@ -199,16 +395,79 @@ class ThreadMemory:
         query_lower = query.lower()
         results = []
         
-        for interaction in self.history:
+        # Trigram candidates are a superset of the matches; verify each one
+        positions = self._trigram_index().candidates(query)
+        interactions = (self.history if positions is None
+                        else (self.history[position] for position in positions))
+        
+        for interaction in interactions:
             if (query_lower in interaction["input"].lower() or
                 query_lower in interaction["output"].lower()):
                 results.append(interaction)
         
         return results
     
+    def _trigram_index(self) -> TrigramIndex:
+        """Trigram index over this thread's inputs and outputs, kept current by append"""
+        if self._search_index is None:
+            self._search_index = TrigramIndex()
+            for position, interaction in enumerate(self.history):
+                self._search_index.add(position, (interaction["input"], interaction["output"]))
+        return self._search_index
+    
+    def recall(self, query: str, k: int = 5, exclude_current: bool = False) -> List[Dict[str, Any]]:
+        """
+        Top-k relevant past interactions across all of this user's threads.
+        
+        Args:
+            query: Free-text query
+            k: Number of interactions to return
+            exclude_current: Skip interactions from this thread
+            
+        Returns:
+            Interaction records (thread_id, position, timestamp, input/output preview, score)
+        """
+        if not self.semantic_index:
+            return []
+        return self.semantic_index.search(query, k,
+                                          exclude_thread=self.thread_id if exclude_current else None)
+    
+    @staticmethod
+    def _recall_record(interaction: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "timestamp": interaction["timestamp"],
+            "input": interaction["input"][:200],
+            "output": interaction["output"][:200],
+            "agent": interaction.get("metadata", {}).get("agent")
+        }
+    
+    @classmethod
+    def build_semantic_index(cls, user_id: str, memory_dir: str = "thread_memory") -> int:
+        """Index a user's existing threads (one-off backfill); returns interactions indexed"""
+        user_dir = Path(memory_dir) / user_id
+        index = SemanticIndex(str(user_dir / SEMANTIC_INDEX_DIR))
+        if index.size:
+            return 0
+        
+        codec = OutputCodec(str(user_dir / DICTIONARY_DIR))
+        indexed = 0
+        for thread_dir in cls._thread_dirs(user_dir):
+            if not (thread_dir / "history.json").exists():
+                continue
+            with open(thread_dir / "history.json", 'r') as f:
+                hot = codec.decode_entries(json.load(f))
+            history = TieredHistory(SegmentStore(str(thread_dir / "segments")), hot)
+            for position, interaction in enumerate(history):
+                index.add(thread_dir.name, position,
+                          f"{interaction['input']} {interaction['output']}",
+                          cls._recall_record(interaction))
+                indexed += 1
+        index.wait_for_training()
+        return indexed
+    
     def get_insights(self) -> Dict[str, Any]:
-        """Generate insights from the conversation."""
-        if not self.history:
+        """Generate insights from the conversation (O(1) from running aggregates)."""
+        if not self.summary["aggregates"]["count"]:
             return {}
         
         insights = {
@@ -221,54 +480,46 @@ class ThreadMemory:
         
         return insights
     
+    def _duration(self) -> timedelta:
+        aggregates = self.summary["aggregates"]
+        return (datetime.fromisoformat(aggregates["last_timestamp"]) -
+                datetime.fromisoformat(aggregates["first_timestamp"]))
+    
     def _calculate_duration(self) -> str:
         """Calculate conversation duration."""
-        if len(self.history) < 2:
+        if self.summary["aggregates"]["count"] < 2:
             return "0 minutes"
         
-        first_time = datetime.fromisoformat(self.history[0]["timestamp"])
-        last_time = datetime.fromisoformat(self.history[-1]["timestamp"])
-        duration = last_time - first_time
-        
-        minutes = duration.total_seconds() / 60
+        minutes = self._duration().total_seconds() / 60
         return f"{minutes:.1f} minutes"
     
     def _calculate_frequency(self) -> str:
         """Calculate interaction frequency."""
-        if len(self.history) < 2:
+        count = self.summary["aggregates"]["count"]
+        if count < 2:
             return "N/A"
         
-        first_time = datetime.fromisoformat(self.history[0]["timestamp"])
-        last_time = datetime.fromisoformat(self.history[-1]["timestamp"])
-        duration = last_time - first_time
-        
+        duration = self._duration()
         if duration.total_seconds() == 0:
             return "N/A"
         
-        frequency = len(self.history) / (duration.total_seconds() / 60)
+        frequency = count / (duration.total_seconds() / 60)
         return f"{frequency:.1f} interactions/minute"
     
     def _extract_topics(self) -> List[str]:
         """Extract common topics from conversation."""
-        topics = ["design", "development", "analysis", "strategy", "content", "evaluation"]
-        topic_counts = {topic: 0 for topic in topics}
-        
-        for interaction in self.history:
-            text = f"{interaction['input']} {interaction['output']}".lower()
-            for topic in topics:
-                if topic in text:
-                    topic_counts[topic] += 1
-        
-        return [topic for topic, count in topic_counts.items() if count > 0]
+        topic_counts = self.summary["aggregates"]["topic_counts"]
+        return [topic for topic in TOPICS if topic_counts.get(topic, 0) > 0]
     
     def _estimate_satisfaction(self) -> str:
         """Estimate user satisfaction based on interaction patterns."""
-        if not self.history:
+        aggregates = self.summary["aggregates"]
+        if not aggregates["count"]:
             return "Unknown"
         
         # Simple heuristic based on interaction length and frequency
-        avg_input_length = sum(len(i["input"]) for i in self.history) / len(self.history)
-        avg_output_length = sum(len(i["output"]) for i in self.history) / len(self.history)
+        avg_input_length = aggregates["total_input_length"] / aggregates["count"]
+        avg_output_length = aggregates["total_output_length"] / aggregates["count"]
         
         if avg_input_length > 100 and avg_output_length > 200:
             return "High"
@@ -281,32 +532,25 @@ class ThreadMemory:
         """Analyze agent performance in this thread."""
         agent_stats = {}
         
-        for interaction in self.history:
-            if "metadata" in interaction and "agent" in interaction["metadata"]:
-                agent_name = interaction["metadata"]["agent"]
-                if agent_name not in agent_stats:
-                    agent_stats[agent_name] = {
-                        "count": 0,
-                        "avg_confidence": 0.0,
-                        "total_confidence": 0.0
-                    }
-                
-                agent_stats[agent_name]["count"] += 1
-                confidence = interaction["metadata"].get("confidence", 0.0)
-                agent_stats[agent_name]["total_confidence"] += confidence
-        
-        # Calculate averages
-        for agent_name, stats in agent_stats.items():
-            if stats["count"] > 0:
-                stats["avg_confidence"] = stats["total_confidence"] / stats["count"]
+        for agent_name, stats in self.summary["aggregates"]["agent_stats"].items():
+            agent_stats[agent_name] = {
+                "count": stats["count"],
+                "avg_confidence": stats["total_confidence"] / stats["count"] if stats["count"] else 0.0,
+                "total_confidence": stats["total_confidence"]
+            }
         
         return agent_stats
     
     def _save_history(self) -> None:
         """Save history to disk."""
+        self._write_history(self.history)
+    
+    def _write_history(self, history: TieredHistory) -> None:
+        """Write the hot tail; cold segments are immutable and already on disk."""
         try:
             with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
+                hot = self.codec.encode_entries(history.hot) if self.codec else history.hot
+                json.dump(hot, f, indent=2)
         except Exception as e:
             print(f"❌ Error saving history: {e}")
     
@@ -328,13 +572,17 @@ class ThreadMemory:
     
     def clear(self) -> None:
         """Clear all thread memory."""
-        self.history = []
+        self.history.clear()
+        self._search_index = None
+        if self.semantic_index:
+            self.semantic_index.remove_thread(self.thread_id)
         self.summary = {
             "created_at": datetime.now().isoformat(),
             "total_interactions": 0,
             "topics": [],
             "key_insights": [],
-            "user_preferences": {}
+            "user_preferences": {},
+            "aggregates": self._empty_aggregates()
         }
         self.context = {
             "current_topic": None,
@@ -347,6 +595,7 @@ class ThreadMemory:
         self._save_history()
         self._save_summary()
         self._save_context()
+        self.catalog.upsert(self.get_summary())
 
 # Example usage
 def main():
@@ -376,6 +625,7 @@ def main():
     insights = thread.get_insights()
     print("\n📊 Thread Insights:")
     print(json.dumps(insights, indent=2))
+    thread.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
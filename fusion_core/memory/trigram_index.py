@@ -0,0 +1,45 @@
+# fusion_core/memory/trigram_index.py
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+
+def trigrams(text: str) -> Set[str]:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    Inverted index from lowercase character trigrams to entry positions.
+    Any entry containing a query substring contains all of the query's
+    trigrams, so intersecting their postings yields a candidate superset
+    that callers verify with the original substring test.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = defaultdict(set)
+        self.size = 0
+
+    def add(self, position: int, texts: Iterable[str]) -> None:
+        grams: Set[str] = set()
+        for text in texts:
+            if isinstance(text, str):
+                grams |= trigrams(text)
+        for gram in grams:
+            self._postings[gram].add(position)
+        self.size += 1
+
+    def candidates(self, query: str) -> Optional[List[int]]:
+        """Sorted positions that may contain query, or None when it is too short to narrow"""
+        grams = trigrams(query)
+        if not grams:
+            return None
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return []
+        return sorted(postings[0].intersection(*postings[1:]))
+
+    def clear(self) -> None:
+        self._postings.clear()
+        self.size = 0
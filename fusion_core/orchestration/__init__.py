@@ -1,5 +1,15 @@
 # fusion_core/orchestration/__init__.py
 
 from .multi_agent_orchestrator import MultiAgentOrchestrator
+from .process_pool_backend import ProcessPoolAgentBackend
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+from .result_cache import ResultCache
 
-__all__ = ["MultiAgentOrchestrator"] 
\ No newline at end of file
+__all__ = [
+    "MultiAgentOrchestrator",
+    "ProcessPoolAgentBackend",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "ResultCache"
+] 
\ No newline at end of file
@@ -0,0 +1,165 @@
+# fusion_core/orchestration/circuit_breaker.py
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional
+
+from fusion_core.memory.state_snapshot import load_json
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when an agent's circuit is open and no fallback is available"""
+
+    def __init__(self, agent_name: str):
+        super().__init__(f"Circuit open for agent {agent_name}")
+        self.agent_name = agent_name
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker over a rolling window of agent calls"""
+
+    def __init__(self, agent_name: str, window_size: int = 20, min_calls: int = 5,
+                 error_rate_threshold: float = 0.5, latency_threshold: Optional[float] = None,
+                 reset_timeout: float = 30.0, half_open_max_calls: int = 1):
+        self.agent_name = agent_name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self.outcomes = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self._state = CLOSED
+        self._trial_calls = 0
+        self._trial_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open circuits to half-open once the timeout passes"""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == OPEN and time.time() - self.opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._trial_calls = 0
+            self._trial_successes = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Whether a call may go through; half-open admits a few trial calls"""
+        with self._lock:
+            state = self._current_state()
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and self._trial_calls < self.half_open_max_calls:
+                self._trial_calls += 1
+                return True
+            return False
+
+    def record(self, success: bool, latency: float = 0.0):
+        """Record a call outcome; calls slower than latency_threshold count as failures"""
+        if self.latency_threshold is not None and latency > self.latency_threshold:
+            success = False
+
+        with self._lock:
+            state = self._current_state()
+            if state == HALF_OPEN:
+                if not success:
+                    self._trip()
+                    return
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_max_calls:
+                    self._state = CLOSED
+                    self.outcomes.clear()
+                return
+
+            self.outcomes.append(success)
+            if state == CLOSED and len(self.outcomes) >= self.min_calls:
+                error_rate = self.outcomes.count(False) / len(self.outcomes)
+                if error_rate >= self.error_rate_threshold:
+                    self._trip()
+
+    def _trip(self):
+        self._state = OPEN
+        self.opened_at = time.time()
+        self.outcomes.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get breaker state and rolling window statistics"""
+        with self._lock:
+            state = self._current_state()
+            calls = len(self.outcomes)
+            failures = self.outcomes.count(False)
+        return {
+            "state": state,
+            "window_calls": calls,
+            "window_failures": failures,
+            "error_rate": failures / calls if calls else 0.0
+        }
+
+
+class CircuitBreakerRegistry:
+    """Per-agent circuit breakers fed by AgentTelemetryLogger events"""
+
+    def __init__(self, fallback_config_path: str = "fallback_trigger_config.json",
+                 **breaker_options):
+        self.breaker_options = breaker_options
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.fallback_config = self._load_fallback_config(fallback_config_path)
+        self._lock = threading.Lock()
+
+    def _load_fallback_config(self, path: str) -> Dict[str, Any]:
+        try:
+            return load_json(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def breaker(self, agent_name: str) -> CircuitBreaker:
+        """Get (or create) the breaker for an agent"""
+        with self._lock:
+            if agent_name not in self.breakers:
+                self.breakers[agent_name] = CircuitBreaker(agent_name, **self.breaker_options)
+            return self.breakers[agent_name]
+
+    def allow(self, agent_name: str) -> bool:
+        """Whether traffic may be routed to an agent"""
+        return self.breaker(agent_name).allow_request()
+
+    def record(self, agent_name: str, success: bool, latency: float = 0.0):
+        """Record an agent call outcome directly"""
+        self.breaker(agent_name).record(success, latency)
+
+    def record_event(self, event: Dict[str, Any]):
+        """Telemetry listener: feed agent execution events into the breakers"""
+        if "agent" not in event or event.get("type"):
+            return
+        fallback = event.get("fallback")
+        if fallback in ("circuit_open", "cache_hit"):
+            return
+        self.record(event["agent"], fallback != "error_handling", event.get("execution_time", 0.0))
+
+    def attach(self, telemetry_logger):
+        """Subscribe to a telemetry logger's event stream"""
+        telemetry_logger.add_listener(self.record_event)
+
+    def fallback_for(self, agent_name: str) -> Dict[str, Any]:
+        """Get the configured fallback pattern and agent for an open circuit"""
+        pattern_routing = self.fallback_config.get("pattern_routing", {})
+        return {
+            "pattern": pattern_routing.get(agent_name),
+            "agent": self.fallback_config.get("default_fallback_agent")
+        }
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get breaker status for every agent seen so far"""
+        with self._lock:
+            breakers = dict(self.breakers)
+        return {name: breaker.get_status() for name, breaker in breakers.items()}
@@ -3,17 +3,30 @@
 import asyncio
 import time
 from typing import Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor
 import json
 
+from .process_pool_backend import ProcessPoolAgentBackend, call_agent
+
 class MultiAgentOrchestrator:
     def __init__(self, agents: Dict[str, Any], evaluator_agent=None, 
-                 telemetry_logger=None, memory_manager=None):
+                 telemetry_logger=None, memory_manager=None,
+                 max_concurrent_evaluations: int = 4,
+                 execution_backend: str = "async", max_workers: Optional[int] = None,
+                 circuit_breakers=None, result_cache=None):
         self.agents = agents
         self.evaluator = evaluator_agent
         self.telemetry = telemetry_logger
         self.memory = memory_manager
-        self.executor = ThreadPoolExecutor(max_workers=10)
+        self.circuit_breakers = circuit_breakers
+        self.result_cache = result_cache
+        if circuit_breakers and telemetry_logger:
+            circuit_breakers.attach(telemetry_logger)
+        self.max_concurrent_evaluations = max(1, max_concurrent_evaluations)
+        if execution_backend not in ("async", "process"):
+            raise ValueError(f"Unknown execution backend: {execution_backend}")
+        self.execution_backend = execution_backend
+        self.process_backend = (ProcessPoolAgentBackend(agents, max_workers)
+                                if execution_backend == "process" else None)
 
     async def run_parallel(self, input_text: str, agent_names: List[str] = None) -> Dict[str, Any]:
         """Run multiple agents in parallel and aggregate results"""
@@ -27,13 +40,15 @@ class MultiAgentOrchestrator:
         if not available_agents:
             return {"error": "No agents available", "results": []}
         
-        # Run agents in parallel
+        # Each agent's result is evaluated as soon as it arrives; the semaphore
+        # bounds how many evaluator runs are in flight at once
+        evaluation_slots = asyncio.Semaphore(self.max_concurrent_evaluations)
         tasks = []
         for agent_name, agent in available_agents.items():
-            task = self._run_agent_async(agent_name, agent, input_text)
+            task = self._run_and_evaluate(agent_name, agent, input_text, evaluation_slots)
             tasks.append(task)
         
-        # Wait for all agents to complete
+        # Wait for all agents (and their evaluations) to complete
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Process results and handle exceptions
@@ -50,14 +65,8 @@ class MultiAgentOrchestrator:
             else:
                 processed_results.append(result)
         
-        # Evaluate results if evaluator is available
-        evaluations = []
-        if self.evaluator:
-            for result in processed_results:
-                if result["success"]:
-                    eval_result = await self._evaluate_result(result, input_text)
-                    evaluations.append(eval_result)
-                    result["evaluation"] = eval_result
+        evaluations = [result["evaluation"] for result in processed_results
+                       if "evaluation" in result]
         
         # Sort by evaluation score if available
         if evaluations:
@@ -77,26 +86,80 @@ class MultiAgentOrchestrator:
             "agent_count": len(available_agents)
         }
 
+    async def _run_and_evaluate(self, agent_name: str, agent: Any, input_text: str,
+                                evaluation_slots: asyncio.Semaphore) -> Dict[str, Any]:
+        """Run a single agent and evaluate its result within a bounded slot"""
+        result = await self._run_agent_async(agent_name, agent, input_text)
+        
+        if self.evaluator and result["success"]:
+            async with evaluation_slots:
+                result["evaluation"] = await self._evaluate_result(result, input_text)
+        
+        return result
+
     async def _run_agent_async(self, agent_name: str, agent: Any, input_text: str) -> Dict[str, Any]:
         """Run a single agent asynchronously"""
+        enhanced_input = self._effective_input(agent_name, input_text)
+        
+        # Serve repeated and near-duplicate prompts from the result cache. This
+        # comes before the breaker so a hit never claims a half-open trial call
+        # that no outcome would be recorded for
+        cached = self._cached_result(agent_name, input_text, enhanced_input)
+        if cached:
+            return cached
+        
+        if self.circuit_breakers and not self.circuit_breakers.allow(agent_name):
+            return await self._short_circuit(agent_name, input_text)
+        
+        return await self._execute_agent(agent_name, agent, input_text, enhanced_input)
+
+    def _effective_input(self, agent_name: str, input_text: str) -> str:
+        """The input the agent actually receives: the request plus its memory context"""
+        context = self.memory.get_context(agent_name) if self.memory else ""
+        return f"{context}\n\nCurrent Request: {input_text}" if context else input_text
+
+    def _cached_result(self, agent_name: str, input_text: str,
+                       enhanced_input: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached output for the agent's effective input, so a changed memory
+        context misses. Hits are logged as cache events; they are not appended
+        to memory (that would change the context the entry was cached under).
+        """
+        if not self.result_cache:
+            return None
+        cached = self.result_cache.get(agent_name, enhanced_input)
+        if not cached:
+            return None
+        
+        if self.telemetry:
+            self.telemetry.log_event(
+                agent=agent_name,
+                input_text=input_text,
+                output_text=str(cached["output"]),
+                fallback="cache_hit"
+            )
+        return {
+            "agent": agent_name,
+            "output": cached["output"],
+            "success": True,
+            "execution_time": 0,
+            "cache": {key: cached[key] for key in ("match", "similarity", "cached_prompt")}
+        }
+
+    async def _execute_agent(self, agent_name: str, agent: Any, input_text: str,
+                             enhanced_input: Optional[str] = None) -> Dict[str, Any]:
+        """Run an agent the breakers have admitted, recording its outcome"""
         start_time = time.time()
         
         try:
-            # Get agent context from memory if available
-            context = ""
-            if self.memory:
-                context = self.memory.get_context(agent_name)
+            if enhanced_input is None:
+                enhanced_input = self._effective_input(agent_name, input_text)
             
-            # Prepare input with context
-            enhanced_input = f"{context}\n\nCurrent Request: {input_text}" if context else input_text
-            
-            # Run agent
-            if hasattr(agent, 'run'):
-                output = await agent.run(enhanced_input)
-            elif hasattr(agent, '__call__'):
-                output = await agent(enhanced_input)
+            # Run agent, in a warm worker process when the backend supports it
+            if self.process_backend and self.process_backend.supports(agent_name):
+                output = await self.process_backend.run(agent_name, enhanced_input)
             else:
-                output = str(agent)
+                output = await call_agent(agent, enhanced_input)
             
             execution_time = time.time() - start_time
             
@@ -107,15 +170,24 @@ class MultiAgentOrchestrator:
                     "success": True
                 })
             
-            # Log telemetry
+            # Agents that catch their own exceptions report them as an error field
+            failed = isinstance(output, dict) and "error" in output
+            
+            # Log telemetry (which also feeds the circuit breakers)
             if self.telemetry:
                 self.telemetry.log_event(
                     agent=agent_name,
                     input_text=input_text,
                     output_text=output,
                     execution_time=execution_time,
-                    confidence=0.8  # Default confidence
+                    confidence=0.8,  # Default confidence
+                    fallback="error_handling" if failed else None
                 )
+            elif self.circuit_breakers:
+                self.circuit_breakers.record(agent_name, not failed, execution_time)
+            
+            if self.result_cache and not failed:
+                self.result_cache.put(agent_name, enhanced_input, output)
             
             return {
                 "agent": agent_name,
@@ -144,6 +216,8 @@ class MultiAgentOrchestrator:
                     execution_time=execution_time,
                     fallback="error_handling"
                 )
+            elif self.circuit_breakers:
+                self.circuit_breakers.record(agent_name, False, execution_time)
             
             return {
                 "agent": agent_name,
@@ -152,6 +226,43 @@ class MultiAgentOrchestrator:
                 "execution_time": execution_time
             }
 
+    async def _short_circuit(self, agent_name: str, input_text: str) -> Dict[str, Any]:
+        """Route around an agent whose circuit is open"""
+        fallback = self.circuit_breakers.fallback_for(agent_name)
+        fallback_agent = fallback["agent"]
+        
+        if self.telemetry:
+            self.telemetry.log_event(
+                agent=agent_name,
+                input_text=input_text,
+                output_text="Circuit open",
+                fallback="circuit_open"
+            )
+        
+        # The fallback runs directly rather than through _run_agent_async, so an
+        # open fallback circuit ends the chain instead of recursing into it
+        if (fallback_agent in self.agents and fallback_agent != agent_name
+                and self.circuit_breakers.allow(fallback_agent)):
+            result = await self._execute_agent(fallback_agent, self.agents[fallback_agent], input_text)
+            result["fallback_for"] = agent_name
+            result["fallback_pattern"] = fallback["pattern"]
+            return result
+        
+        return {
+            "agent": agent_name,
+            "output": f"Error: circuit open for {agent_name}",
+            "success": False,
+            "execution_time": 0,
+            "circuit_open": True,
+            "fallback_pattern": fallback["pattern"]
+        }
+
+    @staticmethod
+    def _output_text(output: Any) -> str:
+        """The report an output stands for (structured agent results render on demand)"""
+        render = getattr(output, "render", None)
+        return render() if callable(render) else str(output)
+
     async def _evaluate_result(self, result: Dict[str, Any], original_input: str) -> Dict[str, Any]:
         """Evaluate a single result using the evaluator agent"""
         if not self.evaluator:
@@ -163,7 +274,7 @@ class MultiAgentOrchestrator:
             
             Original Input: {original_input}
             Agent: {result['agent']}
-            Output: {result['output']}
+            Output: {self._output_text(result['output'])}
             
             Provide a score (0-1) and brief evaluation.
             """
@@ -227,18 +338,31 @@ class MultiAgentOrchestrator:
                 "available": True,
                 "type": type(agent).__name__,
                 "has_run_method": hasattr(agent, 'run'),
-                "has_call_method": hasattr(agent, '__call__')
+                "has_call_method": hasattr(agent, '__call__'),
+                "execution_backend": ("process" if self.process_backend
+                                      and self.process_backend.supports(agent_name) else "async"),
+                "circuit": (self.circuit_breakers.breaker(agent_name).state
+                            if self.circuit_breakers else None)
             }
         return status
 
     def add_agent(self, name: str, agent: Any):
         """Add a new agent to the orchestrator"""
         self.agents[name] = agent
+        if self.process_backend:
+            self.process_backend.add_agent(name, agent)
 
     def remove_agent(self, name: str):
         """Remove an agent from the orchestrator"""
         if name in self.agents:
             del self.agents[name]
+        if self.process_backend:
+            self.process_backend.remove_agent(name)
+
+    def shutdown(self):
+        """Release worker processes held by the execution backend"""
+        if self.process_backend:
+            self.process_backend.shutdown()
 
     def get_session_stats(self) -> Dict[str, Any]:
         """Get current session statistics"""
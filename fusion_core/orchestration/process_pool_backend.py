@@ -0,0 +1,148 @@
+# fusion_core/orchestration/process_pool_backend.py
+
+import asyncio
+import importlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
+
+# Agents instantiated once per worker process by _init_worker
+_WORKER_AGENTS: Dict[str, Any] = {}
+
+
+def agent_spec(agent: Any) -> Optional[Tuple[str, str]]:
+    """
+    Return an importable (module, class) spec for an agent instance, if any.
+    Workers construct agents with no arguments, so classes whose constructor
+    requires arguments have no spec and stay on the async backend.
+    """
+    agent_class = type(agent)
+    module = agent_class.__module__
+    qualname = agent_class.__qualname__
+    if module in ("__main__", "builtins") or "<locals>" in qualname:
+        return None
+    try:
+        inspect.signature(agent_class).bind()
+    except (TypeError, ValueError):
+        return None
+    return module, qualname
+
+
+def _resolve(spec: Tuple[str, str]) -> Any:
+    module_name, qualname = spec
+    target = importlib.import_module(module_name)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target
+
+
+def _init_worker(specs: Dict[str, Tuple[str, str]]):
+    """Pre-instantiate every agent inside a freshly started worker"""
+    for agent_name, spec in specs.items():
+        try:
+            _WORKER_AGENTS[agent_name] = _resolve(spec)()
+        except Exception:
+            # One broken agent must not take the whole pool down; its runs fail instead
+            _WORKER_AGENTS.pop(agent_name, None)
+
+
+async def call_agent(agent: Any, input_text: str) -> Any:
+    """Invoke an agent the same way the in-process orchestrator does"""
+    if hasattr(agent, 'run'):
+        return await agent.run(input_text)
+    elif hasattr(agent, '__call__'):
+        return await agent(input_text)
+    return str(agent)
+
+
+def _run_in_worker(agent_name: str, input_text: str) -> str:
+    """
+    Run a warm agent in this worker and return its output as compact JSON.
+    Structured results (anything with to_record/from_record, like AgentResult)
+    are sent as their record plus their type, so the parent can rebuild them.
+    """
+    agent = _WORKER_AGENTS.get(agent_name)
+    if agent is None:
+        raise RuntimeError(f"Agent {agent_name} could not be constructed in the worker")
+    output = asyncio.run(call_agent(agent, input_text))
+    if hasattr(output, "to_record") and hasattr(type(output), "from_record"):
+        result_type = type(output)
+        payload = {"record": output.to_record(),
+                   "type": (result_type.__module__, result_type.__qualname__)}
+    else:
+        payload = {"value": output}
+    return json.dumps(payload, separators=(",", ":"), default=str)
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class ProcessPoolAgentBackend:
+    """Runs CPU-bound agents in a warm ProcessPoolExecutor"""
+
+    def __init__(self, agents: Dict[str, Any], max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.specs: Dict[str, Tuple[str, str]] = {}
+        self.agents: Dict[str, Any] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        for agent_name, agent in agents.items():
+            self.add_agent(agent_name, agent)
+
+    def supports(self, agent_name: str) -> bool:
+        """Whether the agent can be reconstructed inside worker processes"""
+        return agent_name in self.specs
+
+    def add_agent(self, agent_name: str, agent: Any):
+        """Register an agent; running workers are recycled to pick it up"""
+        spec = agent_spec(agent)
+        if spec is None:
+            self.remove_agent(agent_name)
+            return
+        self.agents[agent_name] = agent
+        if self.specs.get(agent_name) != spec:
+            self.specs[agent_name] = spec
+            self.shutdown(wait=False)
+
+    def remove_agent(self, agent_name: str):
+        """Stop routing an agent to the worker pool"""
+        self.agents.pop(agent_name, None)
+        if self.specs.pop(agent_name, None) is not None:
+            self.shutdown(wait=False)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(dict(self.specs),)
+            )
+        return self._pool
+
+    def warm_up(self) -> List[int]:
+        """Start every worker up front so the first requests skip agent setup"""
+        pool = self._get_pool()
+        futures = [pool.submit(_ping) for _ in range(self.max_workers)]
+        return sorted({future.result() for future in futures})
+
+    async def run(self, agent_name: str, input_text: str) -> Any:
+        """Run an agent in the pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        payload = json.loads(await loop.run_in_executor(self._get_pool(), _run_in_worker,
+                                                        agent_name, input_text))
+        if "record" in payload:
+            # Rebind the result's renderer to this process's agent
+            return _resolve(payload["type"]).from_record(payload["record"], self.agents.get(agent_name))
+        return payload["value"]
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shut down the worker pool (it is restarted lazily on next use). Agent
+        changes recycle the pool with wait=False, so in-flight runs finish in
+        the old workers without blocking the event loop.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
@@ -0,0 +1,108 @@
+# fusion_core/orchestration/result_cache.py
+
+import copy
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+
+from fusion_core.memory.near_duplicates import MinHasher, MinHashLSH, normalize_prompt
+
+
+class ResultCache:
+    """
+    LRU cache of agent outputs keyed by agent and prompt.
+    Exact matches are found by the normalized prompt. With similarity_threshold
+    below 1.0 (opt-in), near-duplicates (small wording changes) are also served
+    through a per-agent MinHash LSH index. Entries expire after ttl seconds,
+    and every hit returns a copy of the cached output.
+    """
+
+    def __init__(self, max_entries: int = 1024, similarity_threshold: float = 1.0,
+                 ttl: Optional[float] = 600, num_perm: int = 64):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.hasher = MinHasher(num_perm)
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._indexes: Dict[str, MinHashLSH] = {}
+        self.stats = {"hits": 0, "near_duplicate_hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _key(agent_name: str, prompt: str) -> str:
+        digest = hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+        return f"{agent_name}:{digest}"
+
+    def _index(self, agent_name: str) -> MinHashLSH:
+        if agent_name not in self._indexes:
+            self._indexes[agent_name] = MinHashLSH(self.similarity_threshold, hasher=self.hasher)
+        return self._indexes[agent_name]
+
+    def _expired(self, entry: Dict[str, Any]) -> bool:
+        return self.ttl is not None and time.time() - entry["stored_at"] > self.ttl
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry and entry["agent"] in self._indexes:
+            self._indexes[entry["agent"]].remove(key)
+
+    def get(self, agent_name: str, prompt: str) -> Optional[Dict[str, Any]]:
+        """Cached output for this prompt or a near-duplicate of it, with match details"""
+        key = self._key(agent_name, prompt)
+        match, similarity = key, 1.0
+
+        if key not in self._entries:
+            if self.similarity_threshold >= 1.0 or agent_name not in self._indexes:
+                match = None
+            else:
+                matches = self._index(agent_name).query(prompt)
+                match, similarity = matches[0] if matches else (None, 0.0)
+
+        entry = self._entries.get(match) if match else None
+        if entry and self._expired(entry):
+            self._drop(match)
+            entry = None
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(match)
+        exact = match == key
+        self.stats["hits" if exact else "near_duplicate_hits"] += 1
+        return {
+            "output": copy.deepcopy(entry["output"]),
+            "match": "exact" if exact else "near_duplicate",
+            "similarity": round(similarity, 3),
+            "cached_prompt": entry["prompt"]
+        }
+
+    def put(self, agent_name: str, prompt: str, output: Any) -> None:
+        key = self._key(agent_name, prompt)
+        self._entries[key] = {
+            "agent": agent_name,
+            "prompt": prompt,
+            "output": copy.deepcopy(output),
+            "stored_at": time.time()
+        }
+        self._entries.move_to_end(key)
+        if self.similarity_threshold < 1.0:
+            self._index(agent_name).add(key, prompt)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._indexes.clear()
+
+    def get_status(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["near_duplicate_hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "similarity_threshold": self.similarity_threshold,
+            "hit_rate": ((self.stats["hits"] + self.stats["near_duplicate_hits"]) / lookups
+                         if lookups else 0.0)
+        }
@@ -1,5 +1,6 @@
 # fusion_core/telemetry/__init__.py
 
 from .agent_telemetry import AgentTelemetryLogger
+from .structured_logging import configure_logging, log_kv, StructuredFormatter
 
-__all__ = ["AgentTelemetryLogger"] 
\ No newline at end of file
+__all__ = ["AgentTelemetryLogger", "configure_logging", "log_kv", "StructuredFormatter"]
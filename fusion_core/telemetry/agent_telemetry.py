@@ -3,17 +3,53 @@
 import time
 import json
 import os
+from itertools import chain
 from uuid import uuid4
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 
+from fusion_core.memory.ring_buffer import RingBuffer, jsonl_spill
+from fusion_core.memory.jsonl_stream import write_jsonl, iter_jsonl, ProgressCallback
+
+SESSION_SUFFIXES = {None: ".jsonl", "gzip": ".jsonl.gz", "zstd": ".jsonl.zst"}
+
+
+def session_base(name: str) -> Optional[str]:
+    """Session id of a saved session file name (JSONL or legacy JSON), else None"""
+    if name.endswith(".spill.jsonl"):
+        return None
+    for suffix in list(SESSION_SUFFIXES.values()) + [".json"]:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return None
+
+
+def read_session_events(session_file: str):
+    """Yield the events of one saved session file"""
+    if session_file.endswith(".json"):
+        # Single-document sessions written before the JSONL format
+        with open(session_file, "r") as f:
+            yield from json.load(f).get("events", [])
+        return
+    records = iter_jsonl(session_file)
+    next(records, None)  # session header
+    yield from records
+
+
 class AgentTelemetryLogger:
-    def __init__(self, session_id=None, log_dir="fusion_telemetry"):
+    def __init__(self, session_id=None, log_dir="fusion_telemetry", max_events: int = 10000,
+                 compress: Optional[str] = None):
         self.session_id = session_id or str(uuid4())
         self.start = time.time()
-        self.events = []
+        self.listeners = []
+        self.log_dir = log_dir
         os.makedirs(log_dir, exist_ok=True)
-        self.path = os.path.join(log_dir, f"{self.session_id}.json")
+        # Sessions are saved as JSONL: a header line, then one line per event
+        self.compress = compress
+        self.path = os.path.join(log_dir, f"{self.session_id}{SESSION_SUFFIXES[compress]}")
+        # Keep the newest max_events in memory; older events spill to disk
+        self.spill_path = os.path.join(log_dir, f"{self.session_id}.spill.jsonl")
+        self.events = RingBuffer(max_events, spill=jsonl_spill(self.spill_path))
 
     def log_event(self, agent: str, input_text: str, output_text: str, 
                   tokens_used: int = 0, fallback: Optional[str] = None, 
@@ -35,8 +71,14 @@ class AgentTelemetryLogger:
         }
         
         self.events.append(event)
+        for listener in self.listeners:
+            listener(event)
         return event
 
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]):
+        """Register a callback invoked with every agent execution event"""
+        self.listeners.append(listener)
+
     def log_parallel_execution(self, agent_results: List[Dict[str, Any]]):
         """Log results from parallel agent execution"""
         elapsed = round(time.time() - self.start, 2)
@@ -71,21 +113,20 @@ class AgentTelemetryLogger:
         self.events.append(eval_event)
         return eval_event
 
-    def save(self):
-        """Save telemetry data to disk"""
-        session_data = {
+    def save(self, progress: Optional[ProgressCallback] = None):
+        """Stream telemetry data to disk; returns the session header"""
+        header = {
             "session_id": self.session_id,
             "start_time": datetime.fromtimestamp(self.start).isoformat(),
             "end_time": datetime.now().isoformat(),
-            "total_events": len(self.events),
-            "events": self.events,
+            "total_events": len(self.events) + self.events.spilled,
+            "spilled_events": self.events.spilled,
+            "saved_events": len(self.events),
             "summary": self._generate_summary()
         }
         
-        with open(self.path, "w") as f:
-            json.dump(session_data, f, indent=2)
-        
-        return session_data
+        write_jsonl(self.path, chain([header], self.events), self.compress, progress=progress)
+        return header
 
     def _generate_summary(self) -> Dict[str, Any]:
         """Generate summary statistics from telemetry data"""
@@ -122,6 +163,32 @@ class AgentTelemetryLogger:
         
         return summary
 
+    def load_history(self, limit: Optional[int] = None):
+        """Yield events from saved sessions in the log directory, newest sessions first"""
+        session_files = [os.path.join(self.log_dir, name) for name in os.listdir(self.log_dir)
+                         if session_base(name) and os.path.join(self.log_dir, name) != self.path]
+        session_files.sort(key=os.path.getmtime, reverse=True)
+        
+        for session_file in session_files[:limit]:
+            try:
+                yield from read_session_events(session_file)
+            except (OSError, EOFError, json.JSONDecodeError):
+                continue
+            base = os.path.join(self.log_dir, session_base(os.path.basename(session_file)))
+            yield from self._read_spill(base + ".spill.jsonl")
+
+    @staticmethod
+    def _read_spill(spill_path: str):
+        """Yield events a session spilled to disk once its buffer was full"""
+        if not os.path.exists(spill_path):
+            return
+        with open(spill_path, "r") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
     def get_session_stats(self) -> Dict[str, Any]:
         """Get real-time session statistics"""
         return self._generate_summary()
@@ -152,5 +219,5 @@ class AgentTelemetryLogger:
 
     def clear_session(self):
         """Clear current session data (use with caution)"""
-        self.events = []
+        self.events.clear()
         self.start = time.time() 
\ No newline at end of file
@@ -0,0 +1,102 @@
+# fusion_core/telemetry/structured_logging.py
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formatter that appends a record's structured fields as key=value pairs"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = super().format(record)
+        fields = getattr(record, "fields", None)
+        if fields:
+            message += " " + " ".join(f"{key}={value!r}" for key, value in fields.items())
+        return message
+
+
+class _Snapshot(str):
+    """repr() of a value captured at log time; formats as that text"""
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+# Builtin containers a caller may mutate after logging (shared state values)
+_MUTABLE = (dict, list, set, bytearray)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+    The stock handler formats in the caller's thread; here message and field
+    formatting happens on the listener thread, off the event loop. Mutable
+    container arguments are captured when the record is enqueued, so the
+    writer never sees a later change to them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # A lone dict argument is stored as record.args itself
+        args = record.args
+        if args and (isinstance(args, dict) or any(isinstance(value, _MUTABLE) for value in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        fields = getattr(record, "fields", None)
+        if fields and any(isinstance(value, _MUTABLE) for value in fields.values()):
+            record.fields = {key: _Snapshot(repr(value)) if isinstance(value, _MUTABLE) else value
+                             for key, value in fields.items()}
+        return record
+
+
+def configure_logging(level: Any = "INFO", fmt: str = DEFAULT_FORMAT) -> None:
+    """
+    Route root logging through a queue drained by a background writer thread.
+    Like logging.basicConfig, this leaves an application's own handler setup
+    alone; calling it again only adjusts the level.
+    """
+    global _listener, _queue_handler
+
+    root = logging.getLogger()
+    if isinstance(level, str):
+        level = getattr(logging, level.upper(), logging.INFO)
+
+    if _queue_handler is None and root.handlers:
+        return
+    root.setLevel(level)
+    if _queue_handler is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(StructuredFormatter(fmt))
+
+    log_queue = queue.SimpleQueue()
+    _queue_handler = DeferredQueueHandler(log_queue)
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    root.addHandler(_queue_handler)
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread"""
+    global _listener, _queue_handler
+
+    if _listener is not None:
+        _listener.stop()
+        logging.getLogger().removeHandler(_queue_handler)
+    _listener = None
+    _queue_handler = None
+
+
+def log_kv(logger: logging.Logger, level: int, event: str, **fields: Any) -> None:
+    """Log a structured event; a no-op (no formatting) when the level is disabled"""
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"fields": fields})
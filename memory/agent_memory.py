@@ -8,19 +8,26 @@ import asyncio
 import json
 import os
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
+from fusion_core.memory.near_duplicates import MinHasher
+from fusion_core.memory.state_snapshot import load_json
+from fusion_core.memory.jsonl_stream import write_jsonl, read_jsonl_chunks, ProgressCallback
+
 class AgentMemory:
     """
     Agent Memory System - Fusion v14
     Async read/write functions to store each agent's last 3 runs
     """
     
-    def __init__(self, memory_file: str = "memory/agent_memory.json"):
+    def __init__(self, memory_file: str = "memory/agent_memory.json",
+                 duplicate_threshold: float = 0.9):
         self.logger = logging.getLogger("AgentMemory")
         self.memory_file = memory_file
         self.max_entries_per_agent = 3
+        self.duplicate_threshold = duplicate_threshold
+        self._hasher = MinHasher()
         
         # Ensure memory directory exists
         os.makedirs(os.path.dirname(memory_file), exist_ok=True)
@@ -46,8 +53,7 @@ class AgentMemory:
     async def read_memory(self) -> Dict[str, Any]:
         """Read agent memory from JSON file"""
         try:
-            with open(self.memory_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.memory_file)
         except Exception as e:
             self.logger.error(f"Error reading memory: {e}")
             return {"agents": {}, "metadata": {}}
@@ -60,7 +66,7 @@ class AgentMemory:
         except Exception as e:
             self.logger.error(f"Error writing memory: {e}")
     
-    async def store_agent_run(self, agent_name: str, prompt: str, response: str, 
+    async def store_agent_run(self, agent_name: str, prompt: str, response: Union[str, Dict[str, Any]], 
                              confidence: float, fallback_flag: bool = False, 
                              additional_data: Dict[str, Any] = None) -> bool:
         """
@@ -69,7 +75,7 @@ class AgentMemory:
         Args:
             agent_name: Name of the agent
             prompt: Input prompt
-            response: Agent response
+            response: Agent response, as text or an AgentResult.to_record() dict
             confidence: Confidence score
             fallback_flag: Whether fallback was triggered
             additional_data: Any additional data to store
@@ -95,8 +101,14 @@ class AgentMemory:
             if agent_name not in memory_data.get("agents", {}):
                 memory_data["agents"][agent_name] = []
             
+            # Fold a near-duplicate prompt into one entry instead of storing it again
+            entries = memory_data["agents"][agent_name]
+            duplicate = self._find_near_duplicate(entries, prompt)
+            if duplicate is not None:
+                memory_entry["occurrences"] = entries.pop(duplicate).get("occurrences", 1) + 1
+            
             # Add new entry
-            memory_data["agents"][agent_name].append(memory_entry)
+            entries.append(memory_entry)
             
             # Keep only last N entries per agent
             memory_data["agents"][agent_name] = memory_data["agents"][agent_name][-self.max_entries_per_agent:]
@@ -112,6 +124,16 @@ class AgentMemory:
             self.logger.error(f"Error storing agent run: {e}")
             return False
     
+    def _find_near_duplicate(self, entries: List[Dict[str, Any]], prompt: str) -> Optional[int]:
+        """Index of the stored entry whose prompt near-duplicates this one, if any"""
+        signature = self._hasher.signature(prompt)
+        best, best_similarity = None, self.duplicate_threshold
+        for index, entry in enumerate(entries):
+            similarity = MinHasher.similarity(signature, self._hasher.signature(entry.get("prompt", "")))
+            if similarity >= best_similarity:
+                best, best_similarity = index, similarity
+        return best
+    
     async def get_agent_memory(self, agent_name: str) -> List[Dict[str, Any]]:
         """Get memory entries for a specific agent"""
         try:
@@ -234,22 +256,54 @@ class AgentMemory:
             self.logger.error(f"Error clearing all memory: {e}")
             return False
     
-    async def export_memory(self, filename: str = None) -> str:
-        """Export memory to file"""
+    async def export_memory(self, filename: str = None, compress: Optional[str] = None,
+                            progress: Optional[ProgressCallback] = None) -> str:
+        """Export memory to a JSONL file: a metadata line, then one line per agent entry"""
         try:
             if not filename:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"memory/agent_memory_export_{timestamp}.json"
+                filename = f"memory/agent_memory_export_{timestamp}.jsonl.gz"
             
             memory_data = await self.read_memory()
-            with open(filename, 'w') as f:
-                json.dump(memory_data, f, indent=2)
             
+            def records():
+                yield {"metadata": memory_data.get("metadata", {})}
+                for agent_name, entries in memory_data.get("agents", {}).items():
+                    for entry in entries:
+                        yield {"agent": agent_name, "entry": entry}
+            
+            write_jsonl(filename, records(), compress, progress=progress)
             return filename
         except Exception as e:
             self.logger.error(f"Error exporting memory: {e}")
             return ""
     
+    async def import_memory(self, filename: str, compress: Optional[str] = None,
+                            progress: Optional[ProgressCallback] = None) -> int:
+        """Merge a JSONL export into memory (keeping the last N entries per agent); returns entries read"""
+        try:
+            memory_data = await self.read_memory()
+            agents = memory_data.setdefault("agents", {})
+            imported = 0
+            
+            for chunk in read_jsonl_chunks(filename, compress=compress, progress=progress):
+                for record in chunk:
+                    if "agent" not in record:
+                        continue
+                    entries = agents.setdefault(record["agent"], [])
+                    entries.append(record["entry"])
+                    # Trim as we go so memory stays bounded however large the export
+                    del entries[:-self.max_entries_per_agent]
+                    imported += 1
+            
+            memory_data.setdefault("metadata", {})["last_updated"] = datetime.now().isoformat()
+            memory_data["metadata"]["total_entries"] = sum(len(entries) for entries in agents.values())
+            await self.write_memory(memory_data)
+            return imported
+        except Exception as e:
+            self.logger.error(f"Error importing memory: {e}")
+            return 0
+    
     async def get_memory_stats(self) -> Dict[str, Any]:
         """Get memory statistics"""
         try:
@@ -0,0 +1,51 @@
+import json
+import os
+
+from fusion_core.memory.agent_memory import AgentMemory
+
+
+def test_append_only_writes_one_log_line(tmp_path):
+    memory = AgentMemory("planner", str(tmp_path), compress_outputs=False)
+    for i in range(5):
+        memory.append(f"plan step {i}", f"result {i}", {"success": i != 2})
+
+    log_path = os.path.join(str(tmp_path), "planner.history.jsonl")
+    with open(log_path) as f:
+        assert len(f.readlines()) == 5
+    with open(os.path.join(str(tmp_path), "planner.json")) as f:
+        stored = json.load(f)
+    assert "history" not in stored
+    assert stored["metadata"]["successes"] == 4
+    assert stored["metadata"]["success_rate"] == 0.8
+
+
+def test_occurrences_are_replayed_from_the_log(tmp_path):
+    memory = AgentMemory("planner", str(tmp_path), duplicate_threshold=0.8, compress_outputs=False)
+    memory.append("draft a launch plan for the mobile app", "plan")
+    memory.append("Draft a launch plan for the mobile app!", "plan")
+
+    reopened = AgentMemory("planner", str(tmp_path), compress_outputs=False)
+    assert len(reopened.data["history"]) == 1
+    assert reopened.data["history"][0]["occurrences"] == 2
+    assert reopened.get_metadata()["total_runs"] == 2
+
+
+def test_legacy_memory_file_is_migrated(tmp_path):
+    legacy = {
+        "agent_name": "planner",
+        "created_at": "2026-01-01T00:00:00",
+        "history": [{"timestamp": "2026-01-01T00:00:00", "input": f"q{i}", "output": f"a{i}",
+                     "metadata": {"success": i % 3 != 0}} for i in range(6)],
+        "metadata": {"total_runs": 6, "last_run": "2026-01-01T00:00:00", "success_rate": 4 / 6}
+    }
+    with open(os.path.join(str(tmp_path), "planner.json"), "w") as f:
+        json.dump(legacy, f)
+
+    memory = AgentMemory("planner", str(tmp_path), hot_limit=2, segment_size=2, compress_outputs=False)
+    assert len(memory.data["history"]) == 6
+    assert memory.get_metadata()["successes"] == 4
+
+    memory.append("q6", "a6", {"success": True})
+    reopened = AgentMemory("planner", str(tmp_path), hot_limit=2, segment_size=2, compress_outputs=False)
+    assert [entry["output"] for entry in reopened.data["history"]] == [f"a{i}" for i in range(7)]
+    assert reopened.get_metadata()["success_rate"] == 5 / 7
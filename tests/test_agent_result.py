@@ -0,0 +1,119 @@
+import asyncio
+import copy
+import json
+
+from agents.agent_result import AgentResult
+from agents.evaluator_agent import EvaluatorAgent
+from agents.market_analyst_agent import MarketAnalystAgent
+from core.pipeline_checkpoint import PipelineMemoStore
+from fusion_core.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
+
+
+def test_render_is_lazy_and_cached():
+    calls = []
+
+    def render():
+        calls.append(1)
+        return "# Report"
+
+    result = AgentResult({"confidence": 0.9}, renderer=render)
+
+    assert json.loads(json.dumps(result)) == {"confidence": 0.9}
+    assert "output" in result
+    assert calls == []
+    assert result["output"] == "# Report"
+    assert result.get("enhanced_output") == "# Report"
+    assert calls == [1]
+    assert result.to_dict(render=True) == {"confidence": 0.9, "output": "# Report"}
+
+
+def test_agents_return_structured_results():
+    result = asyncio.run(MarketAnalystAgent().run_async("pricing page", {}))
+
+    assert isinstance(result, AgentResult)
+    assert "output" not in dict(result)
+    assert result["output"].startswith("# Market Analyst Agent Response")
+
+
+def test_evaluator_report_renders_on_demand(monkeypatch):
+    async def store_agent_run(**kwargs):
+        return True
+
+    monkeypatch.setattr("agents.evaluator_agent.agent_memory.store_agent_run", store_agent_run)
+    result = asyncio.run(EvaluatorAgent().run_async("Design a clear onboarding flow", {}))
+
+    assert "overall_score" in result
+    assert "## Overall Score" in result.render()
+
+
+def test_memo_store_keeps_rendered_output(tmp_path):
+    store = PipelineMemoStore(str(tmp_path))
+    store.put("ab" * 32, AgentResult({"confidence": 0.5}, renderer=lambda: "done"))
+
+    assert PipelineMemoStore(str(tmp_path)).get("ab" * 32)["output"] == "done"
+
+
+def test_evaluator_persists_report_unrendered(monkeypatch):
+    stored = {}
+
+    async def store_agent_run(**kwargs):
+        stored.update(kwargs)
+        return True
+
+    monkeypatch.setattr("agents.evaluator_agent.agent_memory.store_agent_run", store_agent_run)
+    agent = EvaluatorAgent()
+    result = asyncio.run(agent.run_async("Design a clear onboarding flow", {}))
+
+    response = json.loads(json.dumps(stored["response"]))
+    assert "output" not in response and result._rendered is None
+    report = AgentResult.render_record(response, agent)
+    assert report == result["output"]
+    assert report.startswith("# Fusion v14 Evaluation Report")
+
+
+def test_memo_store_keeps_report_unrendered(tmp_path):
+    agent = MarketAnalystAgent()
+    result = asyncio.run(agent.run_async("pricing page", {}))
+    store = PipelineMemoStore(str(tmp_path))
+    store.put("cd" * 32, result)
+
+    with open(store._path("cd" * 32)) as f:
+        assert "output" not in json.load(f)
+    restored = PipelineMemoStore(str(tmp_path)).get("cd" * 32, agent=agent)
+    assert isinstance(restored, AgentResult)
+    assert restored["output"] == result.render()
+
+
+class ReportAgent:
+    async def run(self, prompt):
+        return AgentResult({"confidence": 0.8}, renderer=lambda: "# Report\n\nShip the onboarding checklist")
+
+
+class PromptCapturingEvaluator:
+    def __init__(self):
+        self.prompts = []
+
+    async def run(self, prompt):
+        self.prompts.append(prompt)
+        return "score: 0.7"
+
+
+def test_parallel_evaluation_scores_the_rendered_report():
+    evaluator = PromptCapturingEvaluator()
+    orchestrator = MultiAgentOrchestrator({"writer": ReportAgent()}, evaluator_agent=evaluator)
+
+    result = asyncio.run(orchestrator.run_parallel("onboarding plan"))
+
+    assert "Output: # Report" in evaluator.prompts[0]
+    assert "'confidence'" not in evaluator.prompts[0]
+    assert result["top_result"]["evaluation"]["score"] == 0.7
+
+
+def test_deepcopy_shares_the_renderer():
+    agent = MarketAnalystAgent()
+    result = asyncio.run(agent.run_async("pricing page", {}))
+
+    copied = copy.deepcopy(result)
+    assert copied._renderer is result._renderer
+    assert copied["output"] == result["output"]
+    assert copied == result and copied is not result
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from core.fusion_context import FusionContext
+from core.execution_orchestrator_v14 import ExecutionOrchestrator
+from fusion_core.orchestration.circuit_breaker import (
+    CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+)
+from fusion_core.telemetry.agent_telemetry import AgentTelemetryLogger
+
+
+def test_breaker_opens_half_opens_and_recovers():
+    breaker = CircuitBreaker("vp_design", min_calls=4, error_rate_threshold=0.5, reset_timeout=0)
+    for success in (True, False, True, False):
+        breaker.record(success)
+    assert breaker._state == OPEN
+
+    # reset_timeout=0 moves the breaker straight to half-open with one trial call
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+    breaker.record(True)
+    assert breaker.state == CLOSED
+
+
+def test_slow_calls_count_as_failures():
+    breaker = CircuitBreaker("evaluator", min_calls=2, latency_threshold=1.0, reset_timeout=60)
+    breaker.record(True, latency=2.0)
+    breaker.record(True, latency=3.0)
+    assert breaker.state == OPEN
+    assert not breaker.allow_request()
+
+
+class FlakyAgent:
+    def __init__(self):
+        self.calls = 0
+
+    async def run_async(self, prompt, tools):
+        self.calls += 1
+        raise RuntimeError("boom")
+
+
+class SteadyAgent:
+    async def run_async(self, prompt, tools):
+        return {"output": "steady", "confidence": 0.9}
+
+
+def test_open_circuit_routes_to_fallback_agent(tmp_path):
+    config_path = tmp_path / "fallback.json"
+    config_path.write_text('{"default_fallback_agent": "steady", "pattern_routing": {}}')
+    breakers = CircuitBreakerRegistry(str(config_path), min_calls=2, reset_timeout=60)
+    telemetry = AgentTelemetryLogger(log_dir=str(tmp_path / "telemetry"))
+    orchestrator = ExecutionOrchestrator(FusionContext({}), telemetry=telemetry,
+                                         circuit_breakers=breakers)
+    flaky = FlakyAgent()
+    orchestrator.register_agent("flaky", flaky)
+    orchestrator.register_agent("steady", SteadyAgent())
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            asyncio.run(orchestrator.execute_agent("flaky", "hi"))
+
+    result = asyncio.run(orchestrator.execute_agent("flaky", "hi"))
+    assert result["output"] == "steady"
+    assert flaky.calls == 2
+    assert breakers.get_status()["flaky"]["state"] == OPEN
+
+
+def test_open_circuit_without_fallback_raises(tmp_path):
+    breakers = CircuitBreakerRegistry(str(tmp_path / "missing.json"), min_calls=1)
+    orchestrator = ExecutionOrchestrator(FusionContext({}), circuit_breakers=breakers)
+    orchestrator.register_agent("flaky", FlakyAgent())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(orchestrator.execute_agent("flaky", "hi"))
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(orchestrator.execute_agent("flaky", "hi"))
+
+
+def test_fallback_cycle_of_open_circuits_raises(tmp_path):
+    config_path = tmp_path / "fallback.json"
+    config_path.write_text('{"pattern_routing": {"flaky_a": "via_b", "flaky_b": "via_a"}}')
+    breakers = CircuitBreakerRegistry(str(config_path), min_calls=1, reset_timeout=60)
+    orchestrator = ExecutionOrchestrator(FusionContext({}), circuit_breakers=breakers)
+    orchestrator.register_agent("flaky_a", FlakyAgent())
+    orchestrator.register_agent("flaky_b", FlakyAgent())
+    orchestrator.register_pattern("via_a", {"agent": "flaky_a"})
+    orchestrator.register_pattern("via_b", {"agent": "flaky_b"})
+    breakers.record("flaky_a", False)
+    breakers.record("flaky_b", False)
+
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(orchestrator.execute_agent("flaky_a", "hi"))
+
+
+def test_cache_hit_leaves_half_open_trial_call_free():
+    from fusion_core.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
+    from fusion_core.orchestration.result_cache import ResultCache
+
+    class EchoAgent:
+        async def run(self, prompt):
+            return f"echo {prompt}"
+
+    breakers = CircuitBreakerRegistry("missing.json", min_calls=1, reset_timeout=0)
+    cache = ResultCache()
+    orchestrator = MultiAgentOrchestrator({"echo": EchoAgent()}, circuit_breakers=breakers,
+                                          result_cache=cache)
+    orchestrator.run_sync("hello")
+    breakers.record("echo", False)
+    assert breakers.breaker("echo").state == HALF_OPEN
+
+    assert orchestrator.run_sync("hello")["top_result"]["cache"]["match"] == "exact"
+    # The trial call is still available and closes the circuit when it succeeds
+    orchestrator.run_sync("something else entirely")
+    assert breakers.breaker("echo").state == CLOSED
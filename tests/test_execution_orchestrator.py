@@ -0,0 +1,212 @@
+import asyncio
+import time
+
+from core.fusion_context import FusionContext
+from core.execution_orchestrator_v14 import ExecutionOrchestrator
+from core.pipeline_checkpoint import PipelineCheckpointStore, PipelineMemoStore
+
+
+class FixedAgent:
+    def __init__(self, confidence: float, delay: float = 0.05, fail: bool = False):
+        self.confidence = confidence
+        self.delay = delay
+        self.fail = fail
+
+    async def run_async(self, prompt, tools):
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("agent down")
+        return {"output": f"{self.confidence}: {prompt}", "confidence": self.confidence}
+
+
+def make_orchestrator(config=None, **agents):
+    orchestrator = ExecutionOrchestrator(FusionContext(config or {}))
+    for name, agent in agents.items():
+        orchestrator.register_agent(name, agent)
+    return orchestrator
+
+
+def test_speculative_fallback_picks_best_branch_concurrently():
+    orchestrator = make_orchestrator(
+        {"max_speculative_branches": 2},
+        primary=FixedAgent(0.5), helper_a=FixedAgent(0.7), helper_b=FixedAgent(0.9),
+        helper_c=FixedAgent(0.99),
+    )
+    for name in ("a", "b", "c"):
+        orchestrator.register_pattern(name, {"type": "prompt_enhancement", "agent": f"helper_{name}"})
+
+    start = time.time()
+    result = asyncio.run(orchestrator.execute_with_pattern_fallback(
+        "draft", "primary", ["a", "b", "c"], speculative=True))
+    elapsed = time.time() - start
+
+    # Only two speculative branches are allowed, so helper_c never runs
+    assert result["confidence"] == 0.9
+    assert elapsed < 0.12
+
+
+def test_speculative_fallback_survives_primary_failure():
+    orchestrator = make_orchestrator(primary=FixedAgent(0.9, fail=True), helper=FixedAgent(0.6))
+    orchestrator.register_pattern("p", {"agent": "helper"})
+
+    result = asyncio.run(orchestrator.execute_with_pattern_fallback(
+        "draft", "primary", ["p"], speculative=True))
+
+    assert result["confidence"] == 0.6
+
+
+class CountingAgent:
+    def __init__(self, name, fail_times=0):
+        self.name = name
+        self.calls = 0
+        self.fail_times = fail_times
+
+    async def run_async(self, prompt, tools):
+        self.calls += 1
+        if self.calls <= self.fail_times:
+            raise RuntimeError(f"{self.name} failed")
+        return {"output": f"{prompt} -> {self.name}", "confidence": 0.9,
+                "shared_state": {f"{self.name}_done": True}}
+
+
+def test_pipeline_resumes_from_checkpoints(tmp_path):
+    store = PipelineCheckpointStore(str(tmp_path))
+    first, second = CountingAgent("first"), CountingAgent("second", fail_times=1)
+    orchestrator = make_orchestrator(first=first, second=second)
+    orchestrator.checkpoints = store
+
+    failed = asyncio.run(orchestrator.execute_pipeline("idea", ["first", "second"]))
+    assert "error" in failed
+    assert store.list_steps(failed["run_id"]) == ["step_000.json"]
+
+    retried = asyncio.run(orchestrator.execute_pipeline("idea", ["first", "second"]))
+    assert retried["resumed_steps"] == ["first"]
+    assert retried["final_output"] == "idea -> first -> second"
+    assert first.calls == 1 and second.calls == 2
+    assert orchestrator.context.get_shared_state("first_done") is True
+    assert store.list_steps(retried["run_id"]) == []
+
+
+def test_repeated_agent_keeps_its_own_checkpoint(tmp_path):
+    store = PipelineCheckpointStore(str(tmp_path))
+    first, second, last = CountingAgent("first"), CountingAgent("second"), CountingAgent("last", fail_times=1)
+    orchestrator = make_orchestrator(first=first, second=second, last=last)
+    orchestrator.checkpoints = store
+    sequence = ["first", "second", "first", "last"]
+
+    failed = asyncio.run(orchestrator.execute_pipeline("idea", sequence))
+    assert store.list_steps(failed["run_id"]) == ["step_000.json", "step_001.json", "step_002.json"]
+
+    retried = asyncio.run(orchestrator.execute_pipeline("idea", sequence))
+    assert retried["resumed_steps"] == ["first", "second", "first"]
+    assert first.calls == 2 and last.calls == 2
+    assert retried["final_output"] == "idea -> first -> second -> first -> last"
+
+
+class TopicAgent:
+    """Output depends only on whether the input mentions 'wallet'"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def run_async(self, prompt, tools):
+        self.calls += 1
+        topic = "wallet" if "wallet" in prompt else "general"
+        return {"output": f"topic={topic}", "confidence": 0.9}
+
+
+def test_incremental_pipeline_only_reruns_changed_steps(tmp_path):
+    classifier, downstream = TopicAgent(), CountingAgent("downstream")
+    orchestrator = make_orchestrator(classifier=classifier, downstream=downstream)
+    orchestrator.memo = PipelineMemoStore(str(tmp_path))
+
+    asyncio.run(orchestrator.execute_pipeline("design a wallet", ["classifier", "downstream"]))
+    edited = asyncio.run(orchestrator.execute_pipeline("design a bitcoin wallet",
+                                                       ["classifier", "downstream"]))
+
+    assert edited["reused_steps"] == ["downstream"]
+    assert classifier.calls == 2 and downstream.calls == 1
+    assert edited["final_output"] == "topic=wallet -> downstream"
+
+
+def test_digest_handoff_memoizes_on_the_prompt_each_step_sees(tmp_path):
+    classifier, downstream = TopicAgent(), CountingAgent("downstream")
+    orchestrator = make_orchestrator({"pipeline_handoff": "digest"},
+                                     classifier=classifier, downstream=downstream)
+    orchestrator.memo = PipelineMemoStore(str(tmp_path))
+    sequence = ["classifier", "downstream"]
+
+    asyncio.run(orchestrator.execute_pipeline("design a wallet", sequence))
+    rerun = asyncio.run(orchestrator.execute_pipeline("design a wallet", sequence))
+    assert rerun["reused_steps"] == ["classifier", "downstream"]
+
+    # Every digest step input starts with the prompt, so an edit reruns them all
+    edited = asyncio.run(orchestrator.execute_pipeline("design a bitcoin wallet", sequence))
+    assert edited["reused_steps"] == []
+    assert classifier.calls == 2 and downstream.calls == 2
+    assert edited["final_output"].startswith("design a bitcoin wallet")
+    assert edited["final_output"] != rerun["final_output"]
+
+
+class ScorecardAgent:
+    """Output depends on a state file it declares"""
+
+    def __init__(self, path):
+        self.state_files = (path,)
+        self.calls = 0
+
+    async def run_async(self, prompt, tools):
+        self.calls += 1
+        with open(self.state_files[0]) as f:
+            return {"output": f"{prompt} via {f.read()}", "confidence": 0.9}
+
+
+def test_memoized_steps_rerun_when_declared_state_changes(tmp_path):
+    scorecard = tmp_path / "scorecard.json"
+    scorecard.write_text('{"best": "vp_design"}')
+    router = ScorecardAgent(str(scorecard))
+    orchestrator = make_orchestrator(router=router)
+    orchestrator.memo = PipelineMemoStore(str(tmp_path / "memo"))
+
+    asyncio.run(orchestrator.execute_pipeline("route this", ["router"]))
+    reused = asyncio.run(orchestrator.execute_pipeline("route this", ["router"]))
+    scorecard.write_text('{"best": "strategy_pilot"}')
+    rerun = asyncio.run(orchestrator.execute_pipeline("route this", ["router"]))
+
+    assert reused["reused_steps"] == ["router"] and rerun["reused_steps"] == []
+    assert router.calls == 2
+    assert "strategy_pilot" in rerun["final_output"]
+
+
+def test_memo_store_hands_out_copies(tmp_path):
+    store = PipelineMemoStore(str(tmp_path))
+    store.put("ef" * 32, {"output": "done", "shared_state": {"tags": ["a"]}})
+
+    store.get("ef" * 32)["shared_state"]["tags"].append("b")
+    assert store.get("ef" * 32)["shared_state"]["tags"] == ["a"]
+    assert PipelineMemoStore(str(tmp_path)).get("ef" * 32)["shared_state"]["tags"] == ["a"]
+
+
+class RecordingAgent:
+    def __init__(self):
+        self.inputs = []
+
+    async def run_async(self, prompt, tools):
+        self.inputs.append(prompt)
+        body = "\n".join(f"- finding {i} " + "x" * 80 for i in range(20))
+        return {"output": f"# Report\n\n## Original Request\n{prompt}\n\n## Findings\n{body}",
+                "confidence": 0.9}
+
+
+def test_digest_handoff_bounds_step_input():
+    agents = {f"agent_{i}": RecordingAgent() for i in range(12)}
+    orchestrator = make_orchestrator({"handoff_budget": {"max_digest_chars": 800}}, **agents)
+
+    result = asyncio.run(orchestrator.execute_pipeline("design a wallet", list(agents),
+                                                       handoff="digest"))
+
+    inputs = [agent.inputs[0] for agent in agents.values()]
+    assert all(text.startswith("design a wallet") for text in inputs)
+    assert max(len(text) for text in inputs) < 1000
+    assert "earlier results omitted" in inputs[-1]
+    assert result["final_output"].startswith("# Report")
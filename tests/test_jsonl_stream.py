@@ -0,0 +1,78 @@
+import asyncio
+import gzip
+import json
+
+from core.fusion_context import FusionContext
+from fusion_core.memory.jsonl_stream import iter_jsonl, read_jsonl_chunks, write_jsonl
+from fusion_core.telemetry.agent_telemetry import AgentTelemetryLogger
+from memory.agent_memory import AgentMemory as RunMemory
+
+
+def test_write_and_read_in_chunks_with_progress(tmp_path):
+    path = str(tmp_path / "records.jsonl.gz")
+    written = []
+    count = write_jsonl(path, ({"i": i} for i in range(25)), chunk_size=10, progress=written.append)
+
+    assert count == 25
+    assert written == [10, 20, 25]
+    with gzip.open(path, "rt") as f:
+        assert len(f.readlines()) == 25
+
+    read = []
+    chunks = list(read_jsonl_chunks(path, chunk_size=10, progress=read.append))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert read == [10, 20, 25]
+
+
+def test_fusion_context_round_trip(tmp_path):
+    source = FusionContext({})
+    for i in range(3):
+        asyncio.run(source.store_interaction(f"agent_{i}", f"prompt {i}", {"output": i}))
+    source.pattern_memory["tone"] = "formal"
+    source.set_shared_state("brief", {"goal": "launch"})
+
+    path = str(tmp_path / "context.jsonl.gz")
+    assert source.export_memory(path) == 1 + 3 + 1 + 1
+
+    target = FusionContext({})
+    target.import_memory(path, chunk_size=2)
+    assert list(target.memory) == list(source.memory)
+    assert target.pattern_memory == {"tone": "formal"}
+    assert target.shared_state["brief"] == {"goal": "launch"}
+
+
+def test_fusion_context_imports_legacy_json(tmp_path):
+    path = tmp_path / "legacy.json"
+    path.write_text(json.dumps({
+        "session_id": "old",
+        "memory": [{"timestamp": "t", "agent_name": "a", "input_prompt": "p", "output": {},
+                    "confidence": 0.5, "tools_used": [], "execution_time": 0.0}],
+        "pattern_memory": {"k": 1},
+        "shared_state": {"s": 2}
+    }, indent=2))
+
+    context = FusionContext({})
+    context.import_memory(str(path))
+    assert len(context.memory) == 1
+    assert context.shared_state["s"] == 2
+
+
+def test_run_memory_export_import(tmp_path):
+    source = RunMemory(str(tmp_path / "source.json"))
+    asyncio.run(source.store_agent_run("vp_design", "design a dashboard", "done", 0.9))
+    export_path = asyncio.run(source.export_memory(str(tmp_path / "export.jsonl.gz")))
+
+    target = RunMemory(str(tmp_path / "target.json"))
+    assert asyncio.run(target.import_memory(export_path)) == 1
+    assert asyncio.run(target.get_agent_memory("vp_design"))[0]["response"] == "done"
+
+
+def test_telemetry_saves_compressed_sessions(tmp_path):
+    telemetry = AgentTelemetryLogger(session_id="s1", log_dir=str(tmp_path), compress="gzip")
+    telemetry.log_event(agent="vp_design", input_text="in", output_text="out")
+    header = telemetry.save()
+
+    assert telemetry.path.endswith(".jsonl.gz")
+    assert next(iter_jsonl(telemetry.path))["session_id"] == header["session_id"] == "s1"
+    reader = AgentTelemetryLogger(session_id="s2", log_dir=str(tmp_path))
+    assert [event["agent"] for event in reader.load_history()] == ["vp_design"]
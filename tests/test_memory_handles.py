@@ -0,0 +1,49 @@
+from fusion_core.memory.agent_memory import AgentMemory
+from fusion_core.memory.handle_cache import MemoryHandleCache
+
+
+def fill(memory, count):
+    for i in range(count):
+        memory.append(f"prompt number {i} on subject {i * 37}", f"output {i}")
+
+
+def test_pages_walk_back_across_cold_segments(tmp_path):
+    memory = AgentMemory("browser", str(tmp_path), hot_limit=3, segment_size=3, compress_outputs=False)
+    fill(memory, 11)
+    assert memory.data["history"].cold_count > 0
+
+    outputs, cursor = [], None
+    while True:
+        page, cursor = memory.get_page(cursor, limit=4)
+        outputs = [entry["output"] for entry in page] + outputs
+        if cursor is None:
+            break
+    assert outputs == [f"output {i}" for i in range(11)]
+
+
+def test_page_slice_only_loads_overlapping_segments(tmp_path):
+    memory = AgentMemory("browser", str(tmp_path), hot_limit=2, segment_size=2, compress_outputs=False)
+    fill(memory, 10)
+    store = memory.data["history"].store
+    store._cache.clear()
+
+    page, cursor = memory.get_page(3, limit=2)
+    assert [entry["output"] for entry in page] == ["output 1", "output 2"]
+    assert cursor == 1
+    assert set(store._cache) == {store.segments[0]["name"], store.segments[1]["name"]}
+
+
+def test_handle_cache_reuses_and_reloads_after_external_writes(tmp_path):
+    handles = MemoryHandleCache(str(tmp_path), compress_outputs=False)
+    memory = handles.get("browser")
+    memory.append("first prompt", "first output")
+    assert handles.get("browser") is memory
+
+    other = AgentMemory("browser", str(tmp_path), compress_outputs=False)
+    other.append("a different second prompt", "second output")
+
+    reloaded = handles.get("browser")
+    assert reloaded is not memory
+    assert len(reloaded.data["history"]) == 2
+    assert handles.get_status()["hits"] == 1
+    assert handles.get_status()["reloads"] == 1
@@ -0,0 +1,99 @@
+import asyncio
+import os
+import time
+from functools import partial
+
+from agents.agent_result import AgentResult
+from fusion_core.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
+
+
+class SleepyAgent:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def run(self, input_text: str) -> str:
+        await asyncio.sleep(self.delay)
+        return f"handled: {input_text}"
+
+
+class SleepyEvaluator:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def run(self, prompt: str) -> str:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return "score: 0.9 looks good"
+
+
+def test_evaluations_run_concurrently_and_bounded():
+    agents = {f"agent_{i}": SleepyAgent(0.05) for i in range(6)}
+    evaluator = SleepyEvaluator(0.1)
+    orchestrator = MultiAgentOrchestrator(agents, evaluator_agent=evaluator,
+                                          max_concurrent_evaluations=3)
+
+    start = time.time()
+    result = orchestrator.run_sync("design a tile")
+    elapsed = time.time() - start
+
+    assert len(result["evaluations"]) == 6
+    assert all(r["evaluation"]["score"] == 0.9 for r in result["all_results"])
+    assert evaluator.peak_in_flight == 3
+    # Serial evaluation would take 6 * 0.1s on top of the agent runs
+    assert elapsed < 0.5
+
+
+class PidAgent:
+    async def run(self, input_text: str) -> dict:
+        return {"pid": os.getpid(), "echo": input_text}
+
+
+def test_process_backend_runs_agents_in_workers():
+    orchestrator = MultiAgentOrchestrator({"pid_a": PidAgent(), "pid_b": PidAgent()},
+                                          execution_backend="process", max_workers=2)
+    try:
+        orchestrator.process_backend.warm_up()
+        result = orchestrator.run_sync("hello")
+    finally:
+        orchestrator.shutdown()
+
+    outputs = [r["output"] for r in result["all_results"]]
+    assert all(r["success"] for r in result["all_results"])
+    assert all(output["echo"] == "hello" for output in outputs)
+    assert all(output["pid"] != os.getpid() for output in outputs)
+
+
+class ReportAgent:
+    async def run(self, input_text: str) -> AgentResult:
+        return AgentResult({"topic": input_text}, renderer=partial(self._render, input_text))
+
+    def _render(self, topic: str) -> str:
+        return f"# Report on {topic}"
+
+
+class ConfiguredAgent:
+    def __init__(self, greeting: str):
+        self.greeting = greeting
+
+    async def run(self, input_text: str) -> str:
+        return f"{self.greeting}, {input_text}"
+
+
+def test_process_backend_keeps_structured_results_and_skips_unbuildable_agents():
+    agents = {"report": ReportAgent(), "configured": ConfiguredAgent("hi")}
+    orchestrator = MultiAgentOrchestrator(agents, execution_backend="process", max_workers=1)
+    try:
+        assert not orchestrator.process_backend.supports("configured")
+        result = orchestrator.run_sync("pricing")
+    finally:
+        orchestrator.shutdown()
+
+    outputs = {r["agent"]: r["output"] for r in result["all_results"]}
+    assert isinstance(outputs["report"], AgentResult)
+    assert outputs["report"]["topic"] == "pricing"
+    assert outputs["report"]["output"] == "# Report on pricing"
+    assert outputs["configured"] == "hi, pricing"
@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+from fusion_core.memory.agent_memory import AgentMemory
+from fusion_core.memory.near_duplicates import MinHashLSH, normalize_prompt
+from fusion_core.orchestration.multi_agent_orchestrator import MultiAgentOrchestrator
+from fusion_core.orchestration.result_cache import ResultCache
+from memory.agent_memory import AgentMemory as RunMemory
+
+PROMPT = "Design a pricing page for our analytics product with three tiers"
+VARIANT = "design a  pricing page for our analytics product, with three tiers please!"
+
+
+def test_lsh_finds_near_duplicates_only():
+    lsh = MinHashLSH(threshold=0.8)
+    lsh.add("pricing", PROMPT)
+    lsh.add("onboarding", "Write onboarding emails for new workspace admins")
+
+    assert normalize_prompt("  Hello,   WORLD! ") == "hello world"
+    assert [key for key, _ in lsh.query(VARIANT)] == ["pricing"]
+    assert lsh.query("Summarize last quarter's support tickets") == []
+
+
+class CountingAgent:
+    def __init__(self):
+        self.calls = 0
+
+    async def run(self, prompt):
+        self.calls += 1
+        return f"answer {self.calls}"
+
+
+def test_result_cache_serves_near_duplicate_prompts():
+    agent = CountingAgent()
+    cache = ResultCache(similarity_threshold=0.8)
+    orchestrator = MultiAgentOrchestrator({"pricing": agent}, result_cache=cache)
+
+    first = asyncio.run(orchestrator.run_parallel(PROMPT))["top_result"]
+    second = asyncio.run(orchestrator.run_parallel(VARIANT))["top_result"]
+
+    assert agent.calls == 1
+    assert second["output"] == first["output"]
+    assert second["cache"]["match"] == "near_duplicate"
+    assert cache.get_status()["near_duplicate_hits"] == 1
+
+
+class StubMemory:
+    def __init__(self):
+        self.context = ""
+
+    def get_context(self, agent_name):
+        return self.context
+
+    def append(self, agent_name, input_text, output, metadata=None):
+        pass
+
+
+class RecordingTelemetry:
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, **event):
+        self.events.append(event)
+
+    def log_parallel_execution(self, *args, **kwargs):
+        pass
+
+
+def test_result_cache_keys_on_memory_context_and_logs_hits():
+    agent = CountingAgent()
+    memory = StubMemory()
+    telemetry = RecordingTelemetry()
+    orchestrator = MultiAgentOrchestrator({"pricing": agent}, memory_manager=memory,
+                                          telemetry_logger=telemetry,
+                                          result_cache=ResultCache())
+
+    asyncio.run(orchestrator.run_parallel(PROMPT))
+    hit = asyncio.run(orchestrator.run_parallel(PROMPT))["top_result"]
+    memory.context = "Previous answer: answer 1"
+    miss = asyncio.run(orchestrator.run_parallel(PROMPT))["top_result"]
+
+    assert agent.calls == 2
+    assert hit["cache"]["match"] == "exact" and "cache" not in miss
+    assert [event.get("fallback") for event in telemetry.events] == [None, "cache_hit", None]
+
+
+def test_result_cache_defaults_to_exact_matches_with_expiry_and_copies(monkeypatch):
+    cache = ResultCache()
+    cache.put("pricing", PROMPT, {"tiers": ["free", "pro"]})
+
+    assert cache.get("pricing", VARIANT) is None
+    hit = cache.get("pricing", "  design a pricing page for our analytics product with three tiers")
+    hit["output"]["tiers"].append("enterprise")
+    assert cache.get("pricing", PROMPT)["output"] == {"tiers": ["free", "pro"]}
+
+    stored_at = time.time()
+    monkeypatch.setattr(time, "time", lambda: stored_at + cache.ttl + 1)
+    assert cache.get("pricing", PROMPT) is None
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(max_entries=1)
+    cache.put("a", "first prompt", 1)
+    cache.put("a", "second prompt about something else", 2)
+
+    assert cache.get("a", "first prompt") is None
+    assert cache.get("a", "second prompt about something else")["output"] == 2
+
+
+def test_agent_memory_counts_and_links_near_duplicates(tmp_path):
+    memory = AgentMemory("pricing", memory_dir=str(tmp_path), duplicate_threshold=0.8)
+    memory.append(PROMPT, "three tiers")
+    memory.append(VARIANT, "three tiers")
+    memory.append(VARIANT, "four tiers")
+
+    history = memory.data["history"]
+    assert len(history) == 2
+    assert history[0]["occurrences"] == 2
+    assert history[1]["duplicate_of"] == 0
+    assert memory.get_metadata()["total_runs"] == 3
+
+
+def test_run_memory_folds_near_duplicate_prompts(tmp_path):
+    memory = RunMemory(str(tmp_path / "agent_memory.json"), duplicate_threshold=0.8)
+    asyncio.run(memory.store_agent_run("vp_design", PROMPT, "a", 0.9))
+    asyncio.run(memory.store_agent_run("vp_design", VARIANT, "b", 0.8))
+
+    entries = asyncio.run(memory.get_agent_memory("vp_design"))
+    assert len(entries) == 1
+    assert entries[0]["occurrences"] == 2
+    assert entries[0]["response"] == "b"
@@ -0,0 +1,73 @@
+import json
+import os
+
+from fusion_core.memory.agent_memory import AgentMemory
+from fusion_core.memory.output_codec import OutputCodec
+from fusion_core.memory.thread_memory import ThreadMemory
+
+TEMPLATE = """# Research Summarizer Agent Response
+
+## Original Request
+{prompt}
+
+### Summary Recommendations
+- **Key Findings:** Extract and highlight most important insights
+- **Data Synthesis:** Combine multiple sources into coherent narrative
+- **Actionable Insights:** Translate research into practical recommendations
+- **Visual Communication:** Present findings in clear, digestible format
+
+*Generated by Fusion v14 Research Summarizer Agent*"""
+
+
+def render(i):
+    return TEMPLATE.format(prompt=f"summarize interview batch {i}")
+
+
+def test_codec_round_trip_and_passthrough(tmp_path):
+    codec = OutputCodec(str(tmp_path))
+    assert codec.encode(render(0)) == render(0)  # no dictionary yet
+
+    codec.train(render(i) for i in range(8))
+    encoded = codec.encode(render(42))
+    assert isinstance(encoded, dict)
+    assert len(encoded["z"]) * 4 < len(render(42))
+    assert codec.decode(encoded) == render(42)
+    assert codec.encode("short") == "short"
+    assert codec.decode("short") == "short"
+
+
+def test_retrained_codec_still_decodes_older_entries(tmp_path):
+    codec = OutputCodec(str(tmp_path))
+    codec.train(render(i) for i in range(8))
+    old = codec.encode(render(1))
+
+    codec.train([TEMPLATE.replace("Research", "Market").format(prompt=str(i)) for i in range(8)])
+    reopened = OutputCodec(str(tmp_path))
+    assert reopened.dictionary_id == codec.dictionary_id != old["zdict"]
+    assert reopened.decode(old) == render(1)
+
+
+def test_agent_memory_compresses_outputs_on_disk(tmp_path):
+    memory = AgentMemory("summarizer", str(tmp_path))
+    memory.codec.train_after = 4
+    for i in range(10):
+        memory.append(f"request {i}", render(i))
+
+    with open(os.path.join(str(tmp_path), "summarizer.history.jsonl")) as f:
+        stored = [json.loads(line) for line in f]
+    # Outputs logged after the dictionary was trained are compressed
+    assert all(isinstance(entry["output"], dict) for entry in stored[4:])
+
+    reopened = AgentMemory("summarizer", str(tmp_path))
+    assert reopened.get_last(1)[0]["output"] == render(9)
+    assert len(reopened.search("batch 3")) == 1
+
+
+def test_thread_memory_shares_dictionary_across_threads(tmp_path):
+    first = ThreadMemory("alice", "t1", str(tmp_path), semantic_recall=False)
+    first.codec.train(render(i) for i in range(8))
+    first.append("hello", render(1))
+
+    second = ThreadMemory("alice", "t2", str(tmp_path), semantic_recall=False)
+    assert second.codec.dictionary_id == first.codec.dictionary_id
+    assert ThreadMemory("alice", "t1", str(tmp_path), semantic_recall=False).history[0]["output"] == render(1)
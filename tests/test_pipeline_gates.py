@@ -0,0 +1,81 @@
+import asyncio
+
+from core.fusion_context import FusionContext
+from core.execution_orchestrator_v14 import ExecutionOrchestrator
+from core.pipeline_gates import QualityGates
+
+PHASES = {
+    "Content": ["writer"],
+    "Evaluation": ["reviewer", "evaluator"],
+    "Orchestration": ["dispatcher"],
+}
+
+
+class ScoredAgent:
+    def __init__(self, score, shared_state=None):
+        self.score = score
+        self.shared_state = shared_state or {}
+        self.calls = 0
+
+    async def run_async(self, prompt, tools):
+        self.calls += 1
+        return {"output": prompt, "confidence": self.score, "overall_score": self.score,
+                "shared_state": self.shared_state}
+
+
+def run_pipeline(agents, gates):
+    orchestrator = ExecutionOrchestrator(FusionContext({}))
+    for name, agent in agents.items():
+        orchestrator.register_agent(name, agent)
+    sequence = [name for names in PHASES.values() for name in names if name in agents]
+    return asyncio.run(orchestrator.execute_pipeline("idea", sequence,
+                                                     gates=QualityGates(gates, PHASES)))
+
+
+def test_stop_gate_fires_after_phase_completes():
+    agents = {"reviewer": ScoredAgent(0.95), "evaluator": ScoredAgent(0.92),
+              "dispatcher": ScoredAgent(0.8)}
+    gates = [{"name": "done", "after_phase": "Evaluation", "metric": "evaluator.overall_score",
+              "op": ">=", "value": 0.9}]
+
+    result = run_pipeline(agents, gates)
+
+    assert result["stopped_early"] is True
+    assert agents["evaluator"].calls == 1
+    assert agents["dispatcher"].calls == 0
+    assert result["triggered_gates"] == [{"gate": "done", "action": "stop", "agent": "evaluator"}]
+
+
+def test_stop_gate_does_not_fire_below_threshold():
+    agents = {"evaluator": ScoredAgent(0.7), "dispatcher": ScoredAgent(0.8)}
+    gates = [{"after_phase": "Evaluation", "metric": "evaluator.overall_score", "value": 0.9}]
+
+    result = run_pipeline(agents, gates)
+
+    assert "stopped_early" not in result
+    assert agents["dispatcher"].calls == 1
+
+
+def test_skip_gate_uses_shared_state_flag():
+    agents = {"writer": ScoredAgent(0.8), "reviewer": ScoredAgent(0.8, {"reviewed": True}),
+              "dispatcher": ScoredAgent(0.8)}
+    gates = [{"name": "already_reviewed", "skip_phase": "Orchestration",
+              "when_shared_state": "reviewed"}]
+
+    result = run_pipeline(agents, gates)
+
+    assert agents["dispatcher"].calls == 0
+    assert list(result["results"]) == ["writer", "reviewer"]
+
+
+def test_stop_gates_read_the_stage_snapshot_like_skip_gates():
+    agents = {"writer": ScoredAgent(0.8, {"approved": True}), "reviewer": ScoredAgent(0.8),
+              "evaluator": ScoredAgent(0.8), "dispatcher": ScoredAgent(0.8)}
+    gates = [{"name": "approved_early", "after": "writer", "when_shared_state": "approved"},
+             {"name": "approved", "after": "reviewer", "when_shared_state": "approved"}]
+
+    result = run_pipeline(agents, gates)
+
+    # The writer's stage read a snapshot without its own write; the next stage sees it
+    assert result["triggered_gates"] == [{"gate": "approved", "action": "stop", "agent": "reviewer"}]
+    assert agents["evaluator"].calls == 0
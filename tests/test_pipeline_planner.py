@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from core.fusion_context import FusionContext
+from core.execution_orchestrator_v14 import ExecutionOrchestrator
+from core.pipeline_planner import PipelinePlanner, parse_deadline
+
+
+STATS = {
+    "strategy_pilot": {"avg_latency": 1.0, "avg_confidence": 0.9},
+    "market_analyst": {"avg_latency": 0.2, "avg_confidence": 0.8},
+    "deck_narrator": {"avg_latency": 1.5, "avg_confidence": 0.3},
+    "evaluator": {"avg_latency": 0.5, "avg_confidence": 0.9},
+}
+SEQUENCE = ["strategy_pilot", "market_analyst", "deck_narrator", "evaluator"]
+
+
+def test_parse_deadline():
+    assert parse_deadline("2s") == 2.0
+    assert parse_deadline("1500ms") == 1.5
+    assert parse_deadline("3") == 3.0
+    with pytest.raises(ValueError):
+        parse_deadline("soon")
+
+
+def test_plan_keeps_order_and_required_agents_within_budget():
+    plan = PipelinePlanner(STATS).plan(SEQUENCE, deadline=1.8, required=["evaluator"])
+
+    assert plan["selected"] == ["strategy_pilot", "market_analyst", "evaluator"]
+    assert plan["skipped"] == ["deck_narrator"]
+    assert plan["estimated_time"] == pytest.approx(1.7)
+
+
+def test_parallel_stages_fit_more_agents():
+    plan = PipelinePlanner(STATS, max_parallelism=2).plan(SEQUENCE, deadline=2.5)
+
+    assert plan["stages"] == [["strategy_pilot", "market_analyst"], ["deck_narrator", "evaluator"]]
+    assert plan["skipped"] == []
+
+
+def test_stats_from_events_ignores_failures():
+    events = [
+        {"agent": "evaluator", "execution_time": 0.4, "confidence": 0.8},
+        {"agent": "evaluator", "execution_time": 0.6, "confidence": 1.0},
+        {"agent": "evaluator", "execution_time": 9.0, "fallback": "error_handling"},
+        {"type": "evaluation", "agent": "evaluator", "score": 0.1},
+    ]
+    stats = PipelinePlanner.stats_from_events(events)
+    assert stats["evaluator"]["runs"] == 2
+    assert stats["evaluator"]["avg_latency"] == pytest.approx(0.5)
+
+
+class EchoAgent:
+    def __init__(self, name):
+        self.name = name
+
+    async def run_async(self, prompt, tools):
+        return {"output": self.name, "confidence": 0.9}
+
+
+def test_pipeline_runs_only_planned_agents():
+    orchestrator = ExecutionOrchestrator(FusionContext({}))
+    for name in SEQUENCE:
+        orchestrator.register_agent(name, EchoAgent(name))
+
+    result = asyncio.run(orchestrator.execute_pipeline(
+        "idea", SEQUENCE, deadline=1.8, required_agents=["evaluator"],
+        planner=PipelinePlanner(STATS)))
+
+    assert list(result["results"]) == ["strategy_pilot", "market_analyst", "evaluator"]
+    assert result["final_output"] == "evaluator"
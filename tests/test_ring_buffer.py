@@ -0,0 +1,87 @@
+import asyncio
+import json
+import os
+from functools import partial
+
+from agents.agent_result import AgentResult
+from core.fusion_context import FusionContext, MemoryEntry
+from fusion_core.memory.ring_buffer import RingBuffer
+from fusion_core.telemetry.agent_telemetry import AgentTelemetryLogger
+
+
+def test_ring_buffer_evicts_oldest_and_spills():
+    spilled = []
+    buffer = RingBuffer(3, spill=spilled.append)
+    buffer.extend(range(5))
+
+    assert list(buffer) == [2, 3, 4]
+    assert spilled == [0, 1]
+    assert buffer.spilled == 2
+    assert buffer.recent(2) == [3, 4]
+    assert buffer[-2:] == [3, 4]
+    assert buffer[0] == 2
+
+
+def test_fusion_context_memory_is_bounded(tmp_path):
+    spill_path = tmp_path / "spill.jsonl"
+    context = FusionContext({"memory_retention": 2, "memory_spill_path": str(spill_path)})
+    for i in range(3):
+        asyncio.run(context.store_interaction(f"agent_{i}", "prompt", {"output": i}))
+
+    assert [entry.agent_name for entry in context.memory] == ["agent_1", "agent_2"]
+    assert not hasattr(context.memory[0], "__dict__")
+    spilled = [json.loads(line) for line in spill_path.read_text().splitlines()]
+    assert spilled[0]["agent_name"] == "agent_0"
+    assert MemoryEntry(**spilled[0]).output == {"output": 0}
+
+
+def test_telemetry_spills_and_reloads_history(tmp_path):
+    log_dir = str(tmp_path)
+    telemetry = AgentTelemetryLogger(session_id="s1", log_dir=log_dir, max_events=2)
+    for i in range(3):
+        telemetry.log_event(agent=f"agent_{i}", input_text="in", output_text="out")
+    saved = telemetry.save()
+
+    assert saved["total_events"] == 3
+    assert saved["saved_events"] == 2
+
+    reader = AgentTelemetryLogger(session_id="s2", log_dir=log_dir)
+    assert sorted(event["agent"] for event in reader.load_history()) == ["agent_0", "agent_1", "agent_2"]
+
+
+def test_fusion_context_spills_by_default_and_exports_everything(tmp_path):
+    context = FusionContext({"memory_retention": 2, "memory_spill_dir": str(tmp_path / "spill")})
+    for i in range(3):
+        asyncio.run(context.store_interaction(f"agent_{i}", "prompt", {"output": i}))
+
+    assert context.memory_spill_path.startswith(str(tmp_path / "spill"))
+    export_path = str(tmp_path / "export.jsonl")
+    context.export_memory(export_path)
+
+    restored = FusionContext({"memory_spill_path": None})
+    restored.import_memory(export_path)
+    assert [entry.agent_name for entry in restored.memory] == ["agent_0", "agent_1", "agent_2"]
+
+
+class Reporter:
+    def render(self, topic):
+        return f"# Report on {topic}"
+
+
+def test_spill_file_is_only_created_past_retention_and_cleared_with_memory(tmp_path):
+    spill_dir = tmp_path / "spill"
+    context = FusionContext({"memory_retention": 1, "memory_spill_dir": str(spill_dir)})
+    asyncio.run(context.store_interaction("agent_0", "prompt", {"output": 0}))
+    assert not spill_dir.exists()
+
+    report = AgentResult({"confidence": 0.9}, renderer=partial(Reporter().render, "pricing"))
+    asyncio.run(context.store_interaction("agent_1", "prompt", report))
+    asyncio.run(context.store_interaction("agent_2", "prompt", {"output": 2}))
+    with open(context.memory_spill_path) as f:
+        spilled = [json.loads(line) for line in f]
+    assert AgentResult.render_record(spilled[1]["output"], Reporter()) == "# Report on pricing"
+
+    context.clear_memory()
+    assert not os.path.exists(context.memory_spill_path)
+    assert context.get_execution_stats() == {"total_interactions": 0, "avg_confidence": 0.0}
+    assert context.memory.spilled == 0
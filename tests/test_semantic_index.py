@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fusion_core.memory.semantic_index import SemanticIndex
+from fusion_core.memory.thread_memory import ThreadMemory
+
+
+def test_recall_spans_threads(tmp_path):
+    memory_dir = str(tmp_path)
+    onboarding = ThreadMemory("alice", "onboarding", memory_dir)
+    onboarding.append("Design a mobile onboarding flow", "Three welcome screens with progress dots")
+    billing = ThreadMemory("alice", "billing", memory_dir)
+    billing.append("Explain invoice reconciliation", "Match payments to invoices nightly")
+
+    results = billing.recall("onboarding screens for mobile", k=1)
+
+    assert results[0]["thread_id"] == "onboarding"
+    assert results[0]["position"] == 0
+    assert billing.recall("onboarding", exclude_current=True)[0]["thread_id"] == "onboarding"
+
+
+def test_ivf_index_matches_exact_top_hit(tmp_path):
+    index = SemanticIndex(str(tmp_path), train_threshold=64, n_probe=4)
+    topics = ["pricing page", "dark mode toggle", "invoice export", "team permissions"]
+    for i in range(80):
+        index.add(f"thread-{i}", 0, f"{topics[i % 4]} request number {i}")
+    index.wait_for_training()
+
+    assert index._load_centroids() is not None
+    assert index.search("dark mode toggle", k=1)[0]["thread_id"] in {f"thread-{i}" for i in range(1, 80, 4)}
+
+
+def test_backfill_indexes_existing_threads(tmp_path):
+    memory_dir = str(tmp_path)
+    ThreadMemory("bob", "t1", memory_dir, semantic_recall=False).append("brand colors", "use teal")
+
+    assert ThreadMemory.build_semantic_index("bob", memory_dir) == 1
+    assert ThreadMemory("bob", "t2", memory_dir).recall("brand colors")[0]["thread_id"] == "t1"
+
+
+def test_instances_see_each_others_writes_and_retraining(tmp_path):
+    reader = SemanticIndex(str(tmp_path), train_threshold=32, n_probe=2)
+    writer = SemanticIndex(str(tmp_path), train_threshold=32, n_probe=2)
+    topics = ["pricing page", "dark mode toggle", "invoice export", "team permissions"]
+    for i in range(40):
+        writer.add(f"thread-{i}", 0, f"{topics[i % 4]} request number {i}")
+    writer.wait_for_training()
+    assert reader.search("invoice export", k=1)[0]["thread_id"] in {f"thread-{i}" for i in range(2, 40, 4)}
+    stale = reader._load_centroids()
+
+    # The writer outgrows its lists and retrains; the reader picks up the new centroids
+    for i in range(40, 160):
+        writer.add(f"thread-{i}", 0, f"{topics[i % 4]} request number {i}")
+    writer.add("thread-new", 0, "quarterly roadmap review")
+    writer.wait_for_training()
+
+    assert len(reader._load_centroids()) != len(stale)
+    assert reader.search("quarterly roadmap review", k=1)[0]["thread_id"] == "thread-new"
+
+
+def test_concurrent_writers_keep_rows_and_entries_aligned(tmp_path):
+    indexes = [SemanticIndex(str(tmp_path), train_threshold=64) for _ in range(4)]
+
+    def write(worker, index):
+        for i in range(40):
+            text = f"worker {worker} request {i} about topic {i % 7}"
+            index.add(f"thread-{worker}", i, text, {"text": text})
+
+    writers = [threading.Thread(target=write, args=(n, index)) for n, index in enumerate(indexes)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    for index in indexes:
+        index.wait_for_training()
+
+    reader = SemanticIndex(str(tmp_path))
+    entries, vectors = reader._load_entries(), reader._vectors()
+    assert len(entries) == len(vectors) == 160
+    for entry, vector in zip(entries, vectors):
+        assert np.allclose(vector, reader.embedder.embed(entry["text"]))
+    assert len(np.fromfile(reader.assignments_file, dtype=np.int32)) == 160
+
+
+def test_cleared_thread_is_not_recalled(tmp_path):
+    memory_dir = str(tmp_path)
+    onboarding = ThreadMemory("alice", "onboarding", memory_dir)
+    onboarding.append("Design a mobile onboarding flow", "Three welcome screens with progress dots")
+    billing = ThreadMemory("alice", "billing", memory_dir)
+    assert billing.recall("mobile onboarding")[0]["thread_id"] == "onboarding"
+
+    onboarding.clear()
+    assert billing.recall("mobile onboarding") == []
+
+    onboarding.append("Plan a mobile onboarding survey", "Ask two questions after signup")
+    recalled = billing.recall("mobile onboarding")
+    assert [r["input"] for r in recalled] == ["Plan a mobile onboarding survey"]
@@ -0,0 +1,106 @@
+import json
+import os
+import threading
+import uuid
+
+import pytest
+
+from fusion_core.memory.shared_snapshot import SHARED_MEMORY_AVAILABLE, SharedSnapshot
+
+pytestmark = pytest.mark.skipif(not SHARED_MEMORY_AVAILABLE, reason="shared memory unavailable")
+
+
+@pytest.fixture
+def segment_name():
+    name = f"fusion_test_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+    yield name
+    SharedSnapshot(name).segment.unlink()
+
+
+def make_sources(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"risk_threshold": 0.65}))
+    return {"config": str(path)}
+
+
+def test_workers_share_one_published_version(tmp_path, segment_name):
+    sources = make_sources(tmp_path)
+    first = SharedSnapshot(segment_name, sources)
+    assert first.load()
+    second = SharedSnapshot(segment_name, sources)
+    assert second.load(regenerate=False)
+
+    assert first.version == second.version == 1
+    assert second.get("config") == {"risk_threshold": 0.65}
+    assert second.load_json(sources["config"]) == {"risk_threshold": 0.65}
+    first.close()
+    second.close()
+
+
+def test_changed_source_republishes_for_every_worker(tmp_path, segment_name):
+    sources = make_sources(tmp_path)
+    first = SharedSnapshot(segment_name, sources)
+    second = SharedSnapshot(segment_name, sources)
+    assert first.load() and second.load()
+
+    with open(sources["config"], "w") as f:
+        json.dump({"risk_threshold": 0.9, "extra": True}, f)
+
+    assert first.get("config") == {"risk_threshold": 0.9, "extra": True}
+    assert first.version == 2
+    # The other worker picks up the new version without rebuilding it
+    assert second.get("config")["risk_threshold"] == 0.9
+    assert second.version == 2
+    assert second.get_status()["sections"] == ["config"]
+    first.close()
+    second.close()
+
+
+def test_write_heavy_source_does_not_republish_on_every_read(tmp_path, segment_name):
+    sources = make_sources(tmp_path)
+    sources["memory"] = str(tmp_path / "agent_memory.json")
+    snapshot = SharedSnapshot(segment_name, sources, republish_interval=60)
+    assert snapshot.load()
+
+    for run in range(20):
+        with open(sources["memory"], "w") as f:
+            json.dump({"runs": run}, f)
+        assert snapshot.load_json(sources["memory"]) == {"runs": run}
+
+    # Only the first change republished; later ones were read from the JSON
+    # file while the other sources kept being served from shared memory
+    assert snapshot.version == 2
+    assert snapshot.get("config") == {"risk_threshold": 0.65}
+    assert snapshot.is_fresh("config") and not snapshot.is_fresh("memory")
+    snapshot.close()
+
+
+def test_reads_survive_concurrent_republishes(tmp_path, segment_name):
+    sources = make_sources(tmp_path)
+    snapshot = SharedSnapshot(segment_name, sources, republish_interval=0)
+    assert snapshot.load()
+    errors, done = [], threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                assert "risk_threshold" in snapshot.get("config")
+            except Exception as e:  # a released buffer surfaces as ValueError/TypeError
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for run in range(30):
+        with open(sources["config"] + ".tmp", "w") as f:
+            json.dump({"risk_threshold": run}, f)
+        os.replace(sources["config"] + ".tmp", sources["config"])
+        snapshot.load()
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert snapshot.get("config") == {"risk_threshold": 29}
+    snapshot.close()
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from core.fusion_context import FusionContext
+from core.execution_orchestrator_v14 import ExecutionOrchestrator
+from core.pipeline_planner import PipelinePlanner
+from core.shared_state import SharedStateConflict, VersionedSharedState
+
+
+def test_snapshot_is_unaffected_by_later_commits():
+    state = VersionedSharedState({"tone": "calm"})
+    snapshot = state.snapshot()
+    state.set("tone", "bold")
+
+    assert snapshot["tone"] == "calm"
+    assert state["tone"] == "bold"
+    assert state.version == snapshot.version + 1
+
+
+def test_concurrent_writes_follow_merge_rules():
+    state = VersionedSharedState(merge_rules={"tags": "merge", "owner": "first_writer_wins",
+                                              "plan": "error"})
+    base = state.snapshot().version
+    state.commit({"tags": ["a"], "owner": "x", "plan": 1, "ts": 1}, base_version=base, writer="first")
+    state.commit({"tags": ["b"], "owner": "y", "ts": 2}, base_version=base, writer="second")
+
+    assert state.to_dict() == {"tags": ["a", "b"], "owner": "x", "plan": 1, "ts": 2}
+    with pytest.raises(SharedStateConflict):
+        state.commit({"plan": 2}, base_version=base, writer="third")
+
+    # A writer that read the latest version is not in conflict
+    state.commit({"plan": 3}, writer="fourth")
+    assert state["plan"] == 3
+
+
+class StateAgent:
+    def __init__(self, delay, writes):
+        self.delay = delay
+        self.writes = writes
+
+    async def run_async(self, prompt, tools):
+        await asyncio.sleep(self.delay)
+        return {"output": prompt, "confidence": 0.9, "shared_state": self.writes}
+
+
+def test_parallel_stage_commits_in_sequence_order():
+    context = FusionContext({"shared_state_merge_rules": {"findings": "merge"}})
+    orchestrator = ExecutionOrchestrator(context)
+    # The slow agent finishes last but comes first in the sequence
+    orchestrator.register_agent("slow", StateAgent(0.05, {"owner": "slow", "findings": ["s"]}))
+    orchestrator.register_agent("fast", StateAgent(0.0, {"owner": "fast", "findings": ["f"]}))
+    stats = {"slow": {"avg_latency": 0.1}, "fast": {"avg_latency": 0.1}}
+
+    asyncio.run(orchestrator.execute_pipeline(
+        "idea", ["slow", "fast"], deadline=10, planner=PipelinePlanner(stats, max_parallelism=2)))
+
+    assert context.get_shared_state("owner") == "fast"
+    assert context.get_shared_state("findings") == ["s", "f"]
@@ -0,0 +1,58 @@
+import json
+
+from fusion_core.memory.state_snapshot import StartupSnapshot, write_snapshot
+
+
+def make_sources(tmp_path):
+    sources = {}
+    for name, data in {"manifest": {"agents": {"vp_design": {"role": "design"}}},
+                       "config": {"risk_threshold": 0.65}}.items():
+        path = tmp_path / f"{name}.json"
+        path.write_text(json.dumps(data))
+        sources[name] = str(path)
+    return sources
+
+
+def test_snapshot_round_trip_and_copies(tmp_path):
+    sources = make_sources(tmp_path)
+    snapshot = StartupSnapshot(str(tmp_path / "state.bin"), sources)
+    assert snapshot.load()
+
+    manifest = snapshot.get("manifest")
+    assert manifest == {"agents": {"vp_design": {"role": "design"}}}
+    manifest["agents"].clear()
+    assert snapshot.get("manifest")["agents"]  # every get is a fresh copy
+    assert snapshot.load_json(sources["config"]) == {"risk_threshold": 0.65}
+
+
+def test_changed_source_falls_back_and_regenerates(tmp_path):
+    sources = make_sources(tmp_path)
+    path = str(tmp_path / "state.bin")
+    write_snapshot(path, sources)
+    with open(sources["config"], "w") as f:
+        json.dump({"risk_threshold": 0.9, "extra": True}, f)
+
+    snapshot = StartupSnapshot(path, sources)
+    assert not snapshot.load(regenerate=False)
+    assert snapshot.get("config")["risk_threshold"] == 0.9
+    assert snapshot.load()
+    assert snapshot.is_fresh("config")
+
+
+def test_corrupt_snapshot_is_rebuilt(tmp_path):
+    sources = make_sources(tmp_path)
+    path = str(tmp_path / "state.bin")
+    offset, length, _ = write_snapshot(path, sources)["sections"]["config"]
+    with open(path, "r+b") as f:
+        f.seek(offset + length - 2)
+        f.write(b"\xff")
+
+    snapshot = StartupSnapshot(path, sources)
+    assert snapshot.load()
+    # The damaged section fails its checksum and is served from the source instead
+    assert snapshot.get("config") == {"risk_threshold": 0.65}
+
+    with open(path, "r+b") as f:
+        f.write(b"NOTASNAP")
+    assert snapshot.load()
+    assert snapshot.get("manifest")["agents"]["vp_design"]["role"] == "design"
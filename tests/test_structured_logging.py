@@ -0,0 +1,56 @@
+import logging
+import queue
+
+from fusion_core.telemetry.structured_logging import DeferredQueueHandler, StructuredFormatter, log_kv
+
+
+class Expensive:
+    def __init__(self):
+        self.formatted = 0
+
+    def __repr__(self):
+        self.formatted += 1
+        return "<expensive>"
+
+
+def make_logger(level):
+    log_queue = queue.SimpleQueue()
+    logger = logging.getLogger(f"test_structured_logging.{level}")
+    logger.handlers = [DeferredQueueHandler(log_queue)]
+    logger.propagate = False
+    logger.setLevel(level)
+    return logger, log_queue
+
+
+def test_disabled_level_does_no_formatting():
+    logger, log_queue = make_logger(logging.INFO)
+    value = Expensive()
+
+    log_kv(logger, logging.DEBUG, "Set shared state", key="k", value=value)
+
+    assert log_queue.empty()
+    assert value.formatted == 0
+
+
+def test_records_are_formatted_by_the_writer_not_the_caller():
+    logger, log_queue = make_logger(logging.DEBUG)
+    value = Expensive()
+
+    log_kv(logger, logging.DEBUG, "Set shared state", key="k", value=value)
+    record = log_queue.get_nowait()
+
+    assert value.formatted == 0
+    assert StructuredFormatter("%(message)s").format(record) == "Set shared state key='k' value=<expensive>"
+
+
+def test_mutable_values_are_captured_when_logged():
+    logger, log_queue = make_logger(logging.DEBUG)
+    value = {"phase": "draft"}
+
+    log_kv(logger, logging.DEBUG, "Set shared state", key="k", value=value)
+    logger.debug("Shared state now %s", value)
+    value["phase"] = "final"
+    formatter = StructuredFormatter("%(message)s")
+
+    assert formatter.format(log_queue.get_nowait()) == "Set shared state key='k' value={'phase': 'draft'}"
+    assert formatter.format(log_queue.get_nowait()) == "Shared state now {'phase': 'draft'}"
@@ -0,0 +1,77 @@
+import json
+import sqlite3
+
+import pytest
+
+from fusion_core.memory.thread_memory import ThreadMemory
+
+
+def open_thread(tmp_path, thread_id):
+    return ThreadMemory("carol", thread_id, str(tmp_path), semantic_recall=False, compress_outputs=False)
+
+
+def test_threads_are_bucketed_and_cataloged_on_append(tmp_path):
+    design = open_thread(tmp_path, "design-review")
+    design.append("Review the design system", "Looks consistent", {"agent": "vp_design"})
+    strategy = open_thread(tmp_path, "roadmap")
+    strategy.append("Plan the strategy for Q3", "Focus on retention", {"agent": "strategy_pilot"})
+
+    assert design.thread_dir.parent.parent == tmp_path / "carol"
+    assert len(design.thread_dir.parent.name) == 2
+
+    threads = ThreadMemory.list_threads("carol", str(tmp_path))
+    assert [thread["thread_id"] for thread in threads] == ["roadmap", "design-review"]
+    assert threads[0]["interactions"] == 1
+    assert threads[0]["preferred_agents"] == ["strategy_pilot"]
+
+    by_topic = ThreadMemory.list_threads("carol", str(tmp_path), topic="design")
+    assert [thread["thread_id"] for thread in by_topic] == ["design-review"]
+    by_agent = ThreadMemory.list_threads("carol", str(tmp_path), agent="strategy_pilot")
+    assert [thread["thread_id"] for thread in by_agent] == ["roadmap"]
+    older = ThreadMemory.list_threads("carol", str(tmp_path), before=threads[0]["last_interaction"])
+    assert [thread["thread_id"] for thread in older] == ["design-review"]
+
+
+def test_flat_legacy_threads_are_backfilled(tmp_path):
+    legacy_dir = tmp_path / "carol" / "old-thread"
+    legacy_dir.mkdir(parents=True)
+    (legacy_dir / "history.json").write_text(json.dumps(
+        [{"timestamp": "2026-02-01T10:00:00", "input": "hi", "output": "hello", "metadata": {}}]))
+    (legacy_dir / "summary.json").write_text(json.dumps(
+        {"created_at": "2026-02-01T09:00:00", "total_interactions": 1}))
+
+    threads = ThreadMemory.list_threads("carol", str(tmp_path))
+    assert threads[0]["thread_id"] == "old-thread"
+    assert threads[0]["last_interaction"] == "2026-02-01T10:00:00"
+
+    reopened = open_thread(tmp_path, "old-thread")
+    assert not legacy_dir.exists()
+    assert reopened.history[0]["output"] == "hello"
+
+
+def test_threads_of_a_user_share_one_catalog_until_closed(tmp_path):
+    first = open_thread(tmp_path, "design-review")
+    with open_thread(tmp_path, "roadmap") as second:
+        assert second.catalog is first.catalog
+        second.append("Plan the strategy for Q3", "Focus on retention", {"agent": "strategy_pilot"})
+    catalog = first.catalog
+    assert [thread["thread_id"] for thread in ThreadMemory.list_threads("carol", str(tmp_path))] == ["roadmap"]
+
+    first.close()
+    first.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        catalog.count()
+    assert open_thread(tmp_path, "design-review").catalog is not catalog
+
+
+def test_closed_thread_reacquires_the_catalog_on_use(tmp_path):
+    thread = open_thread(tmp_path, "design-review")
+    thread.close()
+
+    thread.append("Review the design system", "Looks consistent", {"agent": "vp_design"})
+    assert [t["thread_id"] for t in ThreadMemory.list_threads("carol", str(tmp_path))] == ["design-review"]
+    thread.close()
+
+    thread.clear()
+    assert ThreadMemory.list_threads("carol", str(tmp_path))[0]["interactions"] == 0
+    thread.close()
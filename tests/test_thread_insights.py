@@ -0,0 +1,49 @@
+import json
+
+from fusion_core.memory.thread_memory import ThreadMemory
+
+
+def open_thread(tmp_path):
+    return ThreadMemory("dana", "t1", str(tmp_path), semantic_recall=False, compress_outputs=False)
+
+
+def fill(thread):
+    thread.append("Sketch a design for onboarding", "Here is a design " + "x" * 250,
+                  {"agent": "vp_design", "confidence": 0.9})
+    thread.append("Now the go-to-market strategy", "Strategy notes",
+                  {"agent": "strategy_pilot", "confidence": 0.6})
+    thread.append("Refine the design", "Refined", {"agent": "vp_design", "confidence": 0.7})
+
+
+def test_insights_come_from_persisted_aggregates(tmp_path):
+    thread = open_thread(tmp_path)
+    fill(thread)
+    insights = thread.get_insights()
+
+    assert insights["common_topics"] == ["design", "strategy"]
+    assert insights["agent_performance"]["vp_design"]["count"] == 2
+    assert abs(insights["agent_performance"]["vp_design"]["avg_confidence"] - 0.8) < 1e-9
+    assert insights["user_satisfaction"] == "Low"
+
+    reopened = open_thread(tmp_path)
+    reopened.history.hot.clear()  # insights must not rescan the history
+    assert reopened.get_insights() == insights
+
+
+def test_summaries_without_aggregates_are_rebuilt(tmp_path):
+    thread = open_thread(tmp_path)
+    fill(thread)
+    expected = thread.get_insights()
+
+    summary = json.loads(thread.summary_file.read_text())
+    del summary["aggregates"]
+    thread.summary_file.write_text(json.dumps(summary))
+
+    assert open_thread(tmp_path).get_insights() == expected
+
+
+def test_clear_resets_insights(tmp_path):
+    thread = open_thread(tmp_path)
+    fill(thread)
+    thread.clear()
+    assert thread.get_insights() == {}
@@ -0,0 +1,51 @@
+import json
+import os
+
+from fusion_core.memory.agent_memory import AgentMemory
+from fusion_core.memory.segments import SegmentStore, TieredHistory
+from fusion_core.memory.thread_memory import ThreadMemory
+
+
+def test_tiered_history_spills_whole_segments(tmp_path):
+    history = TieredHistory(SegmentStore(str(tmp_path)), hot_limit=3, segment_size=2)
+    for i in range(7):
+        history.append({"i": i})
+
+    assert history.cold_count == 4
+    assert [entry["i"] for entry in history.hot] == [4, 5, 6]
+    assert [entry["i"] for entry in history] == list(range(7))
+    assert history[1]["i"] == 1
+    assert [entry["i"] for entry in history[-2:]] == [5, 6]
+    assert history.recent(5)[0]["i"] == 2
+
+
+def test_agent_memory_keeps_only_hot_tail_in_json(tmp_path):
+    memory_dir = str(tmp_path)
+    memory = AgentMemory("writer", memory_dir, hot_limit=4, segment_size=4)
+    for i in range(10):
+        memory.append(f"request {i} " + "x" * i, f"response {i}", {"success": i % 2 == 0})
+
+    with open(os.path.join(memory_dir, "writer.history.jsonl")) as f:
+        assert len(f.readlines()) == 6
+
+    reopened = AgentMemory("writer", memory_dir, hot_limit=4, segment_size=4)
+    assert reopened.data["history"].hot[0]["input"].startswith("request 4")
+    assert len(reopened.data["history"]) == 10
+    assert [entry["output"] for entry in reopened.search("response 1")] == ["response 1"]
+    assert reopened.get_metadata()["success_rate"] == 0.5
+
+
+def test_thread_memory_migrates_legacy_history(tmp_path):
+    thread_dir = tmp_path / "alice" / "t1"
+    thread_dir.mkdir(parents=True)
+    legacy = [{"timestamp": f"2026-01-01T00:00:0{i}", "input": f"q{i}", "output": f"a{i}", "metadata": {}}
+              for i in range(6)]
+    (thread_dir / "history.json").write_text(json.dumps(legacy))
+
+    thread = ThreadMemory("alice", "t1", str(tmp_path), semantic_recall=False,
+                          hot_limit=2, segment_size=2)
+
+    assert len(json.loads(thread.history_file.read_text())) == 2
+    assert len(thread.history) == 6
+    assert thread.search("q1")[0]["output"] == "a1"
+    assert thread.get_summary()["last_interaction"] == "2026-01-01T00:00:05"
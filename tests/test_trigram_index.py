@@ -0,0 +1,53 @@
+import random
+
+from fusion_core.memory.agent_memory import AgentMemory
+from fusion_core.memory.thread_memory import ThreadMemory
+from fusion_core.memory.trigram_index import TrigramIndex
+
+WORDS = ["pricing", "onboarding", "Dashboard", "latency", "design", "checkout", "retention", "API"]
+
+
+def brute_force(entries, query):
+    query = query.lower()
+    return [entry for entry in entries
+            if query in entry["input"].lower() or query in entry["output"].lower()]
+
+
+def test_candidates_are_a_superset_of_matches():
+    index = TrigramIndex()
+    texts = ["Checkout latency", "onboarding flow", "latent checkout bug"]
+    for position, text in enumerate(texts):
+        index.add(position, [text])
+
+    assert index.candidates("LATENCY") == [0]
+    assert index.candidates("checkout") == [0, 2]
+    assert index.candidates("zebra") == []
+    assert index.candidates("ch") is None
+
+
+def test_agent_memory_search_matches_linear_scan(tmp_path):
+    rng = random.Random(7)
+    memory = AgentMemory("analyst", str(tmp_path), hot_limit=5, segment_size=5, compress_outputs=False)
+    entries = []
+    for i in range(40):
+        prompt = " ".join(rng.sample(WORDS, 3)) + f" #{i}"
+        output = " ".join(rng.sample(WORDS, 4))
+        memory.append(prompt, output)
+        entries.append({"input": prompt, "output": output})
+        if i == 20:
+            memory.search("warm up the index")  # later appends must update it
+
+    for query in ["pricing", "board", "API", "#3", "ncy ch", "missing", "a"]:
+        found = [(entry["input"], entry["output"]) for entry in memory.search(query)]
+        expected = [(entry["input"], entry["output"]) for entry in brute_force(entries, query)]
+        assert found == expected, query
+
+
+def test_thread_memory_search_uses_index(tmp_path):
+    thread = ThreadMemory("bob", "t1", str(tmp_path), semantic_recall=False, compress_outputs=False)
+    thread.append("Explain the pricing page", "Three tiers")
+    thread.search("tiers")
+    thread.append("Tune checkout latency", "Cache the cart")
+
+    assert [hit["input"] for hit in thread.search("CHECKOUT")] == ["Tune checkout latency"]
+    assert len(thread.search("e")) == 2
@@ -157,7 +157,8 @@ def run_single_agent(agent_name, user_input, use_memory, use_telemetry):
                 "agent": agent_name,
                 "input": user_input,
                 "use_memory": use_memory,
-                "use_telemetry": use_telemetry
+                "use_telemetry": use_telemetry,
+                "render_markdown": True
             })
             
             if response.status_code == 200:
@@ -170,7 +171,7 @@ def run_single_agent(agent_name, user_input, use_memory, use_telemetry):
                 
                 with col1:
                     st.subheader("Output")
-                    st.text_area("Agent Response", result["output"], height=300, disabled=True)
+                    st.text_area("Agent Response", result.get("markdown", result["output"]), height=300, disabled=True)
                 
                 with col2:
                     st.subheader("Execution Info")
@@ -243,7 +244,8 @@ def run_parallel_agents(agents, user_input, use_evaluator):
             response = requests.post(f"{API_BASE_URL}/run_parallel", json={
                 "agents": agents,
                 "input": user_input,
-                "use_evaluator": use_evaluator
+                "use_evaluator": use_evaluator,
+                "render_markdown": True
             })
             
             if response.status_code == 200:
@@ -258,7 +260,7 @@ def run_parallel_agents(agents, user_input, use_evaluator):
                     
                     col1, col2 = st.columns([3, 1])
                     with col1:
-                        st.text_area("Top Agent Output", top["output"], height=200, disabled=True)
+                        st.text_area("Top Agent Output", top.get("markdown", top["output"]), height=200, disabled=True)
                     with col2:
                         st.write(f"**Agent:** {top['agent']}")
                         st.write(f"**Execution Time:** {top['execution_time']:.2f}s")
@@ -388,8 +390,13 @@ def show_memory():
             selected_agent = st.selectbox("Select Agent", available_agents)
             memory_limit = st.slider("Memory Entries", 1, 20, 10)
             
+            # Pages are fetched by cursor; only the requested slice is read server-side
             if st.button("🔍 Load Memory"):
-                load_agent_memory(selected_agent, memory_limit)
+                st.session_state.memory_page = (selected_agent, None)
+            
+            page = st.session_state.get("memory_page")
+            if page and page[0] == selected_agent:
+                load_agent_memory(selected_agent, memory_limit, page[1])
         
         else:
             st.error("Failed to get agents")
@@ -397,10 +404,13 @@ def show_memory():
     except requests.exceptions.ConnectionError:
         st.error("❌ Cannot connect to Fusion API")
 
-def load_agent_memory(agent_name, limit):
-    """Load and display agent memory"""
+def load_agent_memory(agent_name, limit, cursor=None):
+    """Load and display one page of agent memory"""
     try:
-        response = requests.get(f"{API_BASE_URL}/memory/{agent_name}?limit={limit}")
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = requests.get(f"{API_BASE_URL}/memory/{agent_name}", params=params)
         if response.status_code == 200:
             memory_data = response.json()
             
@@ -428,6 +438,11 @@ def load_agent_memory(agent_name, limit):
                         if entry.get("metadata"):
                             st.write("**Metadata:**")
                             st.json(entry["metadata"])
+                
+                if memory_data.get("next_cursor"):
+                    if st.button("⬅️ Older Entries"):
+                        st.session_state.memory_page = (agent_name, memory_data["next_cursor"])
+                        st.rerun()
             else:
                 st.info("No memory entries found for this agent")
         